@@ -0,0 +1 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
@@ -0,0 +1,36 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Runs benchmark suite against fake SD-WAN Manager
+
+usage: python -m benchmarks [--sizes 100 1000] [--iterations 3] [--only login dataseq] [--output out.json]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks.fake_manager import FakeManagerConfig
+from benchmarks.suite import BENCHMARKS, DEFAULT_FLEET_SIZES, format_result, format_results, run_suite
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_FLEET_SIZES), help="fleet sizes")
+    parser.add_argument("--iterations", type=int, default=3, help="measured executions of each benchmark")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run (default: all)")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency added to each response [s]")
+    parser.add_argument("--padding", type=int, default=0, help="bytes of padding added to each record")
+    parser.add_argument("--output", type=Path, help="write results to given JSON file")
+    args = parser.parse_args()
+
+    config = FakeManagerConfig(latency_seconds=args.latency, payload_padding_bytes=args.padding)
+    print(format_results([]))
+    results = run_suite(
+        args.sizes, args.iterations, args.only, config, on_result=lambda result: print(format_result(result))
+    )
+    if args.output:
+        args.output.write_text(json.dumps([result.model_dump() for result in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
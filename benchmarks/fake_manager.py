@@ -0,0 +1,488 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Offline stand-in for SD-WAN Manager (vManage) used by benchmarks and tests.
+
+Server implements only the subset of API needed to exercise client under HTTP load:
+login (/j_security_check, /dataservice/client/token, /logout), server info, devices, templates,
+policy lists, tenants and task status. Latency, payload size, error injection and session expiration
+are configurable, so client behaviour can be measured without access to real SD-WAN Manager.
+
+>>> with FakeManagerServer(FakeManagerConfig(devices=1000, latency_seconds=0.005)) as server:
+>>>     session = create_manager_session(server.url, "admin", "admin", port=server.port)
+>>>     devices = DevicesAPI(session).get()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from uuid import NAMESPACE_URL, uuid4, uuid5
+
+from pydantic import BaseModel, Field
+
+EXPIRED_COOKIE = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/"
+LOGIN_PAGE = "<html><head><title>Cisco vManage</title></head><body>login</body></html>"
+LAST_UPDATED = 1700000000000
+
+Reply = Tuple[int, Dict[str, str], bytes]
+
+
+class FakeManagerConfig(BaseModel):
+    """Behaviour of fake SD-WAN Manager
+
+    Attributes:
+        username: accepted username
+        password: accepted password
+        devices: number of devices in inventory
+        templates: number of device and feature templates
+        policy_lists: number of application policy lists
+        latency_seconds: delay added to every response
+        payload_padding_bytes: size of additional text field added to every device and template record
+        error_rate: fraction of dataservice requests (after login) answered with error_status_code
+        error_status_code: status code of injected errors
+        session_lifetime_requests: number of requests after which session expires (never when None)
+        task_pending_polls: number of task status requests answered with "In progress" before task succeeds
+        platform_version: reported server version
+        etags: GET responses carry ETag header and conditional requests matching it are answered with 304
+        tenants: number of tenants, when non-zero server runs in multi-tenant mode and user is provider
+            (devices are assigned to tenants in round-robin and visible in tenant view selected with VSessionId)
+        seed: seed of random generator used for error injection
+    """
+
+    username: str = "admin"
+    password: str = "admin"
+    devices: int = Field(default=100, ge=0)
+    templates: int = Field(default=10, ge=0)
+    policy_lists: int = Field(default=10, ge=0)
+    latency_seconds: float = Field(default=0.0, ge=0)
+    payload_padding_bytes: int = Field(default=0, ge=0)
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    error_status_code: int = 500
+    session_lifetime_requests: Optional[int] = Field(default=None, ge=1)
+    task_pending_polls: int = Field(default=0, ge=0)
+    platform_version: str = "20.12.1"
+    etags: bool = False
+    tenants: int = Field(default=0, ge=0)
+    seed: int = 0
+
+
+class FakeManager:
+    """Request handling logic of fake SD-WAN Manager (independent of HTTP server)
+
+    Attributes:
+        config: behaviour of server
+        request_counts: number of handled requests per path
+        logins: number of successful logins
+    """
+
+    def __init__(self, config: Optional[FakeManagerConfig] = None):
+        self.config = config or FakeManagerConfig()
+        self.request_counts: Counter = Counter()
+        self.logins = 0
+        self._lock = Lock()
+        self._random = random.Random(self.config.seed)
+        self._sessions: Dict[str, str] = {}  # JSESSIONID -> XSRF token
+        self._session_requests = 0
+        self._tasks: Dict[str, int] = {}  # task id -> number of remaining "In progress" polls
+        self._task_devices: Dict[str, List[Dict[str, Any]]] = {}  # task id -> devices of sub-tasks
+        self._vsessions: Dict[str, Tuple[str, int]] = {}  # VSessionId -> (JSESSIONID, tenant index)
+        padding = "x" * self.config.payload_padding_bytes
+        self.devices = [self._device(i, padding) for i in range(self.config.devices)]
+        self._devices_by_id = {device["deviceId"]: device for device in self.devices}
+        self.device_templates = [self._device_template(i, padding) for i in range(self.config.templates)]
+        self.feature_templates = [self._feature_template(i, padding) for i in range(self.config.templates)]
+        self.policy_lists = [self._policy_list(i) for i in range(self.config.policy_lists)]
+        self.tenants = [self._tenant(i) for i in range(self.config.tenants)]
+
+    @staticmethod
+    def _device(index: int, padding: str) -> Dict[str, Any]:
+        ip = f"10.{(index >> 16) & 0xFF}.{(index >> 8) & 0xFF}.{index & 0xFF}"
+        return {
+            "uuid": str(uuid5(NAMESPACE_URL, f"device-{index}")),
+            "deviceId": ip,
+            "system-ip": ip,
+            "local-system-ip": ip,
+            "host-name": f"edge-{index}",
+            "personality": "vedge",
+            "device-type": "vedge",
+            "device-model": "vedge-C8000V",
+            "reachability": "reachable",
+            "status": "normal",
+            "site-id": str(index % 1000 + 1),
+            "board-serial": f"{index:012d}",
+            "connectedVManages": ["172.16.0.1"],
+            "cpuLoad": 1.5,
+            "memUsage": 35.0,
+            "description": padding,
+        }
+
+    @staticmethod
+    def _template_info(index: int, kind: str, padding: str) -> Dict[str, Any]:
+        return {
+            "templateId": str(uuid5(NAMESPACE_URL, f"{kind}-template-{index}")),
+            "templateName": f"{kind}-template-{index}",
+            "templateDescription": padding or f"{kind} template {index}",
+            "lastUpdatedBy": "admin",
+            "lastUpdatedOn": LAST_UPDATED,
+            "factoryDefault": False,
+            "devicesAttached": 0,
+            "resourceGroup": "global",
+        }
+
+    def _device_template(self, index: int, padding: str) -> Dict[str, Any]:
+        template = self._template_info(index, "device", padding)
+        template.update(
+            {
+                "deviceType": "vedge-C8000V",
+                "templateClass": "cedge",
+                "configType": "template",
+                "templateAttached": 0,
+                "draftMode": "Disabled",
+                "deviceRole": "sdwan-edge",
+            }
+        )
+        return template
+
+    def _feature_template(self, index: int, padding: str) -> Dict[str, Any]:
+        template = self._template_info(index, "feature", padding)
+        template.update(
+            {"templateType": "cisco_system", "deviceType": ["vedge-C8000V"], "templateMinVersion": "15.0.0"}
+        )
+        return template
+
+    @staticmethod
+    def _policy_list(index: int) -> Dict[str, Any]:
+        return {
+            "listId": str(uuid5(NAMESPACE_URL, f"app-list-{index}")),
+            "name": f"app-list-{index}",
+            "description": "Desc Not Required",
+            "type": "app",
+            "entries": [{"app": "webex"}, {"app": "office365"}],
+            "lastUpdated": LAST_UPDATED,
+            "owner": "admin",
+            "readOnly": False,
+            "version": "0",
+            "referenceCount": 0,
+            "references": [],
+            "infoTag": "",
+        }
+
+    @staticmethod
+    def _tenant(index: int) -> Dict[str, Any]:
+        return {
+            "tenantId": str(uuid5(NAMESPACE_URL, f"tenant-{index}")),
+            "name": f"tenant-{index}",
+            "desc": f"Tenant {index}",
+            "orgName": "fake-org",
+            "subDomain": f"tenant{index}.fake-manager.local",
+            "state": "READY",
+        }
+
+    def create_task(self, pending_polls: Optional[int] = None, devices: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Creates task which succeeds after given number of "In progress" status requests
+
+        Args:
+            pending_polls: number of "In progress" status requests (config.task_pending_polls by default)
+            devices: devices from attach payload, one sub-task is reported for each of them (single by default)
+        """
+        task_id = str(uuid4())
+        with self._lock:
+            self._tasks[task_id] = self.config.task_pending_polls if pending_polls is None else pending_polls
+            if devices:
+                self._task_devices[task_id] = devices
+        return task_id
+
+    def expire_sessions(self) -> None:
+        """Invalidates all logged in sessions, next request of each client is answered as with expired JSESSIONID"""
+        with self._lock:
+            self._sessions.clear()
+            self._vsessions.clear()
+            self._session_requests = 0
+
+    def handle(self, method: str, url: str, headers: Dict[str, str], body: bytes) -> Reply:
+        """Handles single request
+
+        Args:
+            method: HTTP method
+            url: requested path with query
+            headers: request headers (with lowercase names)
+            body: request body
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: status code, response headers and response body
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+        with self._lock:
+            self.request_counts[path] += 1
+        if self.config.latency_seconds:
+            sleep(self.config.latency_seconds)
+
+        if path == "/":
+            return self._text(HTTPStatus.OK, "")
+        if path == "/j_security_check" and method == "POST":
+            return self._login(parse_qs(body.decode()))
+        if path == "/logout":
+            return self._logout(self._jsessionid(headers.get("cookie", "")))
+        if path == "/dataservice/client/server/ready":
+            return self._json({"isServerReady": True})
+        if not path.startswith("/dataservice/"):
+            return self._error(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+
+        jsessionid = self._jsessionid(headers.get("cookie", ""))
+        with self._lock:
+            token = self._sessions.get(jsessionid)
+            if token is not None and path != "/dataservice/client/token":
+                self._session_requests += 1
+                if (lifetime := self.config.session_lifetime_requests) and self._session_requests > lifetime:
+                    self._sessions.clear()
+                    self._vsessions.clear()
+                    token = None
+            inject_error = token is not None and self._random.random() < self.config.error_rate
+            vsession = self._vsessions.get(headers.get("vsessionid", ""))
+        if token is None:
+            return self._expired()
+        if path == "/dataservice/client/token":
+            return self._text(HTTPStatus.OK, token)
+        if headers.get("x-xsrf-token") != token:
+            return self._error(HTTPStatus.FORBIDDEN, "Invalid XSRF token")
+        tenant: Optional[int] = None
+        if "vsessionid" in headers:
+            if vsession is None or vsession[0] != jsessionid:
+                return self._error(HTTPStatus.FORBIDDEN, "Invalid VSessionId")
+            tenant = vsession[1]
+        if inject_error:
+            return self._error(self.config.error_status_code, "Injected error")
+        reply = self._route(method, path, query, body, tenant, jsessionid)
+        if self.config.etags and method == "GET":
+            return self._conditional(reply, headers.get("if-none-match"))
+        return reply
+
+    @staticmethod
+    def _conditional(reply: Reply, if_none_match: Optional[str]) -> Reply:
+        status, headers, body = reply
+        if status != HTTPStatus.OK:
+            return reply
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if if_none_match == etag:
+            return HTTPStatus.NOT_MODIFIED, {"ETag": etag}, b""
+        headers["ETag"] = etag
+        return status, headers, body
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        body: bytes,
+        tenant: Optional[int],
+        jsessionid: str,
+    ) -> Reply:
+        if path == "/dataservice/client/server":
+            return self._json({"data": self._server_info(tenant)})
+        if path == "/dataservice/client/about":
+            return self._json({"data": {"title": "Cisco vManage", "version": self.config.platform_version}})
+        if path == "/dataservice/device":
+            if tenant is not None:
+                return self._json({"data": self.devices[tenant :: self.config.tenants]})
+            return self._json({"data": self.devices})
+        if path == "/dataservice/tenant" and self.tenants:
+            return self._json({"data": self.tenants})
+        if path.startswith("/dataservice/tenant/") and path.endswith("/vsessionid") and method == "POST":
+            return self._vsession_id(path.split("/")[3], jsessionid)
+        if path == "/dataservice/device/system/info":
+            ids = query.get("deviceId", [])
+            return self._json({"data": [self._devices_by_id[id] for id in ids if id in self._devices_by_id]})
+        if path == "/dataservice/template/device":
+            return self._json({"data": self.device_templates})
+        if path == "/dataservice/template/feature":
+            return self._json({"data": self.feature_templates})
+        if path == "/dataservice/template/policy/list/app":
+            return self._json({"data": self.policy_lists})
+        if path == "/dataservice/template/device/config/exportcsv" and method == "POST":
+            columns = ["csv-status", "csv-deviceId", "csv-deviceIP", "csv-host-name", "csv-templateId"]
+            return self._json({"header": {"columns": [{"property": column} for column in columns]}, "data": []})
+        if path.startswith("/dataservice/template/device/config/attach") and method == "POST":
+            devices = [device for template in json.loads(body)["deviceTemplateList"] for device in template["device"]]
+            return self._json({"id": self.create_task(devices=devices)})
+        if path.startswith("/dataservice/device/action/status/"):
+            return self._task_status(path.rsplit("/", 1)[-1])
+        return self._error(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+
+    def _login(self, form: Dict[str, List[str]]) -> Reply:
+        if form.get("j_username") != [self.config.username] or form.get("j_password") != [self.config.password]:
+            return self._text(HTTPStatus.OK, LOGIN_PAGE, "text/html")
+        jsessionid, token = uuid4().hex, uuid4().hex
+        with self._lock:
+            self._sessions[jsessionid] = token
+            self._session_requests = 0
+            self.logins += 1
+        status, headers, body = self._text(HTTPStatus.OK, "")
+        headers["Set-Cookie"] = f"JSESSIONID={jsessionid}; Path=/; HttpOnly"
+        return status, headers, body
+
+    def _vsession_id(self, tenant_id: str, jsessionid: str) -> Reply:
+        for index, tenant in enumerate(self.tenants):
+            if tenant["tenantId"] == tenant_id:
+                vsession_id = uuid4().hex
+                with self._lock:
+                    self._vsessions[vsession_id] = (jsessionid, index)
+                return self._json({"VSessionId": vsession_id})
+        return self._error(HTTPStatus.NOT_FOUND, f"Unknown tenant: {tenant_id}")
+
+    def _logout(self, jsessionid: str) -> Reply:
+        with self._lock:
+            self._sessions.pop(jsessionid, None)
+            self._vsessions = {key: value for key, value in self._vsessions.items() if value[0] != jsessionid}
+        return self._text(HTTPStatus.OK, "")
+
+    def _task_status(self, task_id: str) -> Reply:
+        with self._lock:
+            pending = self._tasks.get(task_id)
+            if pending:
+                self._tasks[task_id] = pending - 1
+        if pending is None:
+            return self._error(HTTPStatus.NOT_FOUND, f"Unknown task: {task_id}")
+        status, status_id = ("In progress", "in_progress") if pending else ("Success", "success")
+        devices = self._task_devices.get(task_id) or [
+            {"csv-deviceId": str(uuid5(NAMESPACE_URL, task_id)), "csv-host-name": "edge-0"}
+        ]
+        sub_tasks = [
+            {
+                "status": status,
+                "statusId": status_id,
+                "action": "push_feature_template_configuration",
+                "activity": [f"[{status}] Fake Manager"],
+                "currentActivity": status,
+                "actionConfig": None,
+                "order": order,
+                "uuid": device.get("csv-deviceId"),
+                "host-name": device.get("csv-host-name"),
+                "site-id": "1",
+            }
+            for order, device in enumerate(devices)
+        ]
+        return self._json({"data": sub_tasks, "validation": None, "summary": None})
+
+    def _server_info(self, tenant: Optional[int]) -> Dict[str, Any]:
+        multi_tenant = bool(self.tenants)
+        return {
+            "server": "fake-manager",
+            "tenancyMode": "MultiTenant" if multi_tenant else "SingleTenant",
+            "userMode": "provider" if multi_tenant else "tenant",
+            "viewMode": "provider" if multi_tenant and tenant is None else "tenant",
+            "platformVersion": self.config.platform_version,
+            "user": self.config.username,
+            "roles": ["netadmin"],
+        }
+
+    @staticmethod
+    def _jsessionid(cookie_header: str) -> str:
+        for cookie in cookie_header.split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "JSESSIONID":
+                return value
+        return ""
+
+    @staticmethod
+    def _text(status: int, text: str, content_type: str = "text/plain") -> Reply:
+        return status, {"Content-Type": content_type}, text.encode()
+
+    @staticmethod
+    def _json(data: Any, status: int = HTTPStatus.OK) -> Reply:
+        return status, {"Content-Type": "application/json"}, json.dumps(data).encode()
+
+    def _error(self, status: int, message: str) -> Reply:
+        return self._json({"error": {"message": message, "details": message, "code": "FAKE0001"}}, status)
+
+    def _expired(self) -> Reply:
+        status, headers, body = self._text(HTTPStatus.OK, LOGIN_PAGE, "text/html")
+        headers["Set-Cookie"] = EXPIRED_COOKIE
+        return status, headers, body
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive connections, like real server
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        status, response_headers, response_body = self.server.manager.handle(self.command, self.path, headers, body)
+        self.send_response(status)
+        for name, value in response_headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response_body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response_body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], manager: FakeManager):
+        self.manager = manager
+        super().__init__(address, _RequestHandler)
+
+
+class FakeManagerServer:
+    """Runs fake SD-WAN Manager HTTP server in background thread
+
+    Args:
+        config: behaviour of server
+        host: address to listen on
+        port: port to listen on (random free port when 0)
+    """
+
+    def __init__(self, config: Optional[FakeManagerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.manager = FakeManager(config)
+        self._server = _HTTPServer((host, port), self.manager)
+        self._thread: Optional[Thread] = None
+
+    @property
+    def host(self) -> str:
+        return str(self._server.server_address[0])
+
+    @property
+    def port(self) -> int:
+        return int(self._server.server_address[1])
+
+    @property
+    def url(self) -> str:
+        """Server url to be passed to session (together with port)"""
+        return f"http://{self.host}"
+
+    def start(self) -> FakeManagerServer:
+        self._thread = Thread(target=self._server.serve_forever, name="fake-manager", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> FakeManagerServer:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
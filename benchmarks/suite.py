@@ -0,0 +1,196 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""End-to-end benchmarks of client performed against fake SD-WAN Manager served from localhost.
+
+Each benchmark is run for every fleet size (number of devices in fake inventory) and reported
+as min/median/mean time of given number of iterations.
+
+>>> results = run_suite(fleet_sizes=[100, 1000], iterations=3)
+>>> print(format_results(results))
+"""
+
+from __future__ import annotations
+
+import json
+from statistics import mean, median
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, computed_field
+from requests import Response
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.api.task_status_api import TaskMonitor
+from catalystwan.api.template_api import TemplatesAPI
+from catalystwan.dataclasses import Device
+from catalystwan.response import ManagerResponse
+from catalystwan.session import ManagerSession, create_manager_session
+
+DEFAULT_FLEET_SIZES = (100, 1000, 5000, 20000)
+ATTACH_DEVICES = 20  # number of devices to which template is attached in single iteration
+DEVICES_PER_TASK = 100  # number of polled tasks is proportional to fleet size
+
+
+class BenchmarkResult(BaseModel):
+    """Timings of single benchmark for given fleet size (in seconds)"""
+
+    name: str
+    fleet_size: int
+    timings: List[float]
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def median(self) -> float:
+        return median(self.timings)
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def mean(self) -> float:
+        return mean(self.timings)
+
+
+class BenchmarkContext:
+    """Fake server and logged in session shared by benchmarks for single fleet size"""
+
+    def __init__(self, server: FakeManagerServer, session: ManagerSession):
+        self.server = server
+        self.session = session
+
+    @property
+    def fleet_size(self) -> int:
+        return self.server.manager.config.devices
+
+
+def login(server: FakeManagerServer) -> ManagerSession:
+    config = server.manager.config
+    return create_manager_session(server.url, config.username, config.password, port=server.port)
+
+
+def bench_login(context: BenchmarkContext) -> Callable[[], object]:
+    return lambda: login(context.server)
+
+
+def bench_devices_get(context: BenchmarkContext) -> Callable[[], object]:
+    api = DevicesAPI(context.session)
+    return api.get
+
+
+def bench_dataseq(context: BenchmarkContext) -> Callable[[], object]:
+    raw = Response()
+    raw.status_code = 200
+    raw.headers["Content-Type"] = "application/json"
+    raw.encoding = "utf-8"
+    raw._content = json.dumps({"data": context.server.manager.devices}).encode()
+
+    def parse() -> object:
+        # new response object for every iteration, so JSON decoding is measured too
+        return ManagerResponse(raw).dataseq(Device)
+
+    return parse
+
+
+def bench_template_attach(context: BenchmarkContext) -> Callable[[], object]:
+    api = TemplatesAPI(context.session)
+    devices = DevicesAPI(context.session).get()[:ATTACH_DEVICES]
+    template = context.server.manager.device_templates[0]["templateName"]
+
+    def attach() -> object:
+        return [api.attach(template, device) for device in devices]
+
+    return attach
+
+
+def bench_template_attach_many(context: BenchmarkContext) -> Callable[[], object]:
+    api = TemplatesAPI(context.session)
+    devices = DevicesAPI(context.session).get()[:ATTACH_DEVICES]
+    template = context.server.manager.device_templates[0]["templateName"]
+
+    def attach() -> object:
+        return api.attach_many(template, [(device, {}) for device in devices])
+
+    return attach
+
+
+def bench_task_polling(context: BenchmarkContext) -> Callable[[], object]:
+    manager = context.server.manager
+    tasks = max(1, context.fleet_size // DEVICES_PER_TASK)
+
+    def poll() -> object:
+        monitor = TaskMonitor(context.session, initial_interval_seconds=0.01, max_interval_seconds=0.05)
+        for _ in range(tasks):
+            monitor.add(manager.create_task(pending_polls=2))
+        return monitor.wait()
+
+    return poll
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], Callable[[], object]]] = {
+    "login": bench_login,
+    "devices_get": bench_devices_get,
+    "dataseq": bench_dataseq,
+    "template_attach": bench_template_attach,
+    "template_attach_many": bench_template_attach_many,
+    "task_polling": bench_task_polling,
+}
+
+
+def measure(function: Callable[[], object], iterations: int) -> List[float]:
+    """Returns execution times of given function in seconds"""
+    timings = []
+    for _ in range(iterations):
+        begin = perf_counter()
+        function()
+        timings.append(perf_counter() - begin)
+    return timings
+
+
+def run_suite(
+    fleet_sizes: Sequence[int] = DEFAULT_FLEET_SIZES,
+    iterations: int = 3,
+    benchmarks: Optional[Sequence[str]] = None,
+    config: Optional[FakeManagerConfig] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """Runs benchmarks against fake SD-WAN Manager for each fleet size
+
+    Args:
+        fleet_sizes: numbers of devices in fake inventory
+        iterations: number of measured executions of each benchmark
+        benchmarks: names of benchmarks to run (all when None)
+        config: base configuration of fake server (number of devices is overridden by fleet size)
+        on_result: called with each result as soon as it is available
+
+    Returns:
+        List[BenchmarkResult]: timings of each benchmark for each fleet size
+    """
+    names = list(benchmarks or BENCHMARKS)
+    if unknown := set(names) - set(BENCHMARKS):
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}, available: {list(BENCHMARKS)}")
+    base_config = config or FakeManagerConfig()
+    results = []
+    for fleet_size in fleet_sizes:
+        with FakeManagerServer(base_config.model_copy(update={"devices": fleet_size})) as server:
+            context = BenchmarkContext(server, login(server))
+            for name in names:
+                function = BENCHMARKS[name](context)
+                result = BenchmarkResult(name=name, fleet_size=fleet_size, timings=measure(function, iterations))
+                if on_result is not None:
+                    on_result(result)
+                results.append(result)
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return f"{result.name:<16} {result.fleet_size:>8} {result.min:>10.4f} {result.median:>10.4f} {result.mean:>10.4f}"
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Formats results as text table"""
+    header = f"{'benchmark':<16} {'devices':>8} {'min [s]':>10} {'median [s]':>10} {'mean [s]':>10}"
+    return "\n".join([header] + [format_result(result) for result in results])
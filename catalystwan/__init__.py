@@ -6,10 +6,10 @@ import multiprocessing
 from functools import lru_cache, wraps
 from importlib import metadata
 from importlib.machinery import PathFinder
-from os import environ
+from os import environ, path, sep
 from pathlib import Path
 from traceback import FrameSummary, StackSummary, extract_stack
-from typing import Callable, Final, List, Optional
+from typing import Any, Callable, Final, List, Optional
 
 import urllib3
 
@@ -49,13 +49,22 @@ def get_first_external_stack_frame(stack: StackSummary) -> Optional[FrameSummary
     return stack[index - 1]
 
 
+@lru_cache()
+def package_directory() -> str:
+    """
+    Returns path to directory containing current package
+    (with trailing separator, to be used as prefix of package source paths)
+    """
+    return path.dirname(path.abspath(__file__)) + sep
+
+
 @lru_cache()
 def is_file_in_package(fname: str) -> bool:
     """
     Checks if filepath given by string
     is part of catalystwan source code
     """
-    return Path(fname) in pkg_src_list
+    return fname.endswith(".py") and path.abspath(fname).startswith(package_directory())
 
 
 def list_package_sources() -> List[Path]:
@@ -70,9 +79,17 @@ def list_package_sources() -> List[Path]:
     return pkg_srcs
 
 
+def __getattr__(name: str) -> Any:
+    # pkg_src_list is kept for backward compatibility only, it is created on first access
+    # as globbing package sources is too slow to be done on import
+    if name == "pkg_src_list":
+        globals()[name] = list_package_sources()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 LOGGING_CONF_DIR: Final[str] = str(Path(__file__).parents[0] / "logging.conf")
 __version__ = metadata.version(__package__)
-pkg_src_list = list_package_sources()
 
 
 if environ.get("catalystwan_devel") is not None:
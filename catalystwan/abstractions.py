@@ -1,6 +1,6 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
-from typing import Optional, Protocol, Type, TypeVar
+from typing import Awaitable, Optional, Protocol, Type, TypeVar
 
 from packaging.version import Version  # type: ignore
 
@@ -52,3 +52,21 @@ class APIEndpointClient(Protocol):
     @property
     def session_type(self) -> Optional[SessionType]:
         ...
+
+
+class AsyncAPIEndpointClient(Protocol):
+    """
+    Interface to asynchronous client object.
+    Same as APIEndpointClient but 'request' function returns awaitable response.
+    """
+
+    def request(self, method: str, url: str, **kwargs) -> Awaitable[APIEndpointClientResponse]:
+        ...
+
+    @property
+    def api_version(self) -> Optional[Version]:
+        ...
+
+    @property
+    def session_type(self) -> Optional[SessionType]:
+        ...
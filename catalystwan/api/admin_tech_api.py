@@ -15,6 +15,7 @@ from requests.exceptions import HTTPError
 
 from catalystwan.dataclasses import AdminTech, DeviceAdminTech
 from catalystwan.exceptions import CatalystwanException
+from catalystwan.tracing import traced
 from catalystwan.utils.creation_tools import create_dataclass
 
 if TYPE_CHECKING:
@@ -77,6 +78,11 @@ class AdminTechAPI:
         items = response.json()["data"]
         return [create_dataclass(AdminTech, item) for item in items]
 
+    @traced(
+        "AdminTechAPI.generate",
+        lambda self, device_id, *args, **kwargs: {"device.id": device_id},
+        lambda filename: {"filename": filename},
+    )
     def generate(
         self,
         device_id: str,
@@ -4,65 +4,108 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from catalystwan.api.admin_tech_api import AdminTechAPI
-from catalystwan.api.administration import (
-    AdministrationSettingsAPI,
-    ClusterManagementAPI,
-    ResourceGroupsAPI,
-    SessionsAPI,
-    UserGroupsAPI,
-    UsersAPI,
-)
-from catalystwan.api.alarms_api import AlarmsAPI
-from catalystwan.api.basic_api import DevicesAPI, DeviceStateAPI
-from catalystwan.api.config_device_inventory_api import ConfigurationDeviceInventoryAPI
-from catalystwan.api.config_group_api import ConfigGroupAPI
-from catalystwan.api.dashboard_api import DashboardAPI
-from catalystwan.api.feature_profile_api import SDRoutingFeatureProfilesAPI
-from catalystwan.api.logs_api import LogsAPI
-from catalystwan.api.omp_api import OmpAPI
-from catalystwan.api.packet_capture_api import PacketCaptureAPI
-from catalystwan.api.partition_manager_api import PartitionManagerAPI
-from catalystwan.api.policy_api import PolicyAPI
-from catalystwan.api.resource_pool_api import ResourcePoolAPI
-from catalystwan.api.software_action_api import SoftwareActionAPI
-from catalystwan.api.speedtest_api import SpeedtestAPI
-from catalystwan.api.template_api import TemplatesAPI
-from catalystwan.api.tenant_backup_restore_api import TenantBackupRestoreAPI
-from catalystwan.api.tenant_management_api import TenantManagementAPI
-from catalystwan.api.tenant_migration_api import TenantMigrationAPI
-from catalystwan.api.versions_utils import RepositoryAPI
+from catalystwan.utils.lazy import LazySessionAttribute
 
 if TYPE_CHECKING:
+    from catalystwan.api.admin_tech_api import AdminTechAPI
+    from catalystwan.api.administration import (
+        AdministrationSettingsAPI,
+        ClusterManagementAPI,
+        ResourceGroupsAPI,
+        SessionsAPI,
+        UserGroupsAPI,
+        UsersAPI,
+    )
+    from catalystwan.api.alarms_api import AlarmsAPI
+    from catalystwan.api.basic_api import DevicesAPI, DeviceStateAPI
+    from catalystwan.api.config_device_inventory_api import ConfigurationDeviceInventoryAPI
+    from catalystwan.api.config_group_api import ConfigGroupAPI
+    from catalystwan.api.dashboard_api import DashboardAPI
+    from catalystwan.api.feature_profile_api import SDRoutingFeatureProfilesAPI
+    from catalystwan.api.logs_api import LogsAPI
+    from catalystwan.api.omp_api import OmpAPI
+    from catalystwan.api.packet_capture_api import PacketCaptureAPI
+    from catalystwan.api.partition_manager_api import PartitionManagerAPI
+    from catalystwan.api.policy_api import PolicyAPI
+    from catalystwan.api.resource_pool_api import ResourcePoolAPI
+    from catalystwan.api.software_action_api import SoftwareActionAPI
+    from catalystwan.api.speedtest_api import SpeedtestAPI
+    from catalystwan.api.template_api import TemplatesAPI
+    from catalystwan.api.tenant_backup_restore_api import TenantBackupRestoreAPI
+    from catalystwan.api.tenant_management_api import TenantManagementAPI
+    from catalystwan.api.tenant_migration_api import TenantMigrationAPI
+    from catalystwan.api.versions_utils import RepositoryAPI
     from catalystwan.session import ManagerSession
 
 
 class APIContainer:
+    """Container of high-level APIs, each API (and its module) is created on first access"""
+
+    tenant_management: LazySessionAttribute[TenantManagementAPI] = LazySessionAttribute(
+        "catalystwan.api.tenant_management_api", "TenantManagementAPI"
+    )
+    admin_tech: LazySessionAttribute[AdminTechAPI] = LazySessionAttribute(
+        "catalystwan.api.admin_tech_api", "AdminTechAPI"
+    )
+    administration_settings: LazySessionAttribute[AdministrationSettingsAPI] = LazySessionAttribute(
+        "catalystwan.api.administration", "AdministrationSettingsAPI"
+    )
+    alarms: LazySessionAttribute[AlarmsAPI] = LazySessionAttribute("catalystwan.api.alarms_api", "AlarmsAPI")
+    config_device_inventory_api: LazySessionAttribute[ConfigurationDeviceInventoryAPI] = LazySessionAttribute(
+        "catalystwan.api.config_device_inventory_api", "ConfigurationDeviceInventoryAPI"
+    )
+    config_group: LazySessionAttribute[ConfigGroupAPI] = LazySessionAttribute(
+        "catalystwan.api.config_group_api", "ConfigGroupAPI"
+    )
+    dashboard: LazySessionAttribute[DashboardAPI] = LazySessionAttribute(
+        "catalystwan.api.dashboard_api", "DashboardAPI"
+    )
+    devices: LazySessionAttribute[DevicesAPI] = LazySessionAttribute("catalystwan.api.basic_api", "DevicesAPI")
+    device_state: LazySessionAttribute[DeviceStateAPI] = LazySessionAttribute(
+        "catalystwan.api.basic_api", "DeviceStateAPI"
+    )
+    logs: LazySessionAttribute[LogsAPI] = LazySessionAttribute("catalystwan.api.logs_api", "LogsAPI")
+    omp: LazySessionAttribute[OmpAPI] = LazySessionAttribute("catalystwan.api.omp_api", "OmpAPI")
+    packet_capture: LazySessionAttribute[PacketCaptureAPI] = LazySessionAttribute(
+        "catalystwan.api.packet_capture_api", "PacketCaptureAPI"
+    )
+    speedtest: LazySessionAttribute[SpeedtestAPI] = LazySessionAttribute(
+        "catalystwan.api.speedtest_api", "SpeedtestAPI"
+    )
+    templates: LazySessionAttribute[TemplatesAPI] = LazySessionAttribute("catalystwan.api.template_api", "TemplatesAPI")
+    tenant_backup: LazySessionAttribute[TenantBackupRestoreAPI] = LazySessionAttribute(
+        "catalystwan.api.tenant_backup_restore_api", "TenantBackupRestoreAPI"
+    )
+    tenant_migration: LazySessionAttribute[TenantMigrationAPI] = LazySessionAttribute(
+        "catalystwan.api.tenant_migration_api", "TenantMigrationAPI"
+    )
+    repository: LazySessionAttribute[RepositoryAPI] = LazySessionAttribute(
+        "catalystwan.api.versions_utils", "RepositoryAPI"
+    )
+    resource_pool: LazySessionAttribute[ResourcePoolAPI] = LazySessionAttribute(
+        "catalystwan.api.resource_pool_api", "ResourcePoolAPI"
+    )
+    software: LazySessionAttribute[SoftwareActionAPI] = LazySessionAttribute(
+        "catalystwan.api.software_action_api", "SoftwareActionAPI"
+    )
+    partition: LazySessionAttribute[PartitionManagerAPI] = LazySessionAttribute(
+        "catalystwan.api.partition_manager_api", "PartitionManagerAPI"
+    )
+    users: LazySessionAttribute[UsersAPI] = LazySessionAttribute("catalystwan.api.administration", "UsersAPI")
+    cluster_management: LazySessionAttribute[ClusterManagementAPI] = LazySessionAttribute(
+        "catalystwan.api.administration", "ClusterManagementAPI"
+    )
+    user_groups: LazySessionAttribute[UserGroupsAPI] = LazySessionAttribute(
+        "catalystwan.api.administration", "UserGroupsAPI"
+    )
+    resource_groups: LazySessionAttribute[ResourceGroupsAPI] = LazySessionAttribute(
+        "catalystwan.api.administration", "ResourceGroupsAPI"
+    )
+    sessions: LazySessionAttribute[SessionsAPI] = LazySessionAttribute("catalystwan.api.administration", "SessionsAPI")
+    policy: LazySessionAttribute[PolicyAPI] = LazySessionAttribute("catalystwan.api.policy_api", "PolicyAPI")
+    sd_routing_feature_profiles: LazySessionAttribute[SDRoutingFeatureProfilesAPI] = LazySessionAttribute(
+        "catalystwan.api.feature_profile_api", "SDRoutingFeatureProfilesAPI"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.tenant_management = TenantManagementAPI(session)
-        self.admin_tech = AdminTechAPI(session)
-        self.administration_settings = AdministrationSettingsAPI(session)
-        self.alarms = AlarmsAPI(session)
-        self.config_device_inventory_api = ConfigurationDeviceInventoryAPI(session)
-        self.config_group = ConfigGroupAPI(session)
-        self.dashboard = DashboardAPI(session)
-        self.devices = DevicesAPI(session)
-        self.device_state = DeviceStateAPI(session)
-        self.logs = LogsAPI(session)
-        self.omp = OmpAPI(session)
-        self.packet_capture = PacketCaptureAPI(session)
-        self.speedtest = SpeedtestAPI(session)
-        self.templates = TemplatesAPI(session)
-        self.tenant_backup = TenantBackupRestoreAPI(session)
-        self.tenant_migration = TenantMigrationAPI(session)
-        self.repository = RepositoryAPI(session)
-        self.resource_pool = ResourcePoolAPI(session)
-        self.software = SoftwareActionAPI(session)
-        self.partition = PartitionManagerAPI(session)
-        self.users = UsersAPI(session)
-        self.cluster_management = ClusterManagementAPI(session)
-        self.user_groups = UserGroupsAPI(session)
-        self.resource_groups = ResourceGroupsAPI(session)
-        self.sessions = SessionsAPI(session)
-        self.policy = PolicyAPI(session)
-        self.sd_routing_feature_profiles = SDRoutingFeatureProfilesAPI(session)
+        self._session = session
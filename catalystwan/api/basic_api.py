@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Iterator, List, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
 
@@ -33,6 +34,7 @@ class DevicesAPI:
     """
 
     max_params = 1000
+    max_workers = 8
 
     def __init__(self, session: ManagerSession) -> None:
         self.session = session
@@ -134,33 +136,57 @@ class DevicesAPI:
 
         return True if wait_for_state() else False
 
-    def get(self, rediscover: bool = False) -> DataSequence[Device]:
+    def get(
+        self, rediscover: bool = False, chunk_size: Optional[int] = None, max_workers: Optional[int] = None
+    ) -> DataSequence[Device]:
         """Data sequence of all devices.
 
+        System info is requested in chunks of device ids fetched concurrently.
+
         Args:
             rediscover: Rediscover device request payload
+            chunk_size: number of device ids in single system info request (defaults to max_params)
+            max_workers: maximum number of concurrent system info requests (defaults to max_workers)
 
         Returns:
             DataSequence[Device] of all devices
 
+        Raises:
+            ValueError: when chunk_size or max_workers is lower than 1
+
         ## Examples:
 
         Get all vManages:
         >>> devices = DevicesAPI(session).get()
         >>> vManages = devices.filter(personality=Personality.VMANAGE)
         """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
         if rediscover:
             logger.info("Rediscovering devices...")
             api = "/dataservice/device/action/rediscoverall"
             self.session.post(url=api)
         devices = self.session.endpoints.monitoring_device_details.list_all_devices()
         device_ids = [device.device_id for device in devices]
-        devices_sys_info = DataSequence(Device, [])
-        for i in range(0, len(device_ids), self.max_params):
-            params = {"deviceId": device_ids[i : i + self.max_params]}
-            resp = self.session.get(url="/dataservice/device/system/info", params=params)
-            devices_sys_info += resp.dataseq(Device)
+        chunk_size = chunk_size or self.max_params
+        chunks = [device_ids[i : i + chunk_size] for i in range(0, len(device_ids), chunk_size)]
 
+        def get_system_info(chunk: List[str]) -> DataSequence[Device]:
+            resp = self.session.get(url="/dataservice/device/system/info", params={"deviceId": chunk})
+            return resp.dataseq(Device)
+
+        devices_sys_info = DataSequence(Device, [])
+        workers = min(max_workers or self.max_workers, len(chunks))
+        if workers <= 1:
+            for chunk in chunks:
+                devices_sys_info += get_system_info(chunk)
+            return devices_sys_info
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map preserves order of chunks
+            for chunk_sys_info in executor.map(get_system_info, chunks):
+                devices_sys_info += chunk_sys_info
         return devices_sys_info
 
 
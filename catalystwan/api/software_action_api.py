@@ -16,6 +16,7 @@ from catalystwan.endpoints.configuration_device_actions import (
 )
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
 from catalystwan.exceptions import EmptyVersionPayloadError, ImageNotInRepositoryError  # type: ignore
+from catalystwan.tracing import traced
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.personality import Personality
 from catalystwan.utils.upgrades_helper import get_install_specification, validate_personality_homogeneity
@@ -106,6 +107,11 @@ class SoftwareActionAPI:
 
         return Task(self.session, partition_action.id)
 
+    @traced(
+        "SoftwareActionAPI.install",
+        lambda self, devices, *args, **kwargs: {"device.ids": ", ".join(str(device.uuid) for device in devices)},
+        lambda task: {"task.id": task.task_id},
+    )
     def install(
         self,
         devices: DataSequence[DeviceDetailsResponse],
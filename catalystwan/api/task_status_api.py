@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List, cast
+from concurrent.futures import Future
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union, cast
 
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
 
 from catalystwan.exceptions import TaskValidationError
+from catalystwan.tracing import traced
 
 if TYPE_CHECKING:
     from catalystwan.session import ManagerSession
@@ -22,6 +25,63 @@ from catalystwan.utils.operation_status import OperationStatus, OperationStatusI
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SUCCESS_STATUSES: List[OperationStatus] = [OperationStatus.SUCCESS]
+DEFAULT_FAILURE_STATUSES: List[OperationStatus] = [OperationStatus.FAILURE]
+DEFAULT_SUCCESS_STATUSES_IDS: List[OperationStatusId] = [OperationStatusId.SUCCESS]
+DEFAULT_FAILURE_STATUSES_IDS: List[OperationStatusId] = [OperationStatusId.FAILURE]
+
+
+class _StatusCriteria:
+    """Sub-task exit statuses used to decide if task is completed and successful"""
+
+    def __init__(
+        self,
+        success_statuses: List[OperationStatus],
+        failure_statuses: List[OperationStatus],
+        success_statuses_ids: List[OperationStatusId],
+        failure_statuses_ids: List[OperationStatusId],
+    ):
+        self.success_statuses = [cast(OperationStatus, exit_status.value) for exit_status in success_statuses]
+        self.failure_statuses = [cast(OperationStatus, exit_status.value) for exit_status in failure_statuses]
+        self.success_statuses_ids = [
+            cast(OperationStatusId, exit_status_id.value) for exit_status_id in success_statuses_ids
+        ]
+        self.failure_statuses_ids = [
+            cast(OperationStatusId, exit_status_id.value) for exit_status_id in failure_statuses_ids
+        ]
+
+    def is_completed(self, task_data: List[SubTaskData]) -> bool:
+        """Checks if all sub-tasks reached exit status (success or failure)"""
+        if not task_data:
+            return False
+        task_statuses_success = [task.status in self.success_statuses for task in task_data]
+        task_statuses_failure = [task.status in self.failure_statuses for task in task_data]
+        task_statuses_id_success = [task.status_id in self.success_statuses_ids for task in task_data]
+        task_statuses_id_failure = [task.status_id in self.failure_statuses_ids for task in task_data]
+
+        all_subtasks_completed_status: List[bool] = [
+            any(task_status) for task_status in zip(task_statuses_success, task_statuses_failure)
+        ]
+        all_subtasks_completed_status_id: List[bool] = [
+            any(task_status_id) for task_status_id in zip(task_statuses_id_success, task_statuses_id_failure)
+        ]
+        return all(all_subtasks_completed_status) or all(all_subtasks_completed_status_id)
+
+    def is_success(self, task_data: List[SubTaskData]) -> bool:
+        """Checks if all sub-tasks finished successfully"""
+        return all([sub_task.status in self.success_statuses for sub_task in task_data])
+
+
+def _check_validation_status(task: TaskData) -> None:
+    if not task.validation:
+        return None
+    if task.validation.status in (OperationStatus.FAILURE, OperationStatus.VALIDATION_FAILURE):
+        raise TaskValidationError(f"Task status validation failed, validation status is: {task.validation.status}")
+
+
+def _statuses_attributes(task_data: List[SubTaskData]) -> Dict[str, str]:
+    return {"task.status": ", ".join(sorted({str(sub_task.status) for sub_task in task_data}))}
+
 
 class Task:
     """
@@ -35,11 +95,13 @@ class Task:
         self.task_data: List[SubTaskData]
 
     def __check_validation_status(self, task: TaskData):
-        if not task.validation:
-            return None
-        if task.validation.status in (OperationStatus.FAILURE, OperationStatus.VALIDATION_FAILURE):
-            raise TaskValidationError(f"Task status validation failed, validation status is: {task.validation.status}")
+        _check_validation_status(task)
 
+    @traced(
+        "Task.wait_for_completed",
+        lambda self, *args, **kwargs: {"task.id": self.task_id},
+        lambda task_result: {"task.result": task_result.result},
+    )
     def wait_for_completed(
         self,
         timeout_seconds: int = 300,
@@ -93,14 +155,7 @@ class Task:
             TaskResult(): result attr is True if all subtasks are success
              or is False if at least one is failed
         """
-        success_statuses = [cast(OperationStatus, exit_status.value) for exit_status in success_statuses]
-        failure_statuses = [cast(OperationStatus, exit_status.value) for exit_status in failure_statuses]
-        success_statuses_ids = [
-            cast(OperationStatusId, exit_status_id.value) for exit_status_id in success_statuses_ids
-        ]
-        failure_statuses_ids = [
-            cast(OperationStatusId, exit_status_id.value) for exit_status_id in failure_statuses_ids
-        ]
+        criteria = _StatusCriteria(success_statuses, failure_statuses, success_statuses_ids, failure_statuses_ids)
 
         def check_status(task_data: List[SubTaskData]) -> bool:
             """
@@ -113,22 +168,7 @@ class Task:
             Returns:
                 bool: False if condition is met
             """
-            if not task_data:
-                return True
-            task_statuses_success = [task.status in success_statuses for task in task_data]
-            task_statuses_failure = [task.status in failure_statuses for task in task_data]
-            task_statuses_id_success = [task.status_id in success_statuses_ids for task in task_data]
-            task_statuses_id_failure = [task.status_id in failure_statuses_ids for task in task_data]
-
-            all_subtasks_completed_status: List[bool] = [
-                any(task_status) for task_status in zip(task_statuses_success, task_statuses_failure)
-            ]
-            all_subtasks_completed_status_id: List[bool] = [
-                any(task_status_id) for task_status_id in zip(task_statuses_id_success, task_statuses_id_failure)
-            ]
-            if all(all_subtasks_completed_status) or all(all_subtasks_completed_status_id):
-                return False
-            return True
+            return not criteria.is_completed(task_data)
 
         def log_exception(self) -> None:
             logger.error("Operation status not achieved in given time")
@@ -139,6 +179,7 @@ class Task:
             retry=retry_if_result(check_status),
             retry_error_callback=log_exception,
         )
+        @traced("Task.poll", lambda: {"task.id": self.task_id}, _statuses_attributes, session=lambda: self.session)
         def wait_for_action_finish() -> List[SubTaskData]:
             """
             Keep asking for task status, status_id,
@@ -160,9 +201,147 @@ class Task:
             return self.task_data
 
         wait_for_action_finish()
-        result = all([sub_task.status in success_statuses for sub_task in self.task_data])
+        result = criteria.is_success(self.task_data)
         if result:
             logger.info("Task polling finished, because all subtasks successfully finished.")
         else:
             logger.info("Task polling finished, because at least one subtask failed or task is timeout.")
         return TaskResult(result=result, sub_tasks_data=self.task_data)
+
+
+class _MonitoredTask:
+    def __init__(self, task_id: str, deadline: float, interval: float):
+        self.task_id = task_id
+        self.future: Future[TaskResult] = Future()
+        self.deadline = deadline
+        self.interval = interval
+        self.next_poll = monotonic()
+        self.task_data: List[SubTaskData] = []
+
+
+class TaskMonitor:
+    """
+    Waits for completion of many tasks using single polling loop.
+
+    Each task is polled with adaptive interval: starting with initial_interval_seconds
+    and growing by backoff_factor after each poll up to max_interval_seconds,
+    so short tasks are detected quickly and long running tasks do not flood vManage with requests.
+
+    Example:
+        monitor = TaskMonitor(session, timeout_seconds=3600)
+        for task_id in attach_task_ids:
+            monitor.add(task_id, callback=lambda task_id, result: print(task_id, result.result))
+        results = monitor.wait()
+
+    Args:
+        session: logged in API client session
+        timeout_seconds: After this time (counted from adding task), task is reported as not successful
+        initial_interval_seconds: interval between first status requests of each task
+        max_interval_seconds: maximum interval between status requests of each task
+        backoff_factor: multiplier applied to interval after each status request
+        success_statuses, failure_statuses, success_statuses_ids, failure_statuses_ids:
+            sub-task exit statuses, same as in Task.wait_for_completed
+    """
+
+    def __init__(
+        self,
+        session: ManagerSession,
+        timeout_seconds: float = 300,
+        initial_interval_seconds: float = 1,
+        max_interval_seconds: float = 30,
+        backoff_factor: float = 1.5,
+        success_statuses: List[OperationStatus] = DEFAULT_SUCCESS_STATUSES,
+        failure_statuses: List[OperationStatus] = DEFAULT_FAILURE_STATUSES,
+        success_statuses_ids: List[OperationStatusId] = DEFAULT_SUCCESS_STATUSES_IDS,
+        failure_statuses_ids: List[OperationStatusId] = DEFAULT_FAILURE_STATUSES_IDS,
+    ):
+        self.session = session
+        self.timeout_seconds = timeout_seconds
+        self.initial_interval_seconds = initial_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.backoff_factor = backoff_factor
+        self._criteria = _StatusCriteria(success_statuses, failure_statuses, success_statuses_ids, failure_statuses_ids)
+        self._tasks: List[_MonitoredTask] = []
+
+    def add(
+        self, task: Union[Task, str], callback: Optional[Callable[[str, TaskResult], None]] = None
+    ) -> Future[TaskResult]:
+        """Adds task to be monitored
+
+        Args:
+            task: Task object or task id
+            callback: called with task id and TaskResult when task is finished (not called when polling failed)
+
+        Returns:
+            Future[TaskResult]: resolved when task is finished or timeout is reached,
+                raises TaskValidationError when task validation failed or error raised when requesting status
+        """
+        task_id = task.task_id if isinstance(task, Task) else task
+        monitored = _MonitoredTask(task_id, monotonic() + self.timeout_seconds, self.initial_interval_seconds)
+        if callback is not None:
+
+            def done_callback(future: Future[TaskResult]) -> None:
+                if future.exception() is None:
+                    callback(task_id, future.result())
+
+            monitored.future.add_done_callback(done_callback)
+        self._tasks.append(monitored)
+        return monitored.future
+
+    @traced("TaskMonitor.wait", lambda self: {"task.count": sum(not task.future.done() for task in self._tasks)})
+    def wait(self) -> List[TaskResult]:
+        """Polls all added tasks until they are finished
+
+        Raises:
+            TaskValidationError: when validation of any task failed (other tasks are polled until finished),
+                other errors raised when requesting task status are propagated the same way
+
+        Returns:
+            List[TaskResult]: results in order in which tasks were added
+        """
+        pending = [task for task in self._tasks if not task.future.done()]
+        while pending:
+            for task in pending:
+                if task.next_poll <= monotonic():
+                    self._poll(task)
+            pending = [task for task in pending if not task.future.done()]
+            if pending:
+                delay = min(task.next_poll for task in pending) - monotonic()
+                if delay > 0:
+                    sleep(delay)
+        return [task.future.result() for task in self._tasks]
+
+    def _poll(self, task: _MonitoredTask) -> None:
+        try:
+            task_status = self._find_status(task.task_id)
+        except Exception as error:
+            # failed task is reported by its future, remaining tasks are still polled
+            task.future.set_exception(error)
+            return
+        task.task_data = task_status.data
+        logger.debug(
+            f"Sub-tasks data for task {task.task_id}: statuses: {[sub_task.status for sub_task in task.task_data]}"
+        )
+        if self._criteria.is_completed(task.task_data):
+            self._finish(task)
+        elif monotonic() >= task.deadline:
+            logger.error(f"Operation status of task {task.task_id} not achieved in given time")
+            self._finish(task)
+        else:
+            task.next_poll = min(monotonic() + task.interval, task.deadline)
+            task.interval = min(task.interval * self.backoff_factor, self.max_interval_seconds)
+
+    @traced(
+        "Task.poll",
+        lambda self, task_id: {"task.id": task_id},
+        lambda task_status: _statuses_attributes(task_status.data),
+    )
+    def _find_status(self, task_id: str) -> TaskData:
+        task_status = ConfigurationDashboardStatus(self.session).find_status(task_id)
+        _check_validation_status(task_status)
+        return task_status
+
+    def _finish(self, task: _MonitoredTask) -> None:
+        result = bool(task.task_data) and self._criteria.is_success(task.task_data)
+        logger.info(f"Task {task.task_id} polling finished with result: {result}")
+        task.future.set_result(TaskResult(result=result, sub_tasks_data=task.task_data))
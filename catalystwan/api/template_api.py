@@ -5,11 +5,11 @@ from __future__ import annotations
 import json
 import logging
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional, Type, overload
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, overload
 
 from ciscoconfparse import CiscoConfParse  # type: ignore
 
-from catalystwan.api.task_status_api import Task
+from catalystwan.api.task_status_api import Task, TaskMonitor
 from catalystwan.api.templates.cli_template import CLITemplate
 from catalystwan.api.templates.device_template.device_template import (
     DeviceSpecificValue,
@@ -17,7 +17,6 @@ from catalystwan.api.templates.device_template.device_template import (
     GeneralTemplate,
 )
 from catalystwan.api.templates.feature_template import FeatureTemplate
-from catalystwan.api.templates.feature_template_field import FeatureTemplateField
 from catalystwan.api.templates.feature_template_payload import FeatureTemplatePayload
 from catalystwan.api.templates.models.cisco_aaa_model import CiscoAAAModel
 from catalystwan.api.templates.models.cisco_banner_model import CiscoBannerModel
@@ -37,14 +36,18 @@ from catalystwan.api.templates.models.cli_template import CliTemplateModel
 from catalystwan.api.templates.models.omp_vsmart_model import OMPvSmart
 from catalystwan.api.templates.models.security_vsmart_model import SecurityvSmart
 from catalystwan.api.templates.models.system_vsmart_model import SystemVsmart
+from catalystwan.api.templates.schema_cache import SCHEMA_CACHE, FeatureTemplateSchemaCache, SchemaKey
 from catalystwan.dataclasses import Device, DeviceTemplateInfo, FeatureTemplateInfo, FeatureTemplatesTypes, TemplateInfo
+from catalystwan.endpoints.configuration_dashboard_status import TaskResult
 from catalystwan.endpoints.configuration_device_template import FeatureToCLIPayload
 from catalystwan.exceptions import AttachedError, TemplateNotFoundError
 from catalystwan.response import ManagerResponse
+from catalystwan.tracing import traced
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.device_model import DeviceModel
 from catalystwan.utils.dict import merge
-from catalystwan.utils.pydantic_field import get_extra_field
+from catalystwan.utils.operation_status import OperationStatus
+from catalystwan.utils.pydantic_field import get_extra_field, get_field_index
 from catalystwan.utils.template_type import TemplateType
 
 if TYPE_CHECKING:
@@ -52,6 +55,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+FEATURE_TEMPLATE_MIN_VERSION = "15.0.0"
+
 
 class DeviceModelError(Exception):
     """Used when unsupported device model used in template."""
@@ -70,8 +75,11 @@ class DeviceTemplateFeature(Enum):
 
 
 class TemplatesAPI:
-    def __init__(self, session: ManagerSession) -> None:
+    max_attach_devices = 200
+
+    def __init__(self, session: ManagerSession, schema_cache: FeatureTemplateSchemaCache = SCHEMA_CACHE) -> None:
         self.session = session
+        self.schema_cache = schema_cache
 
     @overload
     def get(self, template: Type[DeviceTemplate]) -> DataSequence[DeviceTemplateInfo]:  # type: ignore
@@ -107,10 +115,16 @@ class TemplatesAPI:
         endpoint = "/dataservice/template/feature"
         params = {"summary": summary}
 
-        fr_templates = self.session.get(url=endpoint, params=params)
+        fr_templates = self.session.get(url=endpoint, params=params, cache_ttl=60)
 
         return fr_templates.dataseq(FeatureTemplateInfo)
 
+    def _get_feature_template_definition(self, template_id: str) -> Dict[str, Any]:
+        """Gets definition of single feature template"""
+        endpoint = f"/dataservice/template/feature/object/{template_id}"
+        definition = self.session.get(url=endpoint).json()["templateDefinition"]
+        return json.loads(definition) if isinstance(definition, str) else definition
+
     def _get_device_templates(
         self, feature: DeviceTemplateFeature = DeviceTemplateFeature.ALL
     ) -> DataSequence[DeviceTemplateInfo]:
@@ -118,75 +132,173 @@ class TemplatesAPI:
         endpoint = "/dataservice/template/device"
         params = {"feature": feature.value}
 
-        templates = self.session.get(url=endpoint, params=params)
+        templates = self.session.get(url=endpoint, params=params, cache_ttl=60)
         return templates.dataseq(DeviceTemplateInfo)
 
+    @traced(
+        "TemplatesAPI.attach",
+        lambda self, name, device, *args, **kwargs: {"template.name": name, "device.id": device.uuid},
+        lambda result: {"result": result},
+    )
     def attach(self, name: str, device: Device, timeout_seconds: int = 300, **kwargs):
-        template_type = self.get(DeviceTemplate).filter(name=name).single_or_default().config_type
-        if template_type == TemplateType.CLI:
+        template = self.get(DeviceTemplate).filter(name=name).single_or_default()
+        if template.config_type == TemplateType.CLI:
             return self._attach_cli(name, device, timeout_seconds=timeout_seconds, **kwargs)
 
-        if template_type == TemplateType.FEATURE:
-            return self._attach_feature(name, device, timeout_seconds=timeout_seconds, **kwargs)
+        if template.config_type == TemplateType.FEATURE:
+            return self._attach_feature(
+                name, device, timeout_seconds=timeout_seconds, template_id=template.id, **kwargs
+            )
 
         raise NotImplementedError()
 
-    def _attach_feature(self, name: str, device: Device, timeout_seconds: int = 300, **kwargs):
+    @traced(
+        "TemplatesAPI.attach_many",
+        lambda self, name, devices_with_vars, *args, **kwargs: {
+            "template.name": name,
+            "device.count": len(devices_with_vars),
+        },
+        lambda results: {"result": all(result.result for result in results)},
+    )
+    def attach_many(
+        self,
+        name: str,
+        devices_with_vars: Sequence[Tuple[Device, Dict[str, Any]]],
+        timeout_seconds: int = 300,
+        chunk_size: Optional[int] = None,
+    ) -> List[TaskResult]:
+        """Attach Device Template to many devices with minimal number of requests.
+
+        Template metadata and device specific variables are fetched once, devices are attached in chunks
+        (single attach request and task per chunk) and all tasks are polled together.
+        Templates created from CLI are validated against each device before anything is attached.
+
+        Args:
+            name: Name of the Device Template to be attached.
+            devices_with_vars: devices with values of device specific variables
+                (variables are ignored for templates created from CLI).
+            timeout_seconds: time to wait for completion of all tasks.
+            chunk_size: number of devices attached by single request (defaults to max_attach_devices).
+
+        Raises:
+            TemplateNotFoundError: when template with given name does not exist.
+            TypeError: when device specific variable is missing for any device (nothing is attached).
+
+        Returns:
+            List[TaskResult]: results of attach tasks in order of chunks, sub-tasks contain result of each device.
+        """
+        template = self.get(DeviceTemplate).filter(name=name).single_or_default()
+        if not template:
+            raise TemplateNotFoundError(f"Template with name [{name}] does not exists.")
+        if template.config_type == TemplateType.FEATURE:
+            endpoint = "/dataservice/template/device/config/attachfeature"
+            vars = self._get_device_specific_variables(template.id)
+            devices = [
+                self._attach_device_payload(template.id, device, vars, device_specific_vars)
+                for device, device_specific_vars in devices_with_vars
+            ]
+        elif template.config_type == TemplateType.CLI:
+            endpoint = "/dataservice/template/device/config/attachcli"
+            for device, _ in devices_with_vars:
+                self.template_validation(template.id, device=device)
+            devices = [self._attach_device_payload(template.id, device) for device, _ in devices_with_vars]
+        else:
+            raise NotImplementedError()
+
+        chunk_size = chunk_size or self.max_attach_devices
+        monitor = TaskMonitor(self.session, timeout_seconds=timeout_seconds)
+        for i in range(0, len(devices), chunk_size):
+            payload = {"deviceTemplateList": [{"templateId": template.id, "device": devices[i : i + chunk_size]}]}
+            logger.info(f"Attaching a template: {name} to {len(payload['deviceTemplateList'][0]['device'])} devices.")
+            monitor.add(self.session.post(url=endpoint, json=payload).json()["id"])
+        results = monitor.wait()
+        for result in results:
+            for sub_task in result.sub_tasks_data:
+                if sub_task.status != OperationStatus.SUCCESS.value:
+                    logger.warning(f"Failed to attach tempate: {name} to the device: {sub_task.hostname}.")
+                    logger.warning(f"Task activity information: {sub_task.activity}")
+        return results
+
+    @traced(
+        "TemplatesAPI.get_device_specific_variables",
+        lambda self, template_id: {"template.id": template_id},
+    )
+    def _get_device_specific_variables(self, template_id: str) -> List[DeviceSpecificValue]:
+        endpoint = "/dataservice/template/device/config/exportcsv"
+        body = {
+            "templateId": template_id,
+            "isEdited": False,
+            "isMasterEdited": False,
+        }
+
+        values = self.session.post(endpoint, json=body).json()["header"]["columns"]
+        return [DeviceSpecificValue(**value) for value in values]
+
+    @staticmethod
+    def _attach_device_payload(
+        template_id: str,
+        device: Device,
+        vars: Sequence[DeviceSpecificValue] = (),
+        device_specific_vars: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Builds entry of device in attach payload, values of device specific variables are taken from
+        device_specific_vars
+
+        Raises:
+            TypeError: when device specific variable is missing in device_specific_vars
+        """
+        device_payload: Dict[str, Any] = {
+            "csv-status": "complete",
+            "csv-deviceId": device.uuid,
+            "csv-deviceIP": device.id,
+            "csv-host-name": device.hostname,
+            "csv-templateId": template_id,
+        }
+        device_specific_vars = device_specific_vars or {}
+        invalid = False
+        for var in vars:
+            if var.property not in device_payload:
+                if var.property not in device_specific_vars:
+                    invalid = True
+                    logger.error(
+                        f"{var.property} should be provided in attach method as device_specific_vars kwarg "
+                        f"for device: {device.hostname}."
+                    )
+                else:
+                    device_payload[var.property] = device_specific_vars[var.property]
+
+        if invalid:
+            raise TypeError()
+        return device_payload
+
+    def _attach_feature(
+        self, name: str, device: Device, timeout_seconds: int = 300, template_id: Optional[str] = None, **kwargs
+    ):
         """Attach Device Template created with Feature Templates.
 
         Args:
             name: Name of the Device Template to be attached.
             device: Device object under which the template should be attached.
+            template_id: ID of the Device Template (looked up by name when not given).
             **device_specific_vars: For parameters in a feature template that you configure as device-specific,
                 when you attach a device template to a device, Cisco vManage prompts you for the values to use
                 for these parameters. Entering device-specific values in this manner is useful in test or POC networks,
                 or if you are deploying a small network. This method generally does not scale well for larger networks.
         """
-
-        def get_device_specific_variables(name: str):
-            endpoint = "/dataservice/template/device/config/exportcsv"
+        if template_id is None:
             template_id = self.get(DeviceTemplate).filter(name=name).single_or_default().id
-            body = {
-                "templateId": template_id,
-                "isEdited": False,
-                "isMasterEdited": False,
-            }
-
-            values = self.session.post(endpoint, json=body).json()["header"]["columns"]
-            return [DeviceSpecificValue(**value) for value in values]
-
-        vars = get_device_specific_variables(name)
-        template_id = self.get(DeviceTemplate).filter(name=name).single_or_default().id
+        vars = self._get_device_specific_variables(template_id)
         payload = {
             "deviceTemplateList": [
                 {
                     "templateId": template_id,
                     "device": [
-                        {
-                            "csv-status": "complete",
-                            "csv-deviceId": device.uuid,
-                            "csv-deviceIP": device.id,
-                            "csv-host-name": device.hostname,
-                            "csv-templateId": template_id,
-                        }
+                        self._attach_device_payload(template_id, device, vars, kwargs.get("device_specific_vars"))
                     ],
                 }
             ]
         }
 
-        invalid = False
-        for var in vars:
-            if var.property not in payload["deviceTemplateList"][0]["device"][0]:
-                pointer = payload["deviceTemplateList"][0]["device"][0]
-                if var.property not in kwargs["device_specific_vars"]:
-                    invalid = True
-                    logger.error(f"{var.property} should be provided in attach method as device_specific_vars kwarg.")
-                else:
-                    pointer[var.property] = kwargs["device_specific_vars"][var.property]  # type: ignore
-
-        if invalid:
-            raise TypeError()
-
         endpoint = "/dataservice/template/device/config/attachfeature"
         logger.info(f"Attaching a template: {name} to the device: {device.hostname}.")
         response = self.session.post(url=endpoint, json=payload).json()
@@ -530,9 +642,14 @@ class TemplatesAPI:
 
         return isinstance(template, ported_templates)
 
+    def _schema_key(self, template: FeatureTemplate) -> SchemaKey:
+        return SchemaKey(template.type, FEATURE_TEMPLATE_MIN_VERSION, self.session.platform_version)
+
     def get_feature_template_schema(self, template: FeatureTemplate, debug: bool = False) -> Any:
-        endpoint = f"/dataservice/template/feature/types/definition/{template.type}/15.0.0"
-        schema = self.session.get(url=endpoint).json()
+        """Gets schema of feature template type, schemas are downloaded once per server version (see schema_cache)"""
+        key = self._schema_key(template)
+        endpoint = f"/dataservice/template/feature/types/definition/{key.template_type}/{key.min_version}"
+        schema = self.schema_cache.get(key, lambda: self.session.get(url=endpoint).json())
 
         if debug:
             with open(f"response_{template.type}.json", "w") as f:
@@ -560,27 +677,24 @@ class TemplatesAPI:
             definition={},
         )  # type: ignore
 
-        fr_template_fields = [FeatureTemplateField(**field) for field in schema["fields"]]  # TODO
+        fr_template_fields = self.schema_cache.fields(self._schema_key(template), schema)
         json_dumped_template = template.model_dump(mode="json")
         # "name"
+        field_index = get_field_index(type(template))
         for field in fr_template_fields:
             value = None
+            json_dumped_value = None
             priority_order = None
             # TODO How to discover Device specific variable
             if field.key in template.device_specific_variables:
                 value = template.device_specific_variables[field.key]
             else:
-                for field_name, field_value in template.model_fields.items():
-                    data_path = get_extra_field(field_value, "data_path", default=[])
-                    vmanage_key = get_extra_field(field_value, "vmanage_key")
-                    if field.dataPath == data_path and (  # type: ignore
-                        (field.key == field_value.alias or field.key == field_name)
-                        or field.key == vmanage_key  # type: ignore
-                    ):
-                        priority_order = get_extra_field(field_value, "priority_order")  # type: ignore
-                        value = getattr(template, field_name)
-                        json_dumped_value = json_dumped_template.get(field_name)
-                        break
+                if (match := field_index.get((tuple(field.dataPath), field.key))) is None:
+                    continue
+                field_name, field_info = match
+                priority_order = get_extra_field(field_info, "priority_order")
+                value = getattr(template, field_name)
+                json_dumped_value = json_dumped_template.get(field_name)
                 if value is None:
                     continue
 
@@ -2,24 +2,44 @@
 
 from __future__ import annotations
 
-import json
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Union
 
-from jinja2 import DebugUndefined, Environment, FileSystemLoader, meta  # type: ignore
+from jinja2 import DebugUndefined, Environment, FileSystemLoader, Template, meta  # type: ignore
 from pydantic import BaseModel, model_validator
 
 from catalystwan.api.templates.device_variable import DeviceVariable
+from catalystwan.exceptions import TemplateNotFoundError, TemplateUndeclaredVariablesError
 from catalystwan.utils.device_model import DeviceModel
 from catalystwan.utils.dict import FlattenedDictValue, flatten_dict
 from catalystwan.utils.feature_template.find_template_values import find_template_values
 from catalystwan.utils.pydantic_field import get_extra_field
 
 if TYPE_CHECKING:
+    from catalystwan.dataclasses import FeatureTemplateInfo
     from catalystwan.session import ManagerSession
 
 
+@lru_cache(maxsize=None)
+def _get_environment(directory: Path) -> Environment:
+    return Environment(
+        loader=FileSystemLoader(directory),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        undefined=DebugUndefined,
+        auto_reload=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_payload_template(payload_path: Path) -> Template:
+    """Payload templates are compiled once per process, environment is shared by templates from the same directory"""
+    return _get_environment(payload_path.parent).get_template(payload_path.name)
+
+
 class FeatureTemplateValidator(BaseModel, ABC):
     @model_validator(mode="before")
     @classmethod
@@ -55,19 +75,15 @@ class FeatureTemplate(FeatureTemplateValidator, ABC):
     device_specific_variables: Dict[str, DeviceVariable] = {}
 
     def generate_payload(self, session: ManagerSession) -> str:
-        env = Environment(
-            loader=FileSystemLoader(self.payload_path.parent),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            undefined=DebugUndefined,
-        )
-        template = env.get_template(self.payload_path.name)
+        template = _get_payload_template(self.payload_path)
         output = template.render(self.model_dump(mode="json"))
 
-        ast = env.parse(output)
-        if meta.find_undeclared_variables(ast):
-            print(meta.find_undeclared_variables(ast))
-            raise Exception
+        # undefined variables are rendered back as jinja expressions (DebugUndefined),
+        # so output needs to be parsed only when it contains one
+        if "{{" in output or "{%" in output:
+            undeclared = meta.find_undeclared_variables(template.environment.parse(output))
+            if undeclared:
+                raise TemplateUndeclaredVariablesError(self.template_name, undeclared)
         return output
 
     def generate_cli(self) -> str:
@@ -113,18 +129,59 @@ class FeatureTemplate(FeatureTemplateValidator, ABC):
         Returns:
             FeatureTemplate: filed out feature template model
         """
-        from catalystwan.utils.feature_template.choose_model import choose_model
+        template_info = cls._get_template_info(session, [name])[name]
+        definition = session.api.templates._get_feature_template_definition(template_info.id)
+        return cls._from_definition(template_info, definition)
 
-        template_info = (
-            session.api.templates._get_feature_templates(summary=False).filter(name=name).single_or_default()
-        )
-        template_definition_as_dict = json.loads(cast(str, template_info.template_definiton))
+    @classmethod
+    def get_many(cls, session: ManagerSession, names: Iterable[str], max_workers: int = 8) -> List[FeatureTemplate]:
+        """Gets feature template models corresponding to existing feature templates based on provided names,
+        definitions of templates are downloaded concurrently
+
+        Args:
+            session: ManagerSession
+            names: names of the existing feature templates
+            max_workers: maximum number of concurrently downloaded definitions
+
+        Returns:
+            List[FeatureTemplate]: filed out feature template models in order of names
+        """
+        names = list(names)
+        templates_info = cls._get_template_info(session, names)
+
+        def get(name: str) -> FeatureTemplate:
+            template_info = templates_info[name]
+            definition = session.api.templates._get_feature_template_definition(template_info.id)
+            return cls._from_definition(template_info, definition)
+
+        workers = min(max_workers, len(names))
+        if workers <= 1:
+            return [get(name) for name in names]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(get, names))
+
+    @staticmethod
+    def _get_template_info(session: ManagerSession, names: List[str]) -> Dict[str, FeatureTemplateInfo]:
+        """Finds templates by name in summary listing (without definitions)"""
+        wanted = set(names)
+        templates_info = {
+            template_info.name: template_info
+            for template_info in session.api.templates._get_feature_templates(summary=True)
+            if template_info.name in wanted
+        }
+        if missing := [name for name in names if name not in templates_info]:
+            raise TemplateNotFoundError(f"Feature templates with names {missing} do not exist.")
+        return templates_info
+
+    @staticmethod
+    def _from_definition(template_info: FeatureTemplateInfo, definition: Dict[str, Any]) -> FeatureTemplate:
+        from catalystwan.utils.feature_template.choose_model import choose_model
 
         feature_template_model = choose_model(type_value=template_info.template_type)
 
         device_specific_variables: Dict[str, DeviceVariable] = {}
         values_from_template_definition = find_template_values(
-            template_definition_as_dict, device_specific_variables=device_specific_variables
+            definition, device_specific_variables=device_specific_variables
         )
         flattened_values = flatten_dict(values_from_template_definition)
 
@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field, field_validator
 from catalystwan.api.templates.device_variable import DeviceVariable
 from catalystwan.api.templates.feature_template import FeatureTemplate
 from catalystwan.utils.dict import merge
-from catalystwan.utils.pydantic_field import get_extra_field
+from catalystwan.utils.pydantic_field import get_extra_field, get_field_index
 
 
 class FeatureTemplateOptionType(str, Enum):
@@ -122,23 +122,13 @@ class FeatureTemplateField(BaseModel):
                     children_output = []
                     for obj in value:  # obj is User, atomic value. Loop every child
                         obj_json_dump = obj.model_dump(mode="json")
+                        field_index = get_field_index(obj.__class__)
                         child_payload: dict = {}
                         for child in self.children:  # Child in schema
                             obj: FeatureTemplate  # type: ignore
-                            model_tuple = next(
-                                filter(
-                                    lambda f: get_extra_field(f[1], "data_path", []) == child.dataPath
-                                    and (
-                                        f[1].alias == child.key
-                                        or get_extra_field(f[1], "vmanage_key") == child.key
-                                        or f[0] == child.key
-                                    ),
-                                    obj.model_fields.items(),
-                                )
-                            )
-                            model_field = model_tuple[1]
-                            obj_value = getattr(obj, model_tuple[0])
-                            obj_json_value = obj_json_dump.get(model_tuple[0])
+                            field_name, model_field = field_index[(tuple(child.dataPath), child.key)]
+                            obj_value = getattr(obj, field_name)
+                            obj_json_value = obj_json_dump.get(field_name)
                             po = get_extra_field(model_field, "priority_order")
                             vip_type = get_extra_field(model_field, "vip_type")
                             merge(
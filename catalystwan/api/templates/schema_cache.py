@@ -0,0 +1,120 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from catalystwan.api.templates.feature_template_field import FeatureTemplateField
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaKey(NamedTuple):
+    template_type: str
+    min_version: str
+    platform_version: str
+
+    @property
+    def filename(self) -> str:
+        return "-".join(part.replace(os.sep, "_") or "unknown" for part in self) + ".json"
+
+
+@dataclass
+class SchemaEntry:
+    schema: Any
+    _fields: Optional[List[FeatureTemplateField]] = field(default=None, repr=False)
+
+    @property
+    def fields(self) -> List[FeatureTemplateField]:
+        """Schema fields parsed on first access"""
+        if self._fields is None:
+            self._fields = [FeatureTemplateField(**schema_field) for schema_field in self.schema["fields"]]
+        return self._fields
+
+
+class FeatureTemplateSchemaCache:
+    """Keeps feature template schemas (definitions of template types) downloaded from SD-WAN Manager
+    together with parsed fields. Schemas are identified by template type and version of server,
+    so single cache can be shared by sessions to many servers.
+
+    Args:
+        directory: when given, schemas are also stored in this directory and reused by other processes
+    """
+
+    def __init__(self, directory: Union[Path, str, None] = None):
+        self.directory = Path(directory) if directory is not None else None
+        self._entries: Dict[SchemaKey, SchemaEntry] = {}
+        self._key_locks: Dict[SchemaKey, Lock] = {}
+        self._lock = Lock()
+
+    def get(self, key: SchemaKey, fetch: Callable[[], Any]) -> Any:
+        """Returns cached schema, schema is loaded from disk or fetched only on first request of each key"""
+        return self._entry(key, fetch).schema
+
+    def fields(self, key: SchemaKey, schema: Any) -> List[FeatureTemplateField]:
+        """Returns parsed fields of schema, parsing is cached only for schema returned by this cache for given key"""
+        entry = self._entries.get(key)
+        if entry is None or entry.schema is not schema:
+            return SchemaEntry(schema).fields
+        return entry.fields
+
+    def clear(self) -> None:
+        """Forgets schemas kept in memory (files stored on disk are left)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, key: SchemaKey, fetch: Callable[[], Any]) -> SchemaEntry:
+        if (entry := self._entries.get(key)) is not None:
+            return entry
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+        # concurrent requests of the same schema wait for single download
+        with key_lock:
+            if (entry := self._entries.get(key)) is not None:
+                return entry
+            schema = self._load(key)
+            if schema is None:
+                schema = fetch()
+                self._store(key, schema)
+            entry = SchemaEntry(schema)
+            with self._lock:
+                self._entries[key] = entry
+            return entry
+
+    def _load(self, key: SchemaKey) -> Any:
+        if self.directory is None:
+            return None
+        path = self.directory / key.filename
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.warning(f"Cannot load feature template schema from {path}: {error}")
+            return None
+
+    def _store(self, key: SchemaKey, schema: Any) -> None:
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # written to temporary file first, so other processes never read partially written schema
+            with NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as file:
+                json.dump(schema, file)
+            os.replace(file.name, self.directory / key.filename)
+        except OSError as error:
+            logger.warning(f"Cannot store feature template schema in {self.directory}: {error}")
+
+
+SCHEMA_CACHE = FeatureTemplateSchemaCache()
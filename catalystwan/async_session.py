@@ -0,0 +1,568 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""This module defines AsyncManagerSession which is asyncio counterpart of ManagerSession.
+Session is built on top of httpx.AsyncClient (optional dependency: pip install catalystwan[async]),
+so single event loop can handle large number of concurrent requests to vManage.
+
+Only declarative endpoints (session.endpoints) are available for asynchronous session,
+methods decorated with @request return awaitables:
+>>> import asyncio
+>>> from catalystwan.async_session import create_async_manager_session
+>>>
+>>>
+>>> async def main():
+>>>     async with await create_async_manager_session(url, username, password) as session:
+>>>         devices = await session.endpoints.monitoring_device_details.list_all_devices()
+>>>         await asyncio.gather(*[session.get("/dataservice/device/counters") for device in devices])
+>>>
+>>>
+>>> asyncio.run(main())
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Callable, ClassVar, Dict, Generator, Optional, Union
+from urllib.parse import urljoin
+
+import httpx
+from packaging.version import Version  # type: ignore
+
+from catalystwan import USER_AGENT
+from catalystwan.endpoints.client import AboutInfo, ServerInfo
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+from catalystwan.exceptions import (
+    DefaultPasswordError,
+    ManagerHTTPError,
+    ManagerReadyTimeout,
+    ManagerRequestException,
+    SessionNotCreatedError,
+    TenantSubdomainNotFound,
+)
+from catalystwan.models.tenant import Tenant
+from catalystwan.response import ManagerResponsePayload
+from catalystwan.session import ManagerSessionState, UserMode, create_base_url, determine_session_type
+from catalystwan.utils.session_type import SessionType
+from catalystwan.version import NullVersion, parse_api_version
+from catalystwan.vmanage_auth import UnauthorizedAccessError
+
+
+async def create_async_manager_session(
+    url: str,
+    username: str,
+    password: str,
+    port: Optional[int] = None,
+    subdomain: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+    limits: Optional[httpx.Limits] = None,
+) -> AsyncManagerSession:
+    """Factory coroutine that creates asynchronous session object and performs login according to parameters
+
+    Args:
+        url (str): IP address or domain name
+        username (str): username
+        password (str): password
+        port (int): port
+        subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
+            works only on provider user mode
+        logger: override default module logger
+        limits: override default httpx connection pool limits
+
+    Returns:
+        AsyncManagerSession: logged-in and operative session to perform tasks on SDWAN Manager.
+    """
+    session = AsyncManagerSession(
+        url=url, username=username, password=password, port=port, subdomain=subdomain, limits=limits
+    )
+
+    if logger:
+        session.logger = logger
+
+    await session.enter_state(ManagerSessionState.LOGIN)
+    await session.on_session_create_hook()
+    return session
+
+
+class AsyncManagerResponse(ManagerResponsePayload):
+    """Wraps httpx.Response object with methods specific to vManage.
+    Provides the same parsing methods as ManagerResponse"""
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.headers = response.headers
+        self.status_code = response.status_code
+        self.jsessionid_expired = self._detect_expired_jsessionid()
+
+    def _decode_json(self) -> Any:
+        return self.response.json()
+
+    @property
+    def request(self) -> httpx.Request:
+        return self.response.request
+
+    @property
+    def url(self) -> str:
+        return str(self.response.url)
+
+    @property
+    def text(self) -> str:
+        return self.response.text
+
+    @property
+    def content(self) -> bytes:
+        return self.response.content
+
+    @property
+    def ok(self) -> bool:
+        return not self.response.is_error
+
+    def json(self) -> Any:
+        return self._cached_json()
+
+
+class vManageAsyncAuth(httpx.Auth):
+    """Attaches vManage Authentication to the requests sent by httpx client.
+
+    Port of catalystwan.vmanage_auth.vManageAuth for asynchronous session.
+    Login procedure (obtaining JSESSIONID cookie and XSRF token) is awaited explicitly by session,
+    this way concurrent coroutines can wait for single login.
+
+    Attributes:
+        base_url (str): url (with port if applicable) f.e. https://1.1.1.1:1111
+        username (str): vManage username
+        password (str): vManage user's password
+        token (str): Access token
+    """
+
+    def __init__(self, base_url: str, username: str, password: str):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.set_cookie = httpx.Cookies()
+        self.token: str = ""
+        self.logger = logging.getLogger(__name__)
+
+    async def get_cookie(self, client: httpx.AsyncClient) -> httpx.Cookies:
+        """Check whether a user is successfully authenticated.
+
+        If a user is successfully authenticated, the response body is empty and a valid session cookie is set.
+
+        Raises:
+            UnauthorizedAccessError: wrong username/password or user not authorized to access vManage
+
+        Returns:
+            httpx.Cookies: received cookies
+        """
+        security_payload = {
+            "j_username": self.username,
+            "j_password": self.password,
+        }
+        full_url = urljoin(self.base_url, "/j_security_check")
+        headers = {"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT}
+        response = await client.post(
+            url=full_url, data=security_payload, headers=headers, auth=None  # type: ignore[arg-type]
+        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response, include_reponse_text=True))
+        if response.text != "":
+            raise UnauthorizedAccessError(self.username, self.password)
+        return response.cookies
+
+    async def fetch_token(self, client: httpx.AsyncClient) -> str:
+        """Fetches vManage REST API token using cookies stored in client.
+
+        Returns:
+            str: Valid token.
+        """
+        full_url = urljoin(self.base_url, "/dataservice/client/token")
+        headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT}
+        response = await client.get(url=full_url, headers=headers, auth=None)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response))
+        return response.text
+
+    async def authenticate(self, client: httpx.AsyncClient) -> None:
+        self.set_cookie = await self.get_cookie(client)
+        self.token = await self.fetch_token(client)
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["x-xsrf-token"] = self.token
+        yield request
+
+    def _auth_request_debug(self, response: httpx.Response, include_reponse_text: bool = False) -> str:
+        msg = (
+            f"Authenticating: {self.username} {response.request.method} {response.request.url} <{response.status_code}>"
+        )
+        if include_reponse_text and response.text:
+            msg += f" response.text: {response.text}"
+        return msg
+
+
+class AsyncManagerSession:
+    """Asynchronous session for vManage client.
+
+    Handles session connectivity available for provider, provider as tenant, and tenant in the same way
+    as ManagerSession does: login, relogin on expired JSESSIONID and waiting for server restart.
+
+    Args:
+        url: IP address or domain name, i.e. '10.0.1.200' or 'example.com'
+        port: port
+        username: username
+        password: password
+        limits: httpx connection pool limits
+
+    Attributes:
+        enable_relogin (bool): defaults to True, in case that session is not properly logged-in, session will try to
+            relogin and try the same request again
+        endpoints (APIEndpointContainter): declarative endpoints, decorated methods return awaitables
+    """
+
+    on_session_create_hook: ClassVar[Callable[[AsyncManagerSession], Any]] = lambda *args: asyncio.sleep(0)
+
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        verify: bool = False,
+        port: Optional[int] = None,
+        subdomain: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Union[httpx.Timeout, float, None] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.url = url
+        self.port = port
+        self.base_url = create_base_url(url, port)
+        self.username = username
+        self.password = password
+        self.subdomain = subdomain
+        self._session_type = SessionType.NOT_DEFINED
+        self.server_name: Optional[str] = None
+        self.logger = logging.getLogger(__name__)
+        self.enable_relogin: bool = True
+        self.auth: Optional[vManageAsyncAuth] = None
+        self.client = httpx.AsyncClient(
+            verify=verify,
+            headers={"User-Agent": USER_AGENT},
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=timeout,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.endpoints = APIEndpointContainter(self)  # type: ignore[arg-type]
+        self._platform_version: str = ""
+        self._api_version: Version = NullVersion  # type: ignore
+        self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._login_generation: int = 0
+        self.restart_timeout: int = 1200
+        self.polling_requests_timeout: int = 10
+
+    @property
+    def state(self) -> ManagerSessionState:
+        return self._state
+
+    async def enter_state(self, state: ManagerSessionState) -> None:
+        """Resets the session to given state and manages transition to desired OPERATIONAL state"""
+        self._state = state
+        self.logger.debug(f"Session entered state: {self.state.name}")
+
+        if state == ManagerSessionState.OPERATIVE:
+            # this is desired state, nothing to be done
+            return
+        elif state == ManagerSessionState.RESTART_IMMINENT:
+            # in this state we process requests normally
+            # but when ConnectError is caught we enter WAIT_SERVER_READY_AFTER_RESTART
+            # state change is achieved with cooperation with request method
+            return
+        elif state == ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART:
+            await self.wait_server_ready(self.restart_timeout)
+            await self.enter_state(ManagerSessionState.LOGIN)
+        elif state == ManagerSessionState.LOGIN:
+            await self.login()
+            await self.enter_state(ManagerSessionState.OPERATIVE)
+        return
+
+    def restart_imminent(self, restart_timeout_override: Optional[int] = None):
+        """Notify session that restart is imminent.
+        ConnectError and status code 503 will cause session to wait for connectivity and perform login again
+
+        Args:
+            restart_timeout_override (Optional[int], optional): override session property which controls restart timeout
+        """
+        if restart_timeout_override is not None:
+            self.restart_timeout = restart_timeout_override
+        self._state = ManagerSessionState.RESTART_IMMINENT
+
+    async def login(self) -> AsyncManagerSession:
+        """Performs login to SDWAN Manager and fetches important server info to instance variables
+
+        Raises:
+            SessionNotCreatedError: indicates session configuration is not consistent
+
+        Returns:
+            AsyncManagerSession: (self)
+        """
+        self.client.cookies.clear()
+        self.client.headers.pop("VSessionId", None)
+        self.auth = vManageAsyncAuth(self.base_url, self.username, self.password)
+        self.auth.logger = self.logger
+        await self.auth.authenticate(self.client)
+        self.client.auth = self.auth
+
+        if self.subdomain:
+            tenant_id = await self.get_tenant_id()
+            vsession_id = await self.get_virtual_session_id(tenant_id)
+            self.client.headers.update({"VSessionId": vsession_id})
+        try:
+            server_info = await self.server()
+        except DefaultPasswordError:
+            server_info = ServerInfo.parse_obj({})
+
+        self.server_name = server_info.server
+
+        tenancy_mode = server_info.tenancy_mode
+        user_mode = server_info.user_mode
+        view_mode = server_info.view_mode
+
+        self._session_type = determine_session_type(tenancy_mode, user_mode, view_mode)
+        if user_mode is UserMode.TENANT and self.subdomain:
+            raise SessionNotCreatedError(
+                f"Session not created. Subdomain {self.subdomain} passed to tenant session, "
+                "cannot switch to tenant from tenant user mode."
+            )
+        elif self._session_type is SessionType.NOT_DEFINED:
+            self.logger.warning(
+                "Cannot determine session type for "
+                f"tenancy-mode: {tenancy_mode}, user-mode: {user_mode}, view-mode: {view_mode}"
+            )
+
+        self.logger.info(
+            f"Logged to vManage({self.platform_version}) as {self.username}. The session type is {self.session_type}"
+        )
+        self._login_generation += 1
+        return self
+
+    async def _relogin(self, login_generation: int) -> None:
+        """Performs single login for all coroutines which detected expired session at the same time.
+        Login is skipped when other coroutine already logged-in after given login generation was observed"""
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if self._login_generation == login_generation:
+                self.logger.warning("Logging to session. Reason: expired JSESSIONID detected in response headers")
+                await self.enter_state(ManagerSessionState.LOGIN)
+
+    async def wait_server_ready(self, timeout: int, poll_period: int = 10) -> None:
+        """Waits until server is ready for API requests with given timeout in seconds"""
+
+        begin = monotonic()
+        self.logger.info(f"Waiting for server ready with timeout {timeout} seconds.")
+
+        def elapsed() -> float:
+            return monotonic() - begin
+
+        # wait for http available
+        while elapsed() < timeout:
+            available = False
+            try:
+                resp = await self.client.head(
+                    self.base_url, timeout=self.polling_requests_timeout, auth=None  # type: ignore[arg-type]
+                )
+                if resp.status_code != 503:
+                    available = True
+            except httpx.TransportError as error:
+                self.logger.debug(error)
+            if not available:
+                await asyncio.sleep(poll_period)
+                continue
+            break
+
+        # wait server ready flag
+        server_ready_url = self.get_full_url("/dataservice/client/server/ready")
+        while elapsed() < timeout:
+            try:
+                resp = await self.client.get(server_ready_url, timeout=self.polling_requests_timeout, auth=None)
+                if resp.status_code == 200:
+                    if resp.json().get("isServerReady") is True:
+                        self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
+                        return
+                await asyncio.sleep(poll_period)
+                continue
+            except httpx.HTTPError as exception:
+                self.logger.debug(exception)
+                raise ManagerRequestException(str(exception), request=_exception_request(exception))
+
+        raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
+
+    async def request(self, method: str, url: str, **kwargs) -> AsyncManagerResponse:
+        full_url = self.get_full_url(url)
+        login_generation = self._login_generation
+        try:
+            response = AsyncManagerResponse(
+                await self.client.request(method, full_url, **self._adapt_request_kwargs(kwargs))
+            )
+            self.logger.debug("%s %s <%s>", method, full_url, response.status_code)
+            if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
+                await self.enter_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+        except httpx.HTTPError as exception:
+            self.logger.debug(exception)
+            if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(exception, httpx.ConnectError):
+                await self.enter_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+                return await self.request(method, url, **kwargs)
+            raise ManagerRequestException(str(exception), request=_exception_request(exception))
+
+        if self.enable_relogin and response.jsessionid_expired and self.state == ManagerSessionState.OPERATIVE:
+            await self._relogin(login_generation)
+            return await self.request(method, url, **kwargs)
+
+        if "passwordReset.html" in response.url:
+            raise DefaultPasswordError("Password must be changed to use this session.")
+
+        if response.response.is_error:
+            error_info = response.get_error_info()
+            raise ManagerHTTPError(error_info=error_info, request=response.request, response=response)
+        return response
+
+    @staticmethod
+    def _adapt_request_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Adapts keyword arguments accepted by requests.Session.request to httpx.AsyncClient.request"""
+        _kwargs = dict(kwargs)
+        if isinstance(data := _kwargs.get("data"), (str, bytes)):
+            _kwargs["content"] = _kwargs.pop("data")
+        elif data is None:
+            _kwargs.pop("data", None)
+        _kwargs.pop("verify", None)
+        _kwargs.pop("stream", None)
+        _kwargs.pop("idempotent", None)  # retry and cache hints supported by ManagerSession only
+        _kwargs.pop("cache_ttl", None)
+        return _kwargs
+
+    async def get(self, url: str, **kwargs) -> AsyncManagerResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncManagerResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> AsyncManagerResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncManagerResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    def get_full_url(self, url_path: str) -> str:
+        """Returns base API url plus given url path."""
+        return urljoin(self.base_url, url_path)
+
+    async def about(self) -> AboutInfo:
+        return await self.endpoints.client.about()  # type: ignore[misc]
+
+    async def server(self) -> ServerInfo:
+        server_info: ServerInfo = await self.endpoints.client.server()  # type: ignore[misc]
+        self.platform_version = server_info.platform_version
+        return server_info
+
+    async def get_data(self, url: str) -> Any:
+        return (await self.get_json(url))["data"]
+
+    async def get_json(self, url: str) -> Any:
+        response = await self.get(url)
+        return response.json()
+
+    async def get_tenant_id(self) -> str:
+        """Gets tenant UUID for its subdomain.
+
+        Returns:
+            Tenant UUID.
+        """
+        tenants = (await self.get("dataservice/tenant")).dataseq(Tenant)
+        tenant = tenants.filter(subdomain=self.subdomain).single_or_default()
+
+        if not tenant or not tenant.tenant_id:
+            raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {self.subdomain} not found")
+
+        return tenant.tenant_id
+
+    async def get_virtual_session_id(self, tenant_id: str) -> str:
+        """Get VSessionId for a specific tenant
+
+        Args:
+            tenant_id: provider or tenant UUID
+        Returns:
+            Virtual session token
+        """
+        url_path = f"/dataservice/tenant/{tenant_id}/vsessionid"
+        response = await self.post(url_path)
+        return response.json()["VSessionId"]
+
+    async def logout(self) -> Optional[AsyncManagerResponse]:
+        response = None
+        if isinstance((version := self.api_version), NullVersion):
+            self.logger.warning("Cannot perform logout operation without known api_version.")
+            return response
+        else:
+            # disable automatic relogin before performing logout request
+            _relogin = self.enable_relogin
+            try:
+                self.enable_relogin = False
+                if version >= Version("20.12"):
+                    response = await self.post("/logout")
+                else:
+                    response = await self.get("/logout")
+            finally:
+                # restore original setting after performing logout request
+                self.enable_relogin = _relogin
+        return response
+
+    async def close(self) -> None:
+        """Closes the AsyncManagerSession.
+
+        Firstly it cleans up any resources associated with vManage.
+        Then it closes underlying httpx client and all pooled connections.
+        """
+        try:
+            await self.logout()
+        finally:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncManagerSession:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session_type(self) -> SessionType:
+        return self._session_type
+
+    @property
+    def platform_version(self) -> str:
+        return self._platform_version
+
+    @platform_version.setter
+    def platform_version(self, version: str):
+        self._platform_version = version
+        self._api_version = parse_api_version(version)
+
+    @property
+    def api_version(self) -> Version:
+        return self._api_version
+
+    def __str__(self) -> str:
+        return f"{self.username}@{self.base_url}"
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}('{self.url}', '{self.username}', '{self.password}', port={self.port}, "
+            f"subdomain='{self.subdomain}')"
+        )
+
+
+def _exception_request(exception: httpx.HTTPError) -> Optional[httpx.Request]:
+    """Returns request attached to httpx exception (accessing missing request raises RuntimeError)"""
+    try:
+        return exception.request
+    except RuntimeError:
+        return None
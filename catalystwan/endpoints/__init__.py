@@ -27,6 +27,10 @@ Method decorated with @request has no body, as decorator constructs and sends re
 To send request instantiate API with logged ManagerSession:
 >>> api = TenantManagementAPI(session)
 >>> api.delete_tenant_async_bulk(TenantBulkDeleteRequest(password="", tenantIdList=["TNT00005"]))
+
+When API is instantiated with AsyncManagerSession decorated methods return awaitables:
+>>> api = TenantManagementAPI(async_session)
+>>> await api.delete_tenant_async_bulk(TenantBulkDeleteRequest(password="", tenantIdList=["TNT00005"]))
 """
 from __future__ import annotations
 
@@ -34,11 +38,12 @@ import json
 import logging
 from dataclasses import dataclass, fields
 from enum import Enum
-from inspect import _empty, isclass, signature
+from inspect import _empty, isawaitable, isclass, signature
 from io import BufferedReader
 from string import Formatter
 from typing import (
     Any,
+    Awaitable,
     BinaryIO,
     ClassVar,
     Dict,
@@ -64,8 +69,9 @@ from pydantic import BaseModel as BaseModelV2
 from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import Annotated, get_args, get_origin
 
-from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse
+from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse, AsyncAPIEndpointClient
 from catalystwan.exceptions import APIEndpointError, APIRequestPayloadTypeError, APIVersionError, APIViewError
+from catalystwan.metrics import current_endpoint
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.session_type import SessionType
 
@@ -212,7 +218,7 @@ class APIEndpoints:
             return params.model_dump(exclude_none=True, by_alias=True)
         return params
 
-    def __init__(self, client: APIEndpointClient):
+    def __init__(self, client: Union[APIEndpointClient, AsyncAPIEndpointClient]):
         self._client = client
         self._basepath = BASE_PATH
 
@@ -224,8 +230,8 @@ class APIEndpoints:
         params: Optional[RequestParamsType] = None,
         force_json_payload: bool = False,
         **kwargs,
-    ) -> APIEndpointClientResponse:
-        """Prepares and sends request using client protocol"""
+    ) -> Union[APIEndpointClientResponse, Awaitable[APIEndpointClientResponse]]:
+        """Prepares and sends request using client protocol (returns awaitable response for asynchronous client)"""
         _kwargs = dict(kwargs)
         if payload is not None:
             _kwargs.update(self._prepare_payload(payload, force_json_payload).asdict())
@@ -326,6 +332,8 @@ class request(APIEndpointsDecorator):
     Decorator to annotate endpoints with HTTP method, URL and optionally json key from which
     modelled data will be parsed (usually "data", but defaults to whole json payload).
     Additional kwargs can be injected which will be passed to request method (eg. custom headers)
+    ManagerSession also accepts "cache_ttl" (seconds for which response can be cached, see response_cache)
+    and "idempotent" (marks non-GET request as safe to retry, see retry_policy)
 
     Decorated method parameters and return type annotations are checked:
 
@@ -535,6 +543,36 @@ class request(APIEndpointsDecorator):
         all_args_dict.pop("self", None)
         return all_args_dict
 
+    def parse_response(self, response: APIEndpointClientResponse) -> Any:
+        """Converts received response to decorated method return type"""
+        if self.return_spec.present:
+            if self.return_spec.is_json:
+                full_json = response.json()
+                if self.resp_json_key is not None:
+                    if isinstance(full_json, dict):
+                        return full_json.get(self.resp_json_key)
+                    else:
+                        raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
+                return full_json
+            if self.return_spec.payload_type is None:
+                pass
+            elif issubclass(self.return_spec.payload_type, (BaseModelV1, BaseModelV2)):
+                if self.return_spec.sequence_type == DataSequence:
+                    return response.dataseq(self.return_spec.payload_type, self.resp_json_key)
+                else:
+                    return response.dataobj(self.return_spec.payload_type, self.resp_json_key)
+            elif issubclass(self.return_spec.payload_type, str):
+                return response.text
+            elif issubclass(self.return_spec.payload_type, bytes):
+                return response.content
+            elif issubclass(self.return_spec.payload_type, dict):
+                return response.json()
+        return None
+
+    async def parse_response_async(self, response: Awaitable[APIEndpointClientResponse]) -> Any:
+        """Awaits response sent by asynchronous client and converts it to decorated method return type"""
+        return self.parse_response(await response)
+
     def __call__(self, func):
         original_func = getattr(func, "_ofunc", func)  # grab original function
         self.sig = signature(original_func)
@@ -559,36 +597,21 @@ class request(APIEndpointsDecorator):
             params = _kwargs.get("params")
             url_kwargs = dict_values_to_str(self.url_field_names, _kwargs)
             formatted_url = self.url.format_map(url_kwargs)
-            response = _self._request(
-                self.http_method,
-                formatted_url,
-                payload=payload,
-                force_json_payload=self.payload_spec.is_json,
-                params=params,
-                **self.kwargs,
-            )
-            if self.return_spec.present:
-                if self.return_spec.is_json:
-                    full_json = response.json()
-                    if self.resp_json_key is not None:
-                        if isinstance(full_json, dict):
-                            return full_json.get(self.resp_json_key)
-                        else:
-                            raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
-                    return full_json
-                if self.return_spec.payload_type is None:
-                    pass
-                elif issubclass(self.return_spec.payload_type, (BaseModelV1, BaseModelV2)):
-                    if self.return_spec.sequence_type == DataSequence:
-                        return response.dataseq(self.return_spec.payload_type, self.resp_json_key)
-                    else:
-                        return response.dataobj(self.return_spec.payload_type, self.resp_json_key)
-                elif issubclass(self.return_spec.payload_type, str):
-                    return response.text
-                elif issubclass(self.return_spec.payload_type, bytes):
-                    return response.content
-                elif issubclass(self.return_spec.payload_type, dict):
-                    return response.json()
+            endpoint = current_endpoint.set(original_func.__qualname__)  # labels metrics reported by session
+            try:
+                response = _self._request(
+                    self.http_method,
+                    formatted_url,
+                    payload=payload,
+                    force_json_payload=self.payload_spec.is_json,
+                    params=params,
+                    **self.kwargs,
+                )
+                if isawaitable(response):
+                    return self.parse_response_async(response)
+                return self.parse_response(response)
+            finally:
+                current_endpoint.reset(endpoint)
 
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
         return wrapper
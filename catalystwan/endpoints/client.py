@@ -64,7 +64,7 @@ class ServerReady(BaseModel):
 
 
 class Client(APIEndpoints):
-    @get("/client/server", "data")
+    @get("/client/server", "data", cache_ttl=300)
     def server(self) -> ServerInfo:
         ...
 
@@ -72,6 +72,6 @@ class Client(APIEndpoints):
     def server_ready(self) -> ServerReady:
         ...
 
-    @get("/client/about", "data")
+    @get("/client/about", "data", cache_ttl=300)
     def about(self) -> AboutInfo:
         ...
@@ -44,7 +44,7 @@ class ConfigurationPolicyApplicationList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> AppListInfo:
         ...
 
-    @get("/template/policy/list/app", "data")
+    @get("/template/policy/list/app", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[AppListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyAppProbeClassList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> AppProbeClassListInfo:
         ...
 
-    @get("/template/policy/list/appprobe", "data")
+    @get("/template/policy/list/appprobe", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[AppProbeClassListInfo]:
         ...
 
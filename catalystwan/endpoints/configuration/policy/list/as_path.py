@@ -44,7 +44,7 @@ class ConfigurationPolicyASPathList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> ASPathListInfo:
         ...
 
-    @get("/template/policy/list/aspath", "data")
+    @get("/template/policy/list/aspath", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ASPathListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyForwardingClassList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> ClassMapListInfo:
         ...
 
-    @get("/template/policy/list/class", "data")
+    @get("/template/policy/list/class", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ClassMapListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyColorList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> ColorListInfo:
         ...
 
-    @get("/template/policy/list/color", "data")
+    @get("/template/policy/list/color", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ColorListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyCommunityList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> CommunityListInfo:
         ...
 
-    @get("/template/policy/list/community", "data")
+    @get("/template/policy/list/community", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[CommunityListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyDataIPv6PrefixList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> DataIPv6PrefixListInfo:
         ...
 
-    @get("/template/policy/list/dataipv6prefix", "data")
+    @get("/template/policy/list/dataipv6prefix", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[DataIPv6PrefixListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyDataPrefixList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> DataPrefixListInfo:
         ...
 
-    @get("/template/policy/list/dataprefix", "data")
+    @get("/template/policy/list/dataprefix", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[DataPrefixListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyExpandedCommunityList(APIEndpoints, PolicyListEndpoints
     def get_lists_by_id(self, id: UUID) -> ExpandedCommunityListInfo:
         ...
 
-    @get("/template/policy/list/expandedcommunity", "data")
+    @get("/template/policy/list/expandedcommunity", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ExpandedCommunityListInfo]:
         ...
 
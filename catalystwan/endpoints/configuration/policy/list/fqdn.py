@@ -44,7 +44,7 @@ class ConfigurationPolicyFQDNList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> FQDNListInfo:
         ...
 
-    @get("/template/policy/list/fqdn", "data")
+    @get("/template/policy/list/fqdn", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[FQDNListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyGeoLocationList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> GeoLocationListInfo:
         ...
 
-    @get("/template/policy/list/geolocation", "data")
+    @get("/template/policy/list/geolocation", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[GeoLocationListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyIPSSignatureList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> IPSSignatureListInfo:
         ...
 
-    @get("/template/policy/list/ipssignature", "data")
+    @get("/template/policy/list/ipssignature", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[IPSSignatureListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyIPv6PrefixList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> IPv6PrefixListInfo:
         ...
 
-    @get("/template/policy/list/ipv6prefix", "data")
+    @get("/template/policy/list/ipv6prefix", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[IPv6PrefixListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyLocalAppList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> LocalAppListInfo:
         ...
 
-    @get("/template/policy/list/localapp", "data")
+    @get("/template/policy/list/localapp", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[LocalAppListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyLocalDomainList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> LocalDomainListInfo:
         ...
 
-    @get("/template/policy/list/localdomain", "data")
+    @get("/template/policy/list/localdomain", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[LocalDomainListInfo]:
         ...
 
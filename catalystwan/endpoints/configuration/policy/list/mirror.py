@@ -44,7 +44,7 @@ class ConfigurationPolicyMirrorList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> MirrorListInfo:
         ...
 
-    @get("/template/policy/list/mirror", "data")
+    @get("/template/policy/list/mirror", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[MirrorListInfo]:
         ...
 
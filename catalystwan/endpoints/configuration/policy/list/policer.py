@@ -44,7 +44,7 @@ class ConfigurationPolicyPolicerClassList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> PolicerListInfo:
         ...
 
-    @get("/template/policy/list/policer", "data")
+    @get("/template/policy/list/policer", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[PolicerListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPolicyPortList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> PortListInfo:
         ...
 
-    @get("/template/policy/list/port", "data")
+    @get("/template/policy/list/port", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[PortListInfo]:
         ...
 
@@ -44,7 +44,7 @@ class ConfigurationPreferredColorGroupList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> PreferredColorGroupListInfo:
         ...
 
-    @get("/template/policy/list/preferredcolorgroup", "data")
+    @get("/template/policy/list/preferredcolorgroup", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[PreferredColorGroupListInfo]:
         ...
 
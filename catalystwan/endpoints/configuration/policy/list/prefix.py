@@ -44,7 +44,7 @@ class ConfigurationPolicyPrefixList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> PrefixListInfo:
         ...
 
-    @get("/template/policy/list/prefix", "data")
+    @get("/template/policy/list/prefix", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[PrefixListInfo]:
         ...
 
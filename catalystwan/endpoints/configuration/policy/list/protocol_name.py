@@ -44,7 +44,7 @@ class ConfigurationPolicyProtocolNameList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> ProtocolNameListInfo:
         ...
 
-    @get("/template/policy/list/protocolname", "data")
+    @get("/template/policy/list/protocolname", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ProtocolNameListInfo]:
         ...
 
@@ -38,7 +38,7 @@ class ConfigurationPolicyRegionList(APIEndpoints):
     def get_lists_by_id(self, id: UUID) -> RegionListInfo:
         ...
 
-    @get("/template/policy/list/region", "data")
+    @get("/template/policy/list/region", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[RegionListInfo]:
         ...
 
@@ -48,7 +48,7 @@ class ConfigurationPolicySiteList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> SiteListInfo:
         ...
 
-    @get("/template/policy/list/site", "data")
+    @get("/template/policy/list/site", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[SiteListInfo]:
         ...
 
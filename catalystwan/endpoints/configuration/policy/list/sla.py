@@ -44,7 +44,7 @@ class ConfigurationPolicySLAClassList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> SLAClassListInfo:
         ...
 
-    @get("/template/policy/list/sla", "data")
+    @get("/template/policy/list/sla", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[SLAClassListInfo]:
         ...
 
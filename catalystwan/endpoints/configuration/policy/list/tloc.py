@@ -44,7 +44,7 @@ class ConfigurationPolicyTLOCList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> TLOCListInfo:
         ...
 
-    @get("/template/policy/list/tloc", "data")
+    @get("/template/policy/list/tloc", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[TLOCListInfo]:
         ...
 
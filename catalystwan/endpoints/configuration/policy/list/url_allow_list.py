@@ -44,7 +44,7 @@ class ConfigurationPolicyURLAllowList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> URLAllowListInfo:
         ...
 
-    @get("/template/policy/list/urlwhitelist", "data")
+    @get("/template/policy/list/urlwhitelist", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[URLAllowListInfo]:
         ...
 
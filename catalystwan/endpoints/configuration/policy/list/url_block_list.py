@@ -44,7 +44,7 @@ class ConfigurationPolicyURLBlockList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> URLBlockListInfo:
         ...
 
-    @get("/template/policy/list/urlblacklist", "data")
+    @get("/template/policy/list/urlblacklist", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[URLBlockListInfo]:
         ...
 
@@ -46,7 +46,7 @@ class ConfigurationPolicyVPNList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> VPNListInfo:
         ...
 
-    @get("/template/policy/list/vpn", "data")
+    @get("/template/policy/list/vpn", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[VPNListInfo]:
         ...
 
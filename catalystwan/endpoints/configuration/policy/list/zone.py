@@ -44,7 +44,7 @@ class ConfigurationPolicyZoneList(APIEndpoints, PolicyListEndpoints):
     def get_lists_by_id(self, id: UUID) -> ZoneListInfo:
         ...
 
-    @get("/template/policy/list/zone", "data")
+    @get("/template/policy/list/zone", "data", cache_ttl=60)
     def get_policy_lists(self) -> DataSequence[ZoneListInfo]:
         ...
 
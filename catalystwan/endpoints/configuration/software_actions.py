@@ -194,6 +194,6 @@ class ConfigurationSoftwareActions(APIEndpoints):
     def delete_software_from_software_repository(self, version_id: UUID) -> None:
         ...
 
-    @get("/device/action/software/images", "data")
+    @get("/device/action/software/images", "data", cache_ttl=60)
     def get_list_of_all_images(self, params: SoftwareImageQuery) -> DataSequence[SoftwareImageDetails]:
         ...
@@ -1,213 +1,413 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+"""Containers of endpoint classes available as session.endpoints.
+Each member (and module defining it) is created on first access."""
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from catalystwan.endpoints.administration_user_and_group import AdministrationUserAndGroup
-from catalystwan.endpoints.certificate_management_device import CertificateManagementDevice
-from catalystwan.endpoints.certificate_management_vmanage import CertificateManagementVManage
-from catalystwan.endpoints.client import Client
-from catalystwan.endpoints.cluster_management import ClusterManagement
-from catalystwan.endpoints.configuration.device.software_update import ConfigurationDeviceSoftwareUpdate
-from catalystwan.endpoints.configuration.disaster_recovery import ConfigurationDisasterRecovery
-from catalystwan.endpoints.configuration.feature_profile.sdwan.system import SystemFeatureProfile
-from catalystwan.endpoints.configuration.feature_profile.sdwan.transport import TransportFeatureProfile
-from catalystwan.endpoints.configuration.policy.definition.access_control_list import ConfigurationPolicyAclDefinition
-from catalystwan.endpoints.configuration.policy.definition.access_control_list_ipv6 import (
-    ConfigurationPolicyAclIPv6Definition,
-)
-from catalystwan.endpoints.configuration.policy.definition.control import ConfigurationPolicyControlDefinition
-from catalystwan.endpoints.configuration.policy.definition.device_access import (
-    ConfigurationPolicyDeviceAccessDefinition,
-)
-from catalystwan.endpoints.configuration.policy.definition.device_access_ipv6 import (
-    ConfigurationPolicyDeviceAccessIPv6Definition,
-)
-from catalystwan.endpoints.configuration.policy.definition.hub_and_spoke import ConfigurationPolicyHubAndSpokeDefinition
-from catalystwan.endpoints.configuration.policy.definition.mesh import ConfigurationPolicyMeshDefinition
-from catalystwan.endpoints.configuration.policy.definition.qos_map import ConfigurationPolicyQoSMapDefinition
-from catalystwan.endpoints.configuration.policy.definition.rewrite import ConfigurationPolicyRewriteRuleDefinition
-from catalystwan.endpoints.configuration.policy.definition.rule_set import ConfigurationPolicyRuleSetDefinition
-from catalystwan.endpoints.configuration.policy.definition.security_group import (
-    ConfigurationPolicySecurityGroupDefinition,
-)
-from catalystwan.endpoints.configuration.policy.definition.traffic_data import ConfigurationPolicyDataDefinition
-from catalystwan.endpoints.configuration.policy.definition.vpn_membership import (
-    ConfigurationPolicyVPNMembershipGroupDefinition,
-)
-from catalystwan.endpoints.configuration.policy.definition.zone_based_firewall import (
-    ConfigurationPolicyZoneBasedFirewallDefinition,
-)
-from catalystwan.endpoints.configuration.policy.list.app import ConfigurationPolicyApplicationList
-from catalystwan.endpoints.configuration.policy.list.app_probe import ConfigurationPolicyAppProbeClassList
-from catalystwan.endpoints.configuration.policy.list.as_path import ConfigurationPolicyASPathList
-from catalystwan.endpoints.configuration.policy.list.class_map import ConfigurationPolicyForwardingClassList
-from catalystwan.endpoints.configuration.policy.list.color import ConfigurationPolicyColorList
-from catalystwan.endpoints.configuration.policy.list.community import ConfigurationPolicyCommunityList
-from catalystwan.endpoints.configuration.policy.list.data_ipv6_prefix import ConfigurationPolicyDataIPv6PrefixList
-from catalystwan.endpoints.configuration.policy.list.data_prefix import ConfigurationPolicyDataPrefixList
-from catalystwan.endpoints.configuration.policy.list.expanded_community import ConfigurationPolicyExpandedCommunityList
-from catalystwan.endpoints.configuration.policy.list.fqdn import ConfigurationPolicyFQDNList
-from catalystwan.endpoints.configuration.policy.list.geo_location import ConfigurationPolicyGeoLocationList
-from catalystwan.endpoints.configuration.policy.list.ips_signature import ConfigurationPolicyIPSSignatureList
-from catalystwan.endpoints.configuration.policy.list.ipv6_prefix import ConfigurationPolicyIPv6PrefixList
-from catalystwan.endpoints.configuration.policy.list.local_app import ConfigurationPolicyLocalAppList
-from catalystwan.endpoints.configuration.policy.list.local_domain import ConfigurationPolicyLocalDomainList
-from catalystwan.endpoints.configuration.policy.list.mirror import ConfigurationPolicyMirrorList
-from catalystwan.endpoints.configuration.policy.list.policer import ConfigurationPolicyPolicerClassList
-from catalystwan.endpoints.configuration.policy.list.port import ConfigurationPolicyPortList
-from catalystwan.endpoints.configuration.policy.list.preferred_color_group import ConfigurationPreferredColorGroupList
-from catalystwan.endpoints.configuration.policy.list.prefix import ConfigurationPolicyPrefixList
-from catalystwan.endpoints.configuration.policy.list.protocol_name import ConfigurationPolicyProtocolNameList
-from catalystwan.endpoints.configuration.policy.list.region import ConfigurationPolicyRegionList
-from catalystwan.endpoints.configuration.policy.list.site import ConfigurationPolicySiteList
-from catalystwan.endpoints.configuration.policy.list.sla import ConfigurationPolicySLAClassList
-from catalystwan.endpoints.configuration.policy.list.tloc import ConfigurationPolicyTLOCList
-from catalystwan.endpoints.configuration.policy.list.url_allow_list import ConfigurationPolicyURLAllowList
-from catalystwan.endpoints.configuration.policy.list.url_block_list import ConfigurationPolicyURLBlockList
-from catalystwan.endpoints.configuration.policy.list.vpn import ConfigurationPolicyVPNList
-from catalystwan.endpoints.configuration.policy.list.zone import ConfigurationPolicyZoneList
-from catalystwan.endpoints.configuration.policy.security_template import ConfigurationSecurityTemplatePolicy
-from catalystwan.endpoints.configuration.policy.vedge_template import ConfigurationVEdgeTemplatePolicy
-from catalystwan.endpoints.configuration.policy.vsmart_template import ConfigurationVSmartTemplatePolicy
-from catalystwan.endpoints.configuration.software_actions import ConfigurationSoftwareActions
-from catalystwan.endpoints.configuration_dashboard_status import ConfigurationDashboardStatus
-from catalystwan.endpoints.configuration_device_actions import ConfigurationDeviceActions
-from catalystwan.endpoints.configuration_device_inventory import ConfigurationDeviceInventory
-from catalystwan.endpoints.configuration_device_template import ConfigurationDeviceTemplate
-from catalystwan.endpoints.configuration_feature_profile import (
-    ConfigurationFeatureProfile,
-    SDRoutingConfigurationFeatureProfile,
-)
-from catalystwan.endpoints.configuration_group import ConfigurationGroup
-from catalystwan.endpoints.configuration_settings import ConfigurationSettings
-from catalystwan.endpoints.misc import MiscellaneousEndpoints
-from catalystwan.endpoints.monitoring_device_details import MonitoringDeviceDetails
-from catalystwan.endpoints.monitoring_status import MonitoringStatus
-from catalystwan.endpoints.real_time_monitoring.reboot_history import RealTimeMonitoringRebootHistory
-from catalystwan.endpoints.sdavc_cloud_connector import SDAVCCloudConnector
-from catalystwan.endpoints.tenant_backup_restore import TenantBackupRestore
-from catalystwan.endpoints.tenant_management import TenantManagement
-from catalystwan.endpoints.tenant_migration import TenantMigration
-from catalystwan.endpoints.troubleshooting_tools.device_connectivity import TroubleshootingToolsDeviceConnectivity
+from catalystwan.utils.lazy import LazySessionAttribute
 
 if TYPE_CHECKING:
+    from catalystwan.endpoints.administration_user_and_group import AdministrationUserAndGroup
+    from catalystwan.endpoints.certificate_management_device import CertificateManagementDevice
+    from catalystwan.endpoints.certificate_management_vmanage import CertificateManagementVManage
+    from catalystwan.endpoints.client import Client
+    from catalystwan.endpoints.cluster_management import ClusterManagement
+    from catalystwan.endpoints.configuration.device.software_update import ConfigurationDeviceSoftwareUpdate
+    from catalystwan.endpoints.configuration.disaster_recovery import ConfigurationDisasterRecovery
+    from catalystwan.endpoints.configuration.feature_profile.sdwan.system import SystemFeatureProfile
+    from catalystwan.endpoints.configuration.feature_profile.sdwan.transport import TransportFeatureProfile
+    from catalystwan.endpoints.configuration.policy.definition.access_control_list import (
+        ConfigurationPolicyAclDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.access_control_list_ipv6 import (
+        ConfigurationPolicyAclIPv6Definition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.control import ConfigurationPolicyControlDefinition
+    from catalystwan.endpoints.configuration.policy.definition.device_access import (
+        ConfigurationPolicyDeviceAccessDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.device_access_ipv6 import (
+        ConfigurationPolicyDeviceAccessIPv6Definition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.hub_and_spoke import (
+        ConfigurationPolicyHubAndSpokeDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.mesh import ConfigurationPolicyMeshDefinition
+    from catalystwan.endpoints.configuration.policy.definition.qos_map import ConfigurationPolicyQoSMapDefinition
+    from catalystwan.endpoints.configuration.policy.definition.rewrite import ConfigurationPolicyRewriteRuleDefinition
+    from catalystwan.endpoints.configuration.policy.definition.rule_set import ConfigurationPolicyRuleSetDefinition
+    from catalystwan.endpoints.configuration.policy.definition.security_group import (
+        ConfigurationPolicySecurityGroupDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.traffic_data import ConfigurationPolicyDataDefinition
+    from catalystwan.endpoints.configuration.policy.definition.vpn_membership import (
+        ConfigurationPolicyVPNMembershipGroupDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.definition.zone_based_firewall import (
+        ConfigurationPolicyZoneBasedFirewallDefinition,
+    )
+    from catalystwan.endpoints.configuration.policy.list.app import ConfigurationPolicyApplicationList
+    from catalystwan.endpoints.configuration.policy.list.app_probe import ConfigurationPolicyAppProbeClassList
+    from catalystwan.endpoints.configuration.policy.list.as_path import ConfigurationPolicyASPathList
+    from catalystwan.endpoints.configuration.policy.list.class_map import ConfigurationPolicyForwardingClassList
+    from catalystwan.endpoints.configuration.policy.list.color import ConfigurationPolicyColorList
+    from catalystwan.endpoints.configuration.policy.list.community import ConfigurationPolicyCommunityList
+    from catalystwan.endpoints.configuration.policy.list.data_ipv6_prefix import ConfigurationPolicyDataIPv6PrefixList
+    from catalystwan.endpoints.configuration.policy.list.data_prefix import ConfigurationPolicyDataPrefixList
+    from catalystwan.endpoints.configuration.policy.list.expanded_community import (
+        ConfigurationPolicyExpandedCommunityList,
+    )
+    from catalystwan.endpoints.configuration.policy.list.fqdn import ConfigurationPolicyFQDNList
+    from catalystwan.endpoints.configuration.policy.list.geo_location import ConfigurationPolicyGeoLocationList
+    from catalystwan.endpoints.configuration.policy.list.ips_signature import ConfigurationPolicyIPSSignatureList
+    from catalystwan.endpoints.configuration.policy.list.ipv6_prefix import ConfigurationPolicyIPv6PrefixList
+    from catalystwan.endpoints.configuration.policy.list.local_app import ConfigurationPolicyLocalAppList
+    from catalystwan.endpoints.configuration.policy.list.local_domain import ConfigurationPolicyLocalDomainList
+    from catalystwan.endpoints.configuration.policy.list.mirror import ConfigurationPolicyMirrorList
+    from catalystwan.endpoints.configuration.policy.list.policer import ConfigurationPolicyPolicerClassList
+    from catalystwan.endpoints.configuration.policy.list.port import ConfigurationPolicyPortList
+    from catalystwan.endpoints.configuration.policy.list.preferred_color_group import (
+        ConfigurationPreferredColorGroupList,
+    )
+    from catalystwan.endpoints.configuration.policy.list.prefix import ConfigurationPolicyPrefixList
+    from catalystwan.endpoints.configuration.policy.list.protocol_name import ConfigurationPolicyProtocolNameList
+    from catalystwan.endpoints.configuration.policy.list.region import ConfigurationPolicyRegionList
+    from catalystwan.endpoints.configuration.policy.list.site import ConfigurationPolicySiteList
+    from catalystwan.endpoints.configuration.policy.list.sla import ConfigurationPolicySLAClassList
+    from catalystwan.endpoints.configuration.policy.list.tloc import ConfigurationPolicyTLOCList
+    from catalystwan.endpoints.configuration.policy.list.url_allow_list import ConfigurationPolicyURLAllowList
+    from catalystwan.endpoints.configuration.policy.list.url_block_list import ConfigurationPolicyURLBlockList
+    from catalystwan.endpoints.configuration.policy.list.vpn import ConfigurationPolicyVPNList
+    from catalystwan.endpoints.configuration.policy.list.zone import ConfigurationPolicyZoneList
+    from catalystwan.endpoints.configuration.policy.security_template import ConfigurationSecurityTemplatePolicy
+    from catalystwan.endpoints.configuration.policy.vedge_template import ConfigurationVEdgeTemplatePolicy
+    from catalystwan.endpoints.configuration.policy.vsmart_template import ConfigurationVSmartTemplatePolicy
+    from catalystwan.endpoints.configuration.software_actions import ConfigurationSoftwareActions
+    from catalystwan.endpoints.configuration_dashboard_status import ConfigurationDashboardStatus
+    from catalystwan.endpoints.configuration_device_actions import ConfigurationDeviceActions
+    from catalystwan.endpoints.configuration_device_inventory import ConfigurationDeviceInventory
+    from catalystwan.endpoints.configuration_device_template import ConfigurationDeviceTemplate
+    from catalystwan.endpoints.configuration_feature_profile import (
+        ConfigurationFeatureProfile,
+        SDRoutingConfigurationFeatureProfile,
+    )
+    from catalystwan.endpoints.configuration_group import ConfigurationGroup
+    from catalystwan.endpoints.configuration_settings import ConfigurationSettings
+    from catalystwan.endpoints.misc import MiscellaneousEndpoints
+    from catalystwan.endpoints.monitoring_device_details import MonitoringDeviceDetails
+    from catalystwan.endpoints.monitoring_status import MonitoringStatus
+    from catalystwan.endpoints.real_time_monitoring.reboot_history import RealTimeMonitoringRebootHistory
+    from catalystwan.endpoints.sdavc_cloud_connector import SDAVCCloudConnector
+    from catalystwan.endpoints.tenant_backup_restore import TenantBackupRestore
+    from catalystwan.endpoints.tenant_management import TenantManagement
+    from catalystwan.endpoints.tenant_migration import TenantMigration
+    from catalystwan.endpoints.troubleshooting_tools.device_connectivity import TroubleshootingToolsDeviceConnectivity
     from catalystwan.session import ManagerSession
 
 
 class ConfigurationPolicyListContainer:
+    app: LazySessionAttribute[ConfigurationPolicyApplicationList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.app", "ConfigurationPolicyApplicationList"
+    )
+    app_probe: LazySessionAttribute[ConfigurationPolicyAppProbeClassList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.app_probe", "ConfigurationPolicyAppProbeClassList"
+    )
+    as_path: LazySessionAttribute[ConfigurationPolicyASPathList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.as_path", "ConfigurationPolicyASPathList"
+    )
+    class_map: LazySessionAttribute[ConfigurationPolicyForwardingClassList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.class_map", "ConfigurationPolicyForwardingClassList"
+    )
+    color: LazySessionAttribute[ConfigurationPolicyColorList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.color", "ConfigurationPolicyColorList"
+    )
+    community: LazySessionAttribute[ConfigurationPolicyCommunityList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.community", "ConfigurationPolicyCommunityList"
+    )
+    data_ipv6_prefix: LazySessionAttribute[ConfigurationPolicyDataIPv6PrefixList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.data_ipv6_prefix", "ConfigurationPolicyDataIPv6PrefixList"
+    )
+    data_prefix: LazySessionAttribute[ConfigurationPolicyDataPrefixList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.data_prefix", "ConfigurationPolicyDataPrefixList"
+    )
+    expanded_community: LazySessionAttribute[ConfigurationPolicyExpandedCommunityList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.expanded_community", "ConfigurationPolicyExpandedCommunityList"
+    )
+    fqdn: LazySessionAttribute[ConfigurationPolicyFQDNList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.fqdn", "ConfigurationPolicyFQDNList"
+    )
+    geo_location: LazySessionAttribute[ConfigurationPolicyGeoLocationList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.geo_location", "ConfigurationPolicyGeoLocationList"
+    )
+    ips_signature: LazySessionAttribute[ConfigurationPolicyIPSSignatureList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.ips_signature", "ConfigurationPolicyIPSSignatureList"
+    )
+    ipv6_prefix: LazySessionAttribute[ConfigurationPolicyIPv6PrefixList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.ipv6_prefix", "ConfigurationPolicyIPv6PrefixList"
+    )
+    local_app: LazySessionAttribute[ConfigurationPolicyLocalAppList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.local_app", "ConfigurationPolicyLocalAppList"
+    )
+    local_domain: LazySessionAttribute[ConfigurationPolicyLocalDomainList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.local_domain", "ConfigurationPolicyLocalDomainList"
+    )
+    mirror: LazySessionAttribute[ConfigurationPolicyMirrorList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.mirror", "ConfigurationPolicyMirrorList"
+    )
+    policer: LazySessionAttribute[ConfigurationPolicyPolicerClassList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.policer", "ConfigurationPolicyPolicerClassList"
+    )
+    port: LazySessionAttribute[ConfigurationPolicyPortList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.port", "ConfigurationPolicyPortList"
+    )
+    preferred_color_group: LazySessionAttribute[ConfigurationPreferredColorGroupList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.preferred_color_group", "ConfigurationPreferredColorGroupList"
+    )
+    prefix: LazySessionAttribute[ConfigurationPolicyPrefixList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.prefix", "ConfigurationPolicyPrefixList"
+    )
+    protocol_name: LazySessionAttribute[ConfigurationPolicyProtocolNameList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.protocol_name", "ConfigurationPolicyProtocolNameList"
+    )
+    region: LazySessionAttribute[ConfigurationPolicyRegionList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.region", "ConfigurationPolicyRegionList"
+    )
+    site: LazySessionAttribute[ConfigurationPolicySiteList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.site", "ConfigurationPolicySiteList"
+    )
+    sla: LazySessionAttribute[ConfigurationPolicySLAClassList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.sla", "ConfigurationPolicySLAClassList"
+    )
+    tloc: LazySessionAttribute[ConfigurationPolicyTLOCList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.tloc", "ConfigurationPolicyTLOCList"
+    )
+    url_block_list: LazySessionAttribute[ConfigurationPolicyURLBlockList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.url_block_list", "ConfigurationPolicyURLBlockList"
+    )
+    url_allow_list: LazySessionAttribute[ConfigurationPolicyURLAllowList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.url_allow_list", "ConfigurationPolicyURLAllowList"
+    )
+    vpn: LazySessionAttribute[ConfigurationPolicyVPNList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.vpn", "ConfigurationPolicyVPNList"
+    )
+    zone: LazySessionAttribute[ConfigurationPolicyZoneList] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.list.zone", "ConfigurationPolicyZoneList"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.app = ConfigurationPolicyApplicationList(session)
-        self.app_probe = ConfigurationPolicyAppProbeClassList(session)
-        self.as_path = ConfigurationPolicyASPathList(session)
-        self.class_map = ConfigurationPolicyForwardingClassList(session)
-        self.color = ConfigurationPolicyColorList(session)
-        self.community = ConfigurationPolicyCommunityList(session)
-        self.data_ipv6_prefix = ConfigurationPolicyDataIPv6PrefixList(session)
-        self.data_prefix = ConfigurationPolicyDataPrefixList(session)
-        self.expanded_community = ConfigurationPolicyExpandedCommunityList(session)
-        self.fqdn = ConfigurationPolicyFQDNList(session)
-        self.geo_location = ConfigurationPolicyGeoLocationList(session)
-        self.ips_signature = ConfigurationPolicyIPSSignatureList(session)
-        self.ipv6_prefix = ConfigurationPolicyIPv6PrefixList(session)
-        self.local_app = ConfigurationPolicyLocalAppList(session)
-        self.local_domain = ConfigurationPolicyLocalDomainList(session)
-        self.mirror = ConfigurationPolicyMirrorList(session)
-        self.policer = ConfigurationPolicyPolicerClassList(session)
-        self.port = ConfigurationPolicyPortList(session)
-        self.preferred_color_group = ConfigurationPreferredColorGroupList(session)
-        self.prefix = ConfigurationPolicyPrefixList(session)
-        self.protocol_name = ConfigurationPolicyProtocolNameList(session)
-        self.region = ConfigurationPolicyRegionList(session)
-        self.site = ConfigurationPolicySiteList(session)
-        self.sla = ConfigurationPolicySLAClassList(session)
-        self.tloc = ConfigurationPolicyTLOCList(session)
-        self.url_block_list = ConfigurationPolicyURLBlockList(session)
-        self.url_allow_list = ConfigurationPolicyURLAllowList(session)
-        self.vpn = ConfigurationPolicyVPNList(session)
-        self.zone = ConfigurationPolicyZoneList(session)
+        self._session = session
 
 
 class ConfigurationPolicyDefinitionContainer:
+    data: LazySessionAttribute[ConfigurationPolicyDataDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.traffic_data", "ConfigurationPolicyDataDefinition"
+    )
+    rule_set: LazySessionAttribute[ConfigurationPolicyRuleSetDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.rule_set", "ConfigurationPolicyRuleSetDefinition"
+    )
+    security_group: LazySessionAttribute[ConfigurationPolicySecurityGroupDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.security_group",
+        "ConfigurationPolicySecurityGroupDefinition",
+    )
+    zone_based_firewall: LazySessionAttribute[ConfigurationPolicyZoneBasedFirewallDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.zone_based_firewall",
+        "ConfigurationPolicyZoneBasedFirewallDefinition",
+    )
+    qos_map: LazySessionAttribute[ConfigurationPolicyQoSMapDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.qos_map", "ConfigurationPolicyQoSMapDefinition"
+    )
+    rewrite: LazySessionAttribute[ConfigurationPolicyRewriteRuleDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.rewrite", "ConfigurationPolicyRewriteRuleDefinition"
+    )
+    control: LazySessionAttribute[ConfigurationPolicyControlDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.control", "ConfigurationPolicyControlDefinition"
+    )
+    vpn_membership: LazySessionAttribute[ConfigurationPolicyVPNMembershipGroupDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.vpn_membership",
+        "ConfigurationPolicyVPNMembershipGroupDefinition",
+    )
+    hub_and_spoke: LazySessionAttribute[ConfigurationPolicyHubAndSpokeDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.hub_and_spoke",
+        "ConfigurationPolicyHubAndSpokeDefinition",
+    )
+    mesh: LazySessionAttribute[ConfigurationPolicyMeshDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.mesh", "ConfigurationPolicyMeshDefinition"
+    )
+    acl: LazySessionAttribute[ConfigurationPolicyAclDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.access_control_list", "ConfigurationPolicyAclDefinition"
+    )
+    acl_ipv6: LazySessionAttribute[ConfigurationPolicyAclIPv6Definition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.access_control_list_ipv6",
+        "ConfigurationPolicyAclIPv6Definition",
+    )
+    device_access: LazySessionAttribute[ConfigurationPolicyDeviceAccessDefinition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.device_access",
+        "ConfigurationPolicyDeviceAccessDefinition",
+    )
+    device_access_ipv6: LazySessionAttribute[ConfigurationPolicyDeviceAccessIPv6Definition] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.definition.device_access_ipv6",
+        "ConfigurationPolicyDeviceAccessIPv6Definition",
+    )
+
     def __init__(self, session: ManagerSession):
-        self.data = ConfigurationPolicyDataDefinition(session)
-        self.rule_set = ConfigurationPolicyRuleSetDefinition(session)
-        self.security_group = ConfigurationPolicySecurityGroupDefinition(session)
-        self.zone_based_firewall = ConfigurationPolicyZoneBasedFirewallDefinition(session)
-        self.qos_map = ConfigurationPolicyQoSMapDefinition(session)
-        self.rewrite = ConfigurationPolicyRewriteRuleDefinition(session)
-        self.control = ConfigurationPolicyControlDefinition(session)
-        self.vpn_membership = ConfigurationPolicyVPNMembershipGroupDefinition(session)
-        self.hub_and_spoke = ConfigurationPolicyHubAndSpokeDefinition(session)
-        self.mesh = ConfigurationPolicyMeshDefinition(session)
-        self.acl = ConfigurationPolicyAclDefinition(session)
-        self.acl_ipv6 = ConfigurationPolicyAclIPv6Definition(session)
-        self.device_access = ConfigurationPolicyDeviceAccessDefinition(session)
-        self.device_access_ipv6 = ConfigurationPolicyDeviceAccessIPv6Definition(session)
+        self._session = session
 
 
 class ConfigurationPolicyContainer:
+    list: LazySessionAttribute[ConfigurationPolicyListContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationPolicyListContainer"
+    )
+    definition: LazySessionAttribute[ConfigurationPolicyDefinitionContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationPolicyDefinitionContainer"
+    )
+    vsmart_template: LazySessionAttribute[ConfigurationVSmartTemplatePolicy] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.vsmart_template", "ConfigurationVSmartTemplatePolicy"
+    )
+    vedge_template: LazySessionAttribute[ConfigurationVEdgeTemplatePolicy] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.vedge_template", "ConfigurationVEdgeTemplatePolicy"
+    )
+    security_template: LazySessionAttribute[ConfigurationSecurityTemplatePolicy] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.policy.security_template", "ConfigurationSecurityTemplatePolicy"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.list = ConfigurationPolicyListContainer(session)
-        self.definition = ConfigurationPolicyDefinitionContainer(session)
-        self.vsmart_template = ConfigurationVSmartTemplatePolicy(session)
-        self.vedge_template = ConfigurationVEdgeTemplatePolicy(session)
-        self.security_template = ConfigurationSecurityTemplatePolicy(session)
+        self._session = session
 
 
 class ConfigurationSDWANFeatureProfileContainer:
+    transport: LazySessionAttribute[TransportFeatureProfile] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.feature_profile.sdwan.transport", "TransportFeatureProfile"
+    )
+    system: LazySessionAttribute[SystemFeatureProfile] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.feature_profile.sdwan.system", "SystemFeatureProfile"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.transport = TransportFeatureProfile(client=session)
-        self.system = SystemFeatureProfile(client=session)
+        self._session = session
 
 
 class ConfigurationFeatureProfileContainer:
+    sdwan: LazySessionAttribute[ConfigurationSDWANFeatureProfileContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationSDWANFeatureProfileContainer"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.sdwan = ConfigurationSDWANFeatureProfileContainer(session=session)
+        self._session = session
 
 
 class ConfigurationContainer:
+    policy: LazySessionAttribute[ConfigurationPolicyContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationPolicyContainer"
+    )
+    feature_profile: LazySessionAttribute[ConfigurationFeatureProfileContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationFeatureProfileContainer"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.policy = ConfigurationPolicyContainer(session)
-        self.feature_profile = ConfigurationFeatureProfileContainer(session=session)
+        self._session = session
 
 
 class TroubleshootingToolsContainer:
+    device_connectivity: LazySessionAttribute[TroubleshootingToolsDeviceConnectivity] = LazySessionAttribute(
+        "catalystwan.endpoints.troubleshooting_tools.device_connectivity", "TroubleshootingToolsDeviceConnectivity"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.device_connectivity = TroubleshootingToolsDeviceConnectivity(session)
+        self._session = session
 
 
 class RealTimeMonitoringContainer:
+    reboot_history: LazySessionAttribute[RealTimeMonitoringRebootHistory] = LazySessionAttribute(
+        "catalystwan.endpoints.real_time_monitoring.reboot_history", "RealTimeMonitoringRebootHistory"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.reboot_history = RealTimeMonitoringRebootHistory(session)
+        self._session = session
 
 
 class APIEndpointContainter:
+    administration_user_and_group: LazySessionAttribute[AdministrationUserAndGroup] = LazySessionAttribute(
+        "catalystwan.endpoints.administration_user_and_group", "AdministrationUserAndGroup"
+    )
+    certificate_management_vmanage: LazySessionAttribute[CertificateManagementVManage] = LazySessionAttribute(
+        "catalystwan.endpoints.certificate_management_vmanage", "CertificateManagementVManage"
+    )
+    client: LazySessionAttribute[Client] = LazySessionAttribute("catalystwan.endpoints.client", "Client")
+    cluster_management: LazySessionAttribute[ClusterManagement] = LazySessionAttribute(
+        "catalystwan.endpoints.cluster_management", "ClusterManagement"
+    )
+    configuration: LazySessionAttribute[ConfigurationContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "ConfigurationContainer"
+    )
+    configuration_dashboard_status: LazySessionAttribute[ConfigurationDashboardStatus] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_dashboard_status", "ConfigurationDashboardStatus"
+    )
+    configuration_device_actions: LazySessionAttribute[ConfigurationDeviceActions] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_device_actions", "ConfigurationDeviceActions"
+    )
+    configuration_device_software_update: LazySessionAttribute[
+        ConfigurationDeviceSoftwareUpdate
+    ] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.device.software_update", "ConfigurationDeviceSoftwareUpdate"
+    )
+    configuration_device_template: LazySessionAttribute[ConfigurationDeviceTemplate] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_device_template", "ConfigurationDeviceTemplate"
+    )
+    configuration_settings: LazySessionAttribute[ConfigurationSettings] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_settings", "ConfigurationSettings"
+    )
+    configuration_software_actions: LazySessionAttribute[ConfigurationSoftwareActions] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.software_actions", "ConfigurationSoftwareActions"
+    )
+    configuration_disaster_recovery: LazySessionAttribute[ConfigurationDisasterRecovery] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration.disaster_recovery", "ConfigurationDisasterRecovery"
+    )
+    monitoring_device_details: LazySessionAttribute[MonitoringDeviceDetails] = LazySessionAttribute(
+        "catalystwan.endpoints.monitoring_device_details", "MonitoringDeviceDetails"
+    )
+    monitoring_status: LazySessionAttribute[MonitoringStatus] = LazySessionAttribute(
+        "catalystwan.endpoints.monitoring_status", "MonitoringStatus"
+    )
+    sdavc_cloud_connector: LazySessionAttribute[SDAVCCloudConnector] = LazySessionAttribute(
+        "catalystwan.endpoints.sdavc_cloud_connector", "SDAVCCloudConnector"
+    )
+    tenant_backup_restore: LazySessionAttribute[TenantBackupRestore] = LazySessionAttribute(
+        "catalystwan.endpoints.tenant_backup_restore", "TenantBackupRestore"
+    )
+    tenant_management: LazySessionAttribute[TenantManagement] = LazySessionAttribute(
+        "catalystwan.endpoints.tenant_management", "TenantManagement"
+    )
+    tenant_migration: LazySessionAttribute[TenantMigration] = LazySessionAttribute(
+        "catalystwan.endpoints.tenant_migration", "TenantMigration"
+    )
+    configuration_feature_profile: LazySessionAttribute[ConfigurationFeatureProfile] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_feature_profile", "ConfigurationFeatureProfile"
+    )
+    configuration_group: LazySessionAttribute[ConfigurationGroup] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_group", "ConfigurationGroup"
+    )
+    sd_routing_configuration_feature_profile: LazySessionAttribute[
+        SDRoutingConfigurationFeatureProfile
+    ] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_feature_profile", "SDRoutingConfigurationFeatureProfile"
+    )
+    configuration_device_inventory: LazySessionAttribute[ConfigurationDeviceInventory] = LazySessionAttribute(
+        "catalystwan.endpoints.configuration_device_inventory", "ConfigurationDeviceInventory"
+    )
+    troubleshooting_tools: LazySessionAttribute[TroubleshootingToolsContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "TroubleshootingToolsContainer"
+    )
+    misc: LazySessionAttribute[MiscellaneousEndpoints] = LazySessionAttribute(
+        "catalystwan.endpoints.misc", "MiscellaneousEndpoints"
+    )
+    real_time_monitoring: LazySessionAttribute[RealTimeMonitoringContainer] = LazySessionAttribute(
+        "catalystwan.endpoints.endpoints_container", "RealTimeMonitoringContainer"
+    )
+    certificate_management_device: LazySessionAttribute[CertificateManagementDevice] = LazySessionAttribute(
+        "catalystwan.endpoints.certificate_management_device", "CertificateManagementDevice"
+    )
+
     def __init__(self, session: ManagerSession):
-        self.administration_user_and_group = AdministrationUserAndGroup(session)
-        self.certificate_management_vmanage = CertificateManagementVManage(session)
-        self.client = Client(session)
-        self.cluster_management = ClusterManagement(session)
-        self.configuration = ConfigurationContainer(session)
-        self.configuration_dashboard_status = ConfigurationDashboardStatus(session)
-        self.configuration_device_actions = ConfigurationDeviceActions(session)
-        self.configuration_device_software_update = ConfigurationDeviceSoftwareUpdate(session)
-        self.configuration_device_template = ConfigurationDeviceTemplate(session)
-        self.configuration_settings = ConfigurationSettings(session)
-        self.configuration_software_actions = ConfigurationSoftwareActions(session)
-        self.configuration_disaster_recovery = ConfigurationDisasterRecovery(session)
-        self.monitoring_device_details = MonitoringDeviceDetails(session)
-        self.monitoring_status = MonitoringStatus(session)
-        self.sdavc_cloud_connector = SDAVCCloudConnector(session)
-        self.tenant_backup_restore = TenantBackupRestore(session)
-        self.tenant_management = TenantManagement(session)
-        self.tenant_migration = TenantMigration(session)
-        self.configuration_feature_profile = ConfigurationFeatureProfile(session)
-        self.configuration_group = ConfigurationGroup(session)
-        self.sd_routing_configuration_feature_profile = SDRoutingConfigurationFeatureProfile(session)
-        self.configuration_device_inventory = ConfigurationDeviceInventory(session)
-        self.troubleshooting_tools = TroubleshootingToolsContainer(session)
-        self.misc = MiscellaneousEndpoints(session)
-        self.real_time_monitoring = RealTimeMonitoringContainer(session)
-        self.certificate_management_device = CertificateManagementDevice(session)
+        self._session = session
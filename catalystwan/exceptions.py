@@ -91,6 +91,13 @@ class TemplateTypeError(CatalystwanException):
         self.message = f"Template: {name} - wrong template type."
 
 
+class TemplateUndeclaredVariablesError(CatalystwanException):
+    """Used when generated template payload references undeclared variables."""
+
+    def __init__(self, name, variables):
+        self.message = f"Template: {name} - undeclared variables: {', '.join(sorted(variables))}."
+
+
 class AlreadyExistsError(CatalystwanException):
     """Raised when an entity that we attempted to create already exists."""
 
@@ -176,6 +183,12 @@ class ManagerReadyTimeout(CatalystwanException):
     pass
 
 
+class DownloadChecksumError(CatalystwanException):
+    """Raised when checksum of downloaded file does not match expected value"""
+
+    pass
+
+
 class CatalystwanDeprecationWarning(DeprecationWarning):
     """Warning issued when using deprecated features or functionality in the Catalystwan SDK.
 
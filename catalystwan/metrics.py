@@ -0,0 +1,244 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Per-endpoint request metrics reported by ManagerSession.
+
+Sinks attached to session receive counters and observations labelled with endpoint name, which is
+qualified name of method decorated with @request (eg. "DeviceStateEndpoints.get_system_info") or
+"METHOD /path" for requests sent directly by session:
+>>> registry = MetricsRegistry()
+>>> session.metrics_sinks.append(registry)
+>>> DevicesAPI(session).get()
+>>> registry.endpoint_summary()[0]
+EndpointSummary(endpoint='GET /dataservice/device', requests=1, total_seconds=0.12, ...)
+>>> print(registry.to_prometheus())
+
+Reported metrics:
+    requests: counter of sent requests (labels: endpoint, method, status)
+    request_seconds: latency histogram of single request-response exchange
+    request_bytes, response_bytes: counters of request and response body bytes
+    parse_seconds: time spent in parsing response payload to models (dataseq/dataobj)
+    retries: counter of requests repeated by retry policy
+    relogins: counter of requests repeated after session relogin
+"""
+
+from __future__ import annotations
+
+import socket
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+current_endpoint: ContextVar[Optional[str]] = ContextVar("catalystwan_endpoint", default=None)
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """Returns name of endpoint currently being called or method with url path when called directly"""
+    if (endpoint := current_endpoint.get()) is not None:
+        return endpoint
+    return f"{method.upper()} {urlsplit(url).path}"
+
+
+class MetricsSink(Protocol):
+    """Interface to object receiving metrics reported by session"""
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        ...
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        ...
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds of buckets (like Prometheus histogram)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last one counts values above highest bound
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        cumulative = []
+        total = 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+@dataclass
+class EndpointSummary:
+    endpoint: str
+    requests: int
+    total_seconds: float
+    mean_seconds: float
+    request_bytes: int
+    response_bytes: int
+    parse_seconds: float
+    retries: int
+    relogins: int
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    if not labels and not extra:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels + extra) + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe in-process store of metrics which can be rendered in Prometheus text format
+
+    Args:
+        buckets: upper bounds of histogram buckets
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._lock = Lock()
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if (histogram := series.get(key)) is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Returns sum of counter series matching given labels"""
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(value for key, value in self._counters.get(name, {}).items() if wanted <= set(key))
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """Returns histogram with exactly given labels"""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_labels(labels))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def endpoint_summary(self) -> List[EndpointSummary]:
+        """Returns per-endpoint totals sorted by time spent waiting for responses (most expensive first)"""
+        with self._lock:
+            endpoints = {dict(key)["endpoint"] for key in self._histograms.get("request_seconds", {})}
+        summaries = []
+        for endpoint in endpoints:
+            latency = self.histogram("request_seconds", endpoint=endpoint) or Histogram(())
+            parse = self.histogram("parse_seconds", endpoint=endpoint) or Histogram(())
+            summaries.append(
+                EndpointSummary(
+                    endpoint=endpoint,
+                    requests=latency.count,
+                    total_seconds=latency.sum,
+                    mean_seconds=latency.mean,
+                    request_bytes=int(self.counter("request_bytes", endpoint=endpoint)),
+                    response_bytes=int(self.counter("response_bytes", endpoint=endpoint)),
+                    parse_seconds=parse.sum,
+                    retries=int(self.counter("retries", endpoint=endpoint)),
+                    relogins=int(self.counter("relogins", endpoint=endpoint)),
+                )
+            )
+        return sorted(summaries, key=lambda summary: summary.total_seconds, reverse=True)
+
+    def to_prometheus(self, prefix: str = "catalystwan_") -> str:
+        """Renders metrics in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, counters in sorted(self._counters.items()):
+                metric = f"{prefix}{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(counters.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+            for name, histograms in sorted(self._histograms.items()):
+                metric = f"{prefix}{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(histograms.items(), key=lambda item: item[0]):
+                    bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.cumulative_counts()):
+                        lines.append(f"{metric}_bucket{_format_labels(labels, (('le', bound),))} {count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:g}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class StatsDSink:
+    """Sends metrics to StatsD daemon over UDP (fire and forget)
+
+    Durations (metrics with "_seconds" suffix) are sent as timers in milliseconds, other observations as histograms.
+
+    Args:
+        host: StatsD host
+        port: StatsD port
+        prefix: prefix of metric names
+        tags: send labels as DogStatsD tags, otherwise label values are appended to metric name
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "catalystwan", tags: bool = True):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.tags = tags
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        self._send(name, f"{value:g}|c", labels)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        if name.endswith("_seconds"):
+            self._send(name, f"{value * 1000:g}|ms", labels)
+        else:
+            self._send(name, f"{value:g}|h", labels)
+
+    def format(self, name: str, value: str, labels: Dict[str, str]) -> str:
+        if self.tags:
+            tags = ",".join(f"{label}:{self._sanitize(label_value)}" for label, label_value in sorted(labels.items()))
+            return f"{self.prefix}.{name}:{value}" + (f"|#{tags}" if tags else "")
+        path = ".".join([self.prefix, name] + [self._sanitize(labels[label]) for label in sorted(labels)])
+        return f"{path}:{value}"
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def _send(self, name: str, value: str, labels: Dict[str, str]) -> None:
+        try:
+            self._socket.sendto(self.format(name, value, labels).encode(), self.address)
+        except OSError:
+            pass  # metrics must never break requests
+
+    @staticmethod
+    def _sanitize(value: str) -> str:
+        return "".join(char if char.isalnum() or char in "-_." else "_" for char in value)
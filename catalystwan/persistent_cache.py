@@ -0,0 +1,149 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Response cache persisted in SQLite database, shared between processes.
+
+Short-lived processes (eg. periodic jobs) can skip downloading unchanged data fetched by previous runs
+of endpoints which opt in with cache_ttl:
+>>> session.response_cache = PersistentResponseCache("~/.cache/catalystwan/responses.db")
+>>> session.get("/dataservice/template/device", cache_ttl=0)
+
+Responses are stored as plaintext, so database is created readable by owner only (directory 0700, file 0600).
+
+Responses are stored per server, user and tenant (see ManagerSession.cache_namespace). Responses with ETag or
+Last-Modified header are revalidated with conditional request after ttl expires (zero ttl: on every use),
+other responses are cached only for given ttl.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional, Union
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from catalystwan.response_cache import CacheEntry, CacheKey, ResponseCache, is_related_path, path_segments
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    namespace TEXT NOT NULL,
+    url TEXT NOT NULL,
+    query TEXT NOT NULL,
+    expires REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    encoding TEXT,
+    response_url TEXT,
+    stored REAL NOT NULL,
+    PRIMARY KEY (namespace, url, query)
+)
+"""
+
+NOT_PERSISTED_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "content-length"}
+
+
+class PersistentResponseCache(ResponseCache):
+    """Response cache stored in SQLite database file
+
+    Args:
+        path: database file (created with parent directories when missing, readable by owner only)
+        max_entries: maximum number of stored responses (oldest are evicted)
+        default_ttl: time to live applied to GET requests sent without cache_ttl (not cached when None)
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 10_000, default_ttl: Optional[float] = None):
+        super().__init__(max_entries=max_entries, default_ttl=default_ttl, clock=time)
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+        os.chmod(self.path, 0o600)
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._db_lock = Lock()
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(SCHEMA)
+
+    def __len__(self) -> int:
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._db.close()
+
+    def load(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT expires, etag, last_modified, status_code, headers, content, encoding, response_url "
+                "FROM responses WHERE namespace = ? AND url = ? AND query = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        expires, etag, last_modified, status_code, headers, content, encoding, response_url = row
+        response = Response()
+        response.status_code = status_code
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = content
+        response.encoding = encoding
+        response.url = response_url
+        return CacheEntry(response, expires, etag, last_modified)
+
+    def store(self, key: CacheKey, entry: CacheEntry) -> None:
+        response: Response = entry.response
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in NOT_PERSISTED_HEADERS}
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    entry.expires,
+                    entry.etag,
+                    entry.last_modified,
+                    response.status_code,
+                    json.dumps(headers),
+                    response.content,
+                    response.encoding,
+                    response.url,
+                    time(),
+                ),
+            )
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE rowid IN "
+                "(SELECT rowid FROM responses ORDER BY stored DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.stats.evictions += max(cursor.rowcount, 0)
+
+    def refresh(self, key: CacheKey, entry: CacheEntry, expires: float) -> None:
+        entry.expires = expires
+        with self._db_lock:
+            self._db.execute(
+                "UPDATE responses SET expires = ? WHERE namespace = ? AND url = ? AND query = ?", (expires, *key)
+            )
+
+    def remove(self, url: Optional[str] = None) -> int:
+        with self._db_lock:
+            if url is None:
+                return self._db.execute("DELETE FROM responses").rowcount
+            segments = path_segments(url)
+            related = [
+                (namespace, cached_url)
+                for namespace, cached_url in self._db.execute("SELECT DISTINCT namespace, url FROM responses")
+                if is_related_path(path_segments(cached_url), segments)
+            ]
+            removed = 0
+            for namespace, cached_url in related:
+                removed += self._db.execute(
+                    "DELETE FROM responses WHERE namespace = ? AND url = ?", (namespace, cached_url)
+                ).rowcount
+            return removed
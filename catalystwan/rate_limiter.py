@@ -0,0 +1,196 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Client-side throttling of requests sent by ManagerSession.
+
+SD-WAN Manager protects itself from bursts of API calls answering with 429/503. Session can be
+equipped with rate limiter (token bucket per class of endpoints) and adaptive concurrency limiter
+(AIMD: limit of parallel requests is increased additively while server responds fine and decreased
+multiplicatively when it reports overload or latency grows), so bulk jobs run as fast as server allows.
+
+>>> session.rate_limiter = RateLimiter(rate=20, burst=40).limit("/dataservice/statistics", rate=2)
+>>> session.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=32)
+>>> DevicesAPI(session).get()
+"""
+
+from __future__ import annotations
+
+from threading import Condition, Lock
+from time import monotonic, sleep
+from typing import Callable, Collection, Dict, Optional, Tuple
+
+OVERLOAD_STATUS_CODES = (429, 503)
+
+
+class TokenBucket:
+    """Thread-safe token bucket, tokens are refilled at constant rate up to capacity (burst size)
+
+    Args:
+        rate: number of tokens added per second
+        capacity: maximum number of stored tokens (defaults to rate, at least 1)
+        clock: monotonic time source
+        sleep: function used to wait for tokens
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Takes tokens (balance can become negative) and returns time to wait until they are available"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Blocks until given number of tokens is available
+
+        Returns:
+            float: time spent waiting in seconds
+        """
+        if delay := self._reserve(tokens):
+            self._sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """Limits rate of requests with separate token bucket for each class of endpoints
+
+    Endpoint class is identified by url path prefix, the longest matching prefix is used.
+    Requests not matching any prefix use default bucket (not limited when rate is None).
+
+    Args:
+        rate: default number of requests per second
+        burst: default number of requests which can be sent at once after idle period
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None):
+        self.default = TokenBucket(rate, burst) if rate is not None else None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._prefixes: Tuple[str, ...] = ()
+
+    def limit(self, path_prefix: str, rate: float, burst: Optional[float] = None) -> RateLimiter:
+        """Sets separate budget for endpoints with given url path prefix (eg. "/dataservice/statistics")
+
+        Returns:
+            RateLimiter: self (to allow chaining)
+        """
+        self._buckets[path_prefix] = TokenBucket(rate, burst)
+        self._prefixes = tuple(sorted(self._buckets, key=len, reverse=True))
+        return self
+
+    def bucket(self, path: str) -> Optional[TokenBucket]:
+        """Returns token bucket used for given url path"""
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self._buckets[prefix]
+        return self.default
+
+    def acquire(self, path: str) -> float:
+        """Blocks until request to given url path can be sent
+
+        Returns:
+            float: time spent waiting in seconds
+        """
+        if (bucket := self.bucket(path)) is None:
+            return 0.0
+        return bucket.acquire()
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits number of requests in flight, limit is adjusted with AIMD algorithm
+
+    Limit grows by one after each window of successful requests (limit sized) and is multiplied by
+    decrease_factor when server reports overload (or latency exceeds threshold). Only one decrease
+    is applied for requests started before previous decrease, so burst of failures halves limit once.
+
+    Args:
+        initial_limit: number of concurrent requests allowed at start
+        min_limit: lower bound of limit
+        max_limit: upper bound of limit
+        decrease_factor: multiplier applied to limit on overload
+        latency_threshold_seconds: requests taking longer are treated as overload signal (ignored when None)
+        overload_status_codes: response status codes indicating server overload
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_threshold_seconds: Optional[float] = None,
+        overload_status_codes: Collection[int] = OVERLOAD_STATUS_CODES,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Concurrency limits must satisfy: 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.overload_status_codes = overload_status_codes
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of allowed concurrent requests"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def is_overload(self, status_code: int) -> bool:
+        return status_code in self.overload_status_codes
+
+    def acquire(self) -> float:
+        """Blocks until number of requests in flight is lower than limit
+
+        Returns:
+            float: start time of request to be passed to release()
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return monotonic()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Reports finished request and adjusts limit
+
+        Args:
+            started: value returned by acquire()
+            overloaded: server reported overload (eg. 503 response or connection timeout)
+        """
+        latency = monotonic() - started
+        if self.latency_threshold_seconds is not None and latency > self.latency_threshold_seconds:
+            overloaded = True
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                if started > self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                    self._last_decrease = monotonic()
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
@@ -0,0 +1,161 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Deferred tracing of request-response exchanges performed by sessions.
+
+Building human readable trace (pretty-printed JSON body and caller stack frame) is expensive,
+so session creates lightweight RequestTrace record instead and full contents are formatted
+only when record is converted to string, eg. by logging handler when DEBUG level is enabled.
+
+Records can also be collected by trace sinks attached to session:
+>>> sink = RingBufferTraceSink(maxlen=100)
+>>> session.trace_sinks.append(sink)
+>>> session.get("/dataservice/device")
+>>> sink.records[-1].summary()
+{'timestamp': 1700000000.0, 'method': 'GET', 'url': 'https://10.0.0.1/dataservice/device', 'status_code': 200, ...}
+"""
+
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Protocol, Union
+
+from requests import PreparedRequest, Request, Response
+
+from catalystwan.response import response_history_debug
+
+TraceFormatter = Callable[[Optional[Response], Union[Request, PreparedRequest, None]], str]
+
+
+class RequestTrace:
+    """Record of single request-response exchange, full contents are formatted on str() conversion only.
+
+    Attributes:
+        response: received response (None when request failed before response was received)
+        request: request to be traced when response is not available
+        timestamp: unix time when record was created
+    """
+
+    __slots__ = ("response", "request", "timestamp", "_formatter")
+
+    def __init__(
+        self,
+        response: Optional[Response],
+        request: Union[Request, PreparedRequest, None] = None,
+        formatter: TraceFormatter = response_history_debug,
+    ):
+        self.response = response
+        self.request = request
+        self.timestamp = time()
+        self._formatter = formatter
+
+    @property
+    def _request(self) -> Union[Request, PreparedRequest, None]:
+        if self.request is None and self.response is not None:
+            return self.response.request
+        return self.request
+
+    @property
+    def method(self) -> Optional[str]:
+        return getattr(self._request, "method", None)
+
+    @property
+    def url(self) -> Optional[str]:
+        return getattr(self._request, "url", None)
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return getattr(self.response, "status_code", None)
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        if (elapsed := getattr(self.response, "elapsed", None)) is not None:
+            return round(elapsed.total_seconds(), 3)
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns cheap to build summary of traced exchange (without request and response bodies)"""
+        return {
+            "timestamp": self.timestamp,
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "elapsed-seconds": self.elapsed,
+        }
+
+    def __str__(self) -> str:
+        return self._formatter(self.response, self.request)
+
+
+class TraceSink(Protocol):
+    """Interface to object collecting request traces emitted by session"""
+
+    def emit(self, trace: RequestTrace) -> None:
+        ...
+
+
+class RingBufferTraceSink:
+    """Keeps given number of most recent request traces in memory
+
+    Args:
+        maxlen: maximum number of stored records, oldest records are discarded first
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._records: Deque[RequestTrace] = deque(maxlen=maxlen)
+
+    @property
+    def records(self) -> List[RequestTrace]:
+        return list(self._records)
+
+    def emit(self, trace: RequestTrace) -> None:
+        self._records.append(trace)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+class JSONLinesTraceSink:
+    """Appends summary of each request trace as single JSON line to given file
+
+    Args:
+        path: path to output file
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file: Optional[IO[str]] = None
+        self._lock = Lock()
+
+    def emit(self, trace: RequestTrace) -> None:
+        line = json.dumps(trace.summary())
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def emit_trace(
+    logger: logging.Logger,
+    sinks: List[TraceSink],
+    response: Optional[Response],
+    request: Union[Request, PreparedRequest, None] = None,
+    formatter: TraceFormatter = response_history_debug,
+) -> None:
+    """Logs deferred request trace and passes it to given sinks.
+    Does nothing when DEBUG level is disabled for logger and there are no sinks"""
+    if not sinks and not logger.isEnabledFor(logging.DEBUG):
+        return
+    trace = RequestTrace(response, request, formatter)
+    logger.debug("%s", trace)
+    for sink in sinks:
+        sink.emit(trace)
@@ -3,12 +3,14 @@
 import re
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from pprint import pformat
-from typing import Any, Callable, Dict, Optional, Sequence, Type, TypeVar, Union, cast
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type, TypeVar, Union, cast
 from urllib.parse import urlparse
 
 from pydantic import BaseModel as BaseModelV2
+from pydantic import TypeAdapter
 from pydantic.v1 import BaseModel as BaseModelV1
 from requests import PreparedRequest, Request, Response
 from requests.cookies import RequestsCookieJar
@@ -18,11 +20,13 @@ from catalystwan import with_proc_info_header
 from catalystwan.abstractions import APIEndpointClientResponse
 from catalystwan.exceptions import ManagerErrorInfo
 from catalystwan.typed_list import DataSequence
-from catalystwan.utils.creation_tools import create_dataclass
+from catalystwan.utils.creation_tools import create_dataclass, create_dataclasses
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
 PRINTABLE_CONTENT = re.compile(r"(text\/.+)|(application\/(json|html|xhtml|xml|x-www-form-urlencoded))", re.IGNORECASE)
 SENSITIVE_URL_PATHS = ["/dataservice/settings/configuration/smartaccountcredentials"]
+_NOT_DECODED = object()
 
 
 def response_debug(response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> str:
@@ -66,21 +70,25 @@ def response_debug(response: Optional[Response], request: Union[Request, Prepare
             "elapsed-seconds": round(float(response.elapsed.microseconds) / 1000000, 3),
             "headers": dict(response.headers.items()),
         }
-        try:
-            json = response.json()
-
-            if isinstance(json, dict):
-                json.pop("header", None)
-
-            response_debug.update({"json": json})
-        except JSONDecodeError:
-            if response.encoding is not None:
-                if len(response.text) <= 1024:
-                    response_debug.update({"text": response.text})
+        if getattr(response, "_content", None) is False:
+            # streamed response body is not loaded yet and must not be consumed here
+            response_debug.update({"text(not loaded: streamed response)": None})
+        else:
+            try:
+                json = response.json()
+
+                if isinstance(json, dict):
+                    json = {k: v for k, v in json.items() if k != "header"}
+
+                response_debug.update({"json": json})
+            except JSONDecodeError:
+                if response.encoding is not None:
+                    if len(response.text) <= 1024:
+                        response_debug.update({"text": response.text})
+                    else:
+                        response_debug.update({"text(trimmed)": response.text[:1024]})
                 else:
-                    response_debug.update({"text(trimmed)": response.text[:1024]})
-            else:
-                response_debug.update({"text(cannot convert to string: unknown encoding)": None})
+                    response_debug.update({"text(cannot convert to string: unknown encoding)": None})
         debug_dict["response"] = response_debug
     return pformat(debug_dict, width=80, sort_dicts=False)
 
@@ -105,6 +113,28 @@ def response_history_debug(response: Optional[Response], request: Union[Request,
     return "\n".join(response_debugs)
 
 
+def _observe_parse(method: F) -> F:
+    """Reports time spent in payload parsing method to response parse observer (if set)"""
+
+    @wraps(method)
+    def wrapper(self: "ManagerResponsePayload", *args, **kwargs) -> Any:
+        if (observer := self.parse_observer) is None:
+            return method(self, *args, **kwargs)
+        started = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            observer(perf_counter() - started)
+
+    return cast(F, wrapper)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(cls: Type[BaseModelV2]) -> TypeAdapter:
+    """Returns cached adapter validating whole list of given model items in single call"""
+    return TypeAdapter(List[cls])  # type: ignore[valid-type]
+
+
 def parse_cookies_to_dict(cookies: str) -> Dict[str, str]:
     """Utility method to parse cookie string into dict"""
     result: Dict[str, str] = {}
@@ -132,17 +162,43 @@ class JsonPayload:
             self.headers = json.get("headers", None)
 
 
-class ManagerResponse(Response, APIEndpointClientResponse):
-    """Extends Response object with methods specific to vManage.
-    Object is meant to be created from aready received requests.Response"""
-
-    def __init__(self, response: Response):
-        self.__dict__.update(response.__dict__)
-        self.jsessionid_expired = self._detect_expired_jsessionid()
-        try:
-            self.payload = JsonPayload(response.json())
-        except JSONDecodeError:
-            self.payload = JsonPayload()
+class ManagerResponsePayload:
+    """Parsing of vManage specific response contents.
+    Common for responses received by synchronous and asynchronous sessions.
+    Subclass is expected to provide "headers" and "payload" attributes"""
+
+    headers: Any
+    _decoded_json: Any = _NOT_DECODED
+    _decode_error: Optional[ValueError] = None
+    _payload: Optional[JsonPayload] = None
+    parse_observer: Optional[Callable[[float], None]] = None  # receives seconds spent in dataseq/dataobj
+
+    def _decode_json(self) -> Any:
+        """Decodes JSON from response body, provided by subclass"""
+        raise NotImplementedError
+
+    def _cached_json(self) -> Any:
+        """Decodes JSON from response body at most once.
+        Subsequent calls return the same object (or raise the same decoding error)"""
+        if self._decode_error is not None:
+            raise self._decode_error
+        if self._decoded_json is _NOT_DECODED:
+            try:
+                self._decoded_json = self._decode_json()
+            except ValueError as error:  # base of JSONDecodeError and UnicodeDecodeError
+                self._decode_error = error
+                raise
+        return self._decoded_json
+
+    @property
+    def payload(self) -> JsonPayload:
+        """JSON payload decoded on first access"""
+        if self._payload is None:
+            try:
+                self._payload = JsonPayload(self._cached_json())
+            except ValueError:
+                self._payload = JsonPayload()
+        return self._payload
 
     def _detect_expired_jsessionid(self) -> bool:
         """Determines if server sent expired JSESSIONID"""
@@ -163,18 +219,7 @@ class ManagerResponse(Response, APIEndpointClientResponse):
         jar.update(parse_cookies_to_dict(cookies_string))
         return jar
 
-    def info(self, history: bool = False) -> str:
-        """Returns human readable string containing Request-Response contents
-        Args:
-            history: include response history (eg. redirects)
-
-        Returns:
-            str
-        """
-        if history:
-            return response_history_debug(self, None)
-        return response_debug(self, None)
-
+    @_observe_parse
     def dataseq(self, cls: Type[T], sourcekey: Optional[str] = "data") -> DataSequence[T]:
         """Returns data contents from JSON payload parsed as DataSequence of Dataclass/BaseModel instances
         Args:
@@ -198,9 +243,10 @@ class ManagerResponse(Response, APIEndpointClientResponse):
         if issubclass(cls, BaseModelV1):
             return DataSequence(cls, [cls.parse_obj(item) for item in sequence])  # type: ignore
         if issubclass(cls, BaseModelV2):
-            return DataSequence(cls, [cls.model_validate(item) for item in sequence])  # type: ignore
-        return DataSequence(cls, [create_dataclass(cls, item) for item in sequence])
+            return DataSequence(cls, _list_adapter(cls).validate_python(sequence))
+        return DataSequence(cls, create_dataclasses(cls, sequence))
 
+    @_observe_parse
     def dataobj(self, cls: Type[T], sourcekey: Optional[str] = "data") -> T:
         """Returns data contents from JSON payload parsed as Dataclass/BaseModel instance
         Args:
@@ -235,6 +281,46 @@ class ManagerResponse(Response, APIEndpointClientResponse):
         return ManagerErrorInfo(**self.payload.error)
 
 
+class ManagerResponse(Response, ManagerResponsePayload, APIEndpointClientResponse):
+    """Extends Response object with methods specific to vManage.
+    Object is meant to be created from aready received requests.Response"""
+
+    def __init__(self, response: Response):
+        self.__dict__.update(response.__dict__)
+        self.jsessionid_expired = self._detect_expired_jsessionid()
+        # decode own body (shared with response unless streamed), fall back to response-like object decoder
+        self._json_decoder = super().json if isinstance(response, Response) else response.json
+
+    def _decode_json(self) -> Any:
+        return self._json_decoder()
+
+    def copy(self) -> "ManagerResponse":
+        """Returns response sharing received body but decoding its own JSON payload,
+        so modifications of decoded objects made by one holder are not visible to another"""
+        response = ManagerResponse(self)
+        for name in ("_decoded_json", "_decode_error", "_payload"):
+            response.__dict__.pop(name, None)
+        return response
+
+    def json(self, **kwargs) -> Any:
+        """Returns decoded JSON body. Body is decoded only once when called without additional arguments"""
+        if kwargs:
+            return self._json_decoder(**kwargs)
+        return self._cached_json()
+
+    def info(self, history: bool = False) -> str:
+        """Returns human readable string containing Request-Response contents
+        Args:
+            history: include response history (eg. redirects)
+
+        Returns:
+            str
+        """
+        if history:
+            return response_history_debug(self, None)
+        return response_debug(self, None)
+
+
 def with_vmanage_response(method: Callable[[Any], Response]) -> Callable[[Any], ManagerResponse]:
     @wraps(method)
     def wrapper(*args, **kwargs) -> ManagerResponse:
@@ -0,0 +1,228 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Opt-in cache of responses to read-mostly GET endpoints.
+
+Responses are cached per session for time declared next to endpoint definition:
+>>> @get("/client/about", "data", cache_ttl=300)
+
+or given with request sent directly by session:
+>>> session.get("/dataservice/template/device", cache_ttl=60)
+
+Cache is disabled until attached to session:
+>>> session.response_cache = ResponseCache()
+
+Any non-GET request invalidates cached responses for related resource paths (path being prefix of other one),
+eg. PUT "/dataservice/template/policy/list/app/{id}" evicts "/dataservice/template/policy/list/app" listing.
+
+Expired responses carrying ETag or Last-Modified header are revalidated with conditional request
+(If-None-Match/If-Modified-Since), when server answers 304 Not Modified cached response is reused.
+Zero ttl means that response is cached only for revalidation. Cache persisted between processes
+is available in: catalystwan.persistent_cache
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import urlencode, urlsplit
+
+from requests import Response
+
+ResponseType = TypeVar("ResponseType", bound=Response)
+CacheKey = Tuple[str, str, str]  # namespace, url, query
+
+NOT_MODIFIED = 304
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served without downloading response body (revalidated responses included)"""
+        lookups = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / lookups if lookups else 0.0
+
+
+@dataclass
+class CacheEntry:
+    response: Any
+    expires: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: Response, expires: float) -> CacheEntry:
+        return cls(response, expires, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    @property
+    def revalidable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Returns headers of conditional request revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def path_segments(url: str) -> Tuple[str, ...]:
+    return tuple(segment for segment in urlsplit(url).path.split("/") if segment)
+
+
+def is_related_path(first: Tuple[str, ...], second: Tuple[str, ...]) -> bool:
+    """Checks if one path is equal to or nested in other one"""
+    common = min(len(first), len(second))
+    return first[:common] == second[:common]
+
+
+def cache_key(url: str, params: Any = None, namespace: str = "") -> CacheKey:
+    """Creates cache key from url and query params (params order does not matter)"""
+    if not params:
+        return namespace, url, ""
+    if isinstance(params, Mapping):
+        return namespace, url, urlencode(sorted((str(key), value) for key, value in params.items()), doseq=True)
+    if isinstance(params, (list, tuple)):
+        return namespace, url, urlencode(sorted(params), doseq=True)
+    return namespace, url, str(params)
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU cache of successful GET responses with per-request time to live
+
+    Subclasses can provide other storage by overriding: load, store, refresh and remove methods.
+
+    Args:
+        max_entries: maximum number of cached responses (least recently used are evicted)
+        default_ttl: time to live applied to GET requests sent without cache_ttl (not cached when None)
+        clock: time source
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, default_ttl: Optional[float] = None, clock: Callable[[], float] = monotonic
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, Tuple[Tuple[str, ...], CacheEntry]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Returns stored entry (expired too)"""
+        with self._lock:
+            if (item := self._entries.get(key)) is None:
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def store(self, key: CacheKey, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = (path_segments(key[1]), entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def refresh(self, key: CacheKey, entry: CacheEntry, expires: float) -> None:
+        """Extends lifetime of entry revalidated by server"""
+        entry.expires = expires
+
+    def remove(self, url: Optional[str] = None) -> int:
+        """Removes entries for resource paths related to given url (all entries when url is None)"""
+        with self._lock:
+            if url is None:
+                keys = list(self._entries)
+            else:
+                segments = path_segments(url)
+                keys = [key for key, (path, _) in self._entries.items() if is_related_path(path, segments)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Returns cached response which has not expired yet"""
+        entry = self.load(key)
+        if entry is None or entry.expires <= self._clock():
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry.response
+
+    def put(self, key: CacheKey, response: Response, ttl: float) -> None:
+        self.store(key, CacheEntry.from_response(response, self._clock() + ttl))
+
+    def invalidate(self, url: Optional[str] = None) -> int:
+        """Removes cached responses for resource paths related to given url (all responses when url is None)
+
+        Returns:
+            int: number of removed responses
+        """
+        removed = self.remove(url)
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def fetch(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        ttl: Optional[float],
+        send: Callable[[Dict[str, str]], ResponseType],
+        namespace: str = "",
+    ) -> ResponseType:
+        """Returns cached response or sends request, caches its response or invalidates related responses
+
+        Args:
+            method: HTTP method
+            url: full request url
+            params: request query params
+            ttl: seconds for which response can be served from cache (default_ttl used when None)
+            send: sends request with given additional headers and returns response
+            namespace: separates responses visible to different users or tenants of the same server
+        """
+        if method.upper() != "GET":
+            try:
+                return send({})
+            finally:
+                self.invalidate(url)
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl is None:
+            return send({})
+        key = cache_key(url, params, namespace)
+        entry = self.load(key)
+        if entry is not None and entry.expires > self._clock():
+            self.stats.hits += 1
+            return entry.response
+        if entry is not None and entry.revalidable:
+            response = send(entry.conditional_headers())
+            if response.status_code == NOT_MODIFIED:
+                self.stats.revalidations += 1
+                self.refresh(key, entry, self._clock() + ttl)
+                return entry.response
+        else:
+            response = send({})
+        self.stats.misses += 1
+        if response.ok and response.status_code != NOT_MODIFIED:
+            entry = CacheEntry.from_response(response, self._clock() + ttl)
+            if ttl > 0 or entry.revalidable:
+                self.store(key, entry)
+        return response
@@ -0,0 +1,157 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Retrying of requests failed because of transient errors.
+
+Retry policy can be attached to ManagerSession to repeat idempotent requests which failed with
+connection error, read timeout or 502/503/504/429 response. Delay between attempts grows exponentially
+(with random jitter) unless server tells how long to wait with "Retry-After" header. Retry budget limits
+number of retries to given fraction of all requests, so retries cannot multiply load of struggling server.
+
+>>> session.retry_policy = RetryPolicy(max_retries=5, backoff_factor=1.0)
+>>> DevicesAPI(session).get()
+
+Non-idempotent requests (POST, PATCH) are not retried unless marked as safe:
+>>> session.post("/dataservice/device/action/status/tasks", idempotent=True)
+
+or by endpoint decorator:
+>>> @post("/template/device/config/input/", idempotent=True)
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import sleep
+from typing import Callable, Collection, Optional
+
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException, SSLError, Timeout
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """Limits retries to fraction of requests (plus reserve for low traffic periods)
+
+    Each request deposits ratio of token, each retry withdraws one token.
+
+    Args:
+        ratio: fraction of requests which can be retried
+        reserve: maximum number of tokens (and initial balance)
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Returns True when retry is allowed"""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when failed request should be repeated
+
+    Args:
+        max_retries: maximum number of retries of single request
+        backoff_factor: delay before first retry in seconds, doubled for each next retry
+        max_backoff_seconds: maximum delay, Retry-After longer than that is not honored (request is not retried)
+        jitter: randomize delay (between 0 and calculated backoff) to spread retries of concurrent requests
+        retry_status_codes: response status codes which are retried
+        idempotent_methods: methods retried without explicit idempotent=True hint
+        budget: retry budget shared by all requests of session (default: 20% of requests)
+        rng: source of random numbers in range [0, 1) used for jitter
+        sleep: function used to wait before retry
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff_seconds: float = 30,
+        jitter: bool = True,
+        retry_status_codes: Collection[int] = RETRY_STATUS_CODES,
+        idempotent_methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff_seconds = max_backoff_seconds
+        self.jitter = jitter
+        self.retry_status_codes = retry_status_codes
+        self.idempotent_methods = idempotent_methods
+        self.budget = budget if budget is not None else RetryBudget()
+        self.rng = rng
+        self.sleep = sleep
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """Checks if request with given method can be retried (idempotent hint overrides method based decision)"""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def is_retryable(self, response: Optional[Response] = None, exception: Optional[RequestException] = None) -> bool:
+        if exception is not None:
+            return isinstance(exception, (ConnectionError, Timeout)) and not isinstance(exception, SSLError)
+        return response is not None and response.status_code in self.retry_status_codes
+
+    def backoff(self, attempt: int) -> float:
+        """Returns delay before given retry attempt (counted from 0)"""
+        delay = min(self.max_backoff_seconds, self.backoff_factor * 2**attempt)
+        return delay * self.rng() if self.jitter else delay
+
+    def delay(
+        self, attempt: int, response: Optional[Response] = None, exception: Optional[RequestException] = None
+    ) -> Optional[float]:
+        """Returns delay before retrying failed request or None when request should not be retried
+
+        Args:
+            attempt: number of retries already performed
+            response: received response
+            exception: exception raised instead of receiving response
+        """
+        if attempt >= self.max_retries or not self.is_retryable(response, exception):
+            return None
+        delay = self.backoff(attempt)
+        if response is not None and (retry_after := parse_retry_after(response.headers.get("Retry-After"))):
+            if retry_after > self.max_backoff_seconds:
+                return None
+            delay = max(delay, retry_after)
+        if not self.budget.withdraw():
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses Retry-After header (delay in seconds or HTTP date) to number of seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
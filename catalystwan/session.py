@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import socket
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from time import monotonic, sleep
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from threading import RLock
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from packaging.version import Version  # type: ignore
 from requests import PreparedRequest, Request, Response, Session, get, head
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
-from requests.exceptions import ConnectionError, HTTPError, RequestException
+from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
+from urllib3.connection import HTTPConnection
 
 from catalystwan import USER_AGENT
 from catalystwan.api.api_container import APIContainer
@@ -21,19 +27,30 @@ from catalystwan.endpoints.client import AboutInfo, ServerInfo
 from catalystwan.endpoints.endpoints_container import APIEndpointContainter
 from catalystwan.exceptions import (
     DefaultPasswordError,
+    DownloadChecksumError,
     ManagerHTTPError,
     ManagerReadyTimeout,
     ManagerRequestException,
     SessionNotCreatedError,
     TenantSubdomainNotFound,
 )
+from catalystwan.metrics import MetricsSink, endpoint_label
 from catalystwan.models.tenant import Tenant
+from catalystwan.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
+from catalystwan.request_trace import TraceSink, emit_trace
 from catalystwan.response import ManagerResponse, response_history_debug
+from catalystwan.response_cache import ResponseCache
+from catalystwan.retry_policy import RetryPolicy
+from catalystwan.tracing import NOOP_TRACER, Tracer
 from catalystwan.utils.session_type import SessionType
 from catalystwan.version import NullVersion, parse_api_version
 from catalystwan.vmanage_auth import vManageAuth
 
 JSON = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+TCP_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4))
 
 
 class UserMode(str, Enum):
@@ -77,6 +94,21 @@ def determine_session_type(
         return SessionType.NOT_DEFINED
 
 
+def create_base_url(url: str, port: Optional[int] = None) -> str:
+    """Creates base url based on ip address or domain and port if provided.
+
+    Returns:
+        str: Base url shared for every request.
+    """
+    parsed_url = urlparse(url)
+    netloc: str = parsed_url.netloc or parsed_url.path
+    scheme: str = parsed_url.scheme or "https"
+    base_url = urlunparse((scheme, netloc, "", None, None, None))
+    if port:
+        return f"{base_url}:{port}"
+    return base_url
+
+
 def create_manager_session(
     url: str,
     username: str,
@@ -84,6 +116,10 @@ def create_manager_session(
     port: Optional[int] = None,
     subdomain: Optional[str] = None,
     logger: Optional[logging.Logger] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    tcp_keepalive: bool = True,
 ) -> ManagerSession:
     """Factory method that creates session object and performs login according to parameters
 
@@ -95,11 +131,26 @@ def create_manager_session(
         subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
             works only on provider user mode
         logger: override default module logger
+        pool_connections: number of per-host connection pools to cache
+        pool_maxsize: maximum number of connections kept open to single host (should not be lower than
+            number of threads using session concurrently, otherwise extra connections are opened and discarded)
+        pool_block: block when all pooled connections are in use instead of opening extra connection
+        tcp_keepalive: enable TCP keep-alive probes on pooled connections
 
     Returns:
         ManagerSession: logged-in and operative session to perform tasks on SDWAN Manager.
     """
-    session = ManagerSession(url=url, username=username, password=password, port=port, subdomain=subdomain)
+    session = ManagerSession(
+        url=url,
+        username=username,
+        password=password,
+        port=port,
+        subdomain=subdomain,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+    )
 
     if logger:
         session.logger = logger
@@ -109,6 +160,44 @@ def create_manager_session(
     return session
 
 
+def tcp_keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """Returns socket options enabling TCP keep-alive probes (with platform specific timings when available)"""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in TCP_KEEPALIVE_OPTIONS:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class ManagerHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with configurable connection pool shared by session and its authentication requests
+
+    Args:
+        pool_connections: number of per-host connection pools to cache
+        pool_maxsize: maximum number of connections kept open to single host
+        pool_block: block when no free connection is available instead of opening extra (not reused) connection
+        tcp_keepalive: enable TCP keep-alive probes, so idle pooled connections are not silently dropped
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+    ):
+        self.socket_options = list(HTTPConnection.default_socket_options)
+        if tcp_keepalive:
+            self.socket_options += tcp_keepalive_socket_options()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
 class ManagerResponseAdapter(Session):
     def request(self, method, url, *args, **kwargs) -> ManagerResponse:
         return ManagerResponse(super().request(method, url, *args, **kwargs))
@@ -136,10 +225,29 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         port: port
         username: username
         password: password
+        pool_connections: number of per-host connection pools to cache
+        pool_maxsize: maximum number of connections kept open to single host
+        pool_block: block when all pooled connections are in use instead of opening extra connection
+        tcp_keepalive: enable TCP keep-alive probes on pooled connections
+        adapter: connection pool shared with other session (pool_* and tcp_keepalive arguments are not used)
 
     Attributes:
         enable_relogin (bool): defaults to True, in case that session is not properly logged-in, session will try to
             relogin and try the same request again
+        trace_sinks (List[TraceSink]): collectors of request traces emitted for every request (see request_trace)
+        adapter (ManagerHTTPAdapter): connection pool shared by API and login requests
+        rate_limiter (Optional[RateLimiter]): limits rate of requests per class of endpoints (see rate_limiter)
+        concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): limits number of requests in flight,
+            limit adapts to overload reported by server
+        retry_policy (Optional[RetryPolicy]): repeats idempotent requests failed because of transient errors
+            (disabled by default, see retry_policy)
+        response_cache (Optional[ResponseCache]): serves responses of GET endpoints declaring cache_ttl
+            (disabled by default, see response_cache)
+        metrics_sinks (List[MetricsSink]): receivers of per-endpoint request metrics (see metrics)
+        tracer (Tracer): creates spans of HTTP calls and high-level workflows (disabled by default, see tracing)
+
+    Session can be shared by multiple threads: state transitions are serialized, so when several concurrent
+    requests detect expired session only first of them performs login, others wait for it and repeat request.
     """
 
     on_session_create_hook: ClassVar[Callable[[ManagerSession], Any]] = lambda *args: None
@@ -153,6 +261,11 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         port: Optional[int] = None,
         subdomain: Optional[str] = None,
         auth: Optional[AuthBase] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+        adapter: Optional[ManagerHTTPAdapter] = None,
     ):
         self.url = url
         self.port = port
@@ -167,14 +280,28 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         self.response_trace: Callable[
             [Optional[Response], Union[Request, PreparedRequest, None]], str
         ] = response_history_debug
+        self.trace_sinks: List[TraceSink] = []
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+        self.retry_policy: Optional[RetryPolicy] = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.metrics_sinks: List[MetricsSink] = []
+        self.tracer: Tracer = NOOP_TRACER
         super(ManagerSession, self).__init__()
         self.headers.update({"User-Agent": USER_AGENT})
+        if adapter is None:
+            adapter = ManagerHTTPAdapter(pool_connections, pool_maxsize, pool_block, tcp_keepalive)
+        self.adapter = adapter
+        self.mount("https://", self.adapter)
+        self.mount("http://", self.adapter)
         self.__prepare_session(verify, auth)
         self.api = APIContainer(self)
         self.endpoints = APIEndpointContainter(self)
         self._platform_version: str = ""
         self._api_version: Version
         self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
+        self._state_lock = RLock()
+        self._login_generation: int = 0
         self.restart_timeout: int = 1200
         self.polling_requests_timeout: int = 10
 
@@ -185,24 +312,49 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
     @state.setter
     def state(self, state: ManagerSessionState) -> None:
         """Resets the session to given state and manages transition to desired OPERATIONAL state"""
-        self._state = state
-        self.logger.debug(f"Session entered state: {self.state.name}")
-
-        if state == ManagerSessionState.OPERATIVE:
-            # this is desired state, nothing to be done
+        with self._state_lock:
+            self._state = state
+            self.logger.debug(f"Session entered state: {self.state.name}")
+
+            if state == ManagerSessionState.OPERATIVE:
+                # this is desired state, nothing to be done
+                return
+            elif state == ManagerSessionState.RESTART_IMMINENT:
+                # in this state we process requests normally
+                # but when ConnectionError is caught we enter WAIT_SERVER_READY_AFTER_RESTART
+                # state change is achieved with cooperation with request method
+                return
+            elif state == ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART:
+                self.wait_server_ready(self.restart_timeout)
+                self.state = ManagerSessionState.LOGIN
+            elif state == ManagerSessionState.LOGIN:
+                self.login()
+                self.state = ManagerSessionState.OPERATIVE
             return
-        elif state == ManagerSessionState.RESTART_IMMINENT:
-            # in this state we process requests normally
-            # but when ConnectionError is caught we enter WAIT_SERVER_READY_AFTER_RESTART
-            # state change is achieved with cooperation with request method
-            return
-        elif state == ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART:
-            self.wait_server_ready(self.restart_timeout)
-            self.state = ManagerSessionState.LOGIN
-        elif state == ManagerSessionState.LOGIN:
-            self.login()
-            self.state = ManagerSessionState.OPERATIVE
-        return
+
+    def _enter_state_if(
+        self,
+        login_generation: int,
+        expected: ManagerSessionState,
+        state: ManagerSessionState,
+        reason: Optional[str] = None,
+    ) -> bool:
+        """Enters given state when session is still in expected state and no login was started since request
+        was sent (login_generation read before sending). Concurrent callers wait for single transition performed
+        by first of them instead of repeating it.
+
+        Returns:
+            bool: True when transition was performed by this or other thread (request should be repeated)
+        """
+        with self._state_lock:
+            if self._login_generation != login_generation:
+                return True
+            if self._state == expected:
+                if reason:
+                    self.logger.warning(reason)
+                self.state = state
+                return True
+            return False
 
     def restart_imminent(self, restart_timeout_override: Optional[int] = None):
         """Notify session that restart is imminent.
@@ -226,13 +378,19 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         """
 
         self.cookies.clear_session_cookies()
-        self.auth = vManageAuth(self.base_url, self.username, self.password, verify=False)
-        self.auth.logger = self.logger
+        auth = vManageAuth(self.base_url, self.username, self.password, verify=False, adapter=self.adapter)
+        auth.logger = self.logger
+        self.auth = auth
+        # requests sent with previous credentials will not trigger another login
+        self._login_generation += 1
 
         if self.subdomain:
             tenant_id = self.get_tenant_id()
             vsession_id = self.get_virtual_session_id(tenant_id)
             self.headers.update({"VSessionId": vsession_id})
+        if self.response_cache is not None:
+            # server info cached before login might be outdated (eg. after restart or upgrade)
+            self.response_cache.invalidate(self.get_full_url("/dataservice/client"))
         try:
             server_info = self.server()
         except DefaultPasswordError:
@@ -282,11 +440,11 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=False,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
+                self._trace(resp, None)
                 if resp.status_code != 503:
                     available = True
             except ConnectionError as error:
-                self.logger.debug(self.response_trace(error.response, error.request))
+                self._trace(error.response, error.request)
             if not available:
                 sleep(poll_period)
                 continue
@@ -302,7 +460,7 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=False,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
+                self._trace(resp, None)
                 if resp.status_code == 200:
                     if resp.json().get("isServerReady") is True:
                         self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
@@ -310,30 +468,94 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                 sleep(poll_period)
                 continue
             except RequestException as exception:
-                self.logger.debug(self.response_trace(exception.response, exception.request))
+                self._trace(exception.response, exception.request)
                 raise ManagerRequestException(request=exception.request, response=exception.response)
 
         raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
 
-    def request(self, method, url, *args, **kwargs) -> ManagerResponse:
+    def request(
+        self, method, url, *args, idempotent: Optional[bool] = None, cache_ttl: Optional[float] = None, **kwargs
+    ) -> ManagerResponse:
+        """Sends request to SD-WAN Manager, arguments are the same as for requests.Session.request
+
+        Args:
+            idempotent: marks request as safe to retry (when not given decided by method, see retry_policy)
+            cache_ttl: seconds for which GET response can be served from response cache (see response_cache)
+        """
+        if not self.tracer.enabled:
+            return self._cached_request(method, url, *args, idempotent=idempotent, cache_ttl=cache_ttl, **kwargs)
+        full_url = self.get_full_url(url)
+        attributes = {"http.method": method, "http.url": full_url, "endpoint": endpoint_label(method, full_url)}
+        with self.tracer.start_span(f"HTTP {method}", attributes) as span:
+            try:
+                response = self._cached_request(
+                    method, url, *args, idempotent=idempotent, cache_ttl=cache_ttl, **kwargs
+                )
+            except ManagerRequestException as exception:
+                if exception.response is not None:
+                    span.set_attribute("http.status_code", exception.response.status_code)
+                raise
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
+    def _cached_request(
+        self, method, url, *args, idempotent: Optional[bool] = None, cache_ttl: Optional[float] = None, **kwargs
+    ) -> ManagerResponse:
+        if (cache := self.response_cache) is None or kwargs.get("stream"):
+            return self._request(method, url, *args, idempotent=idempotent, **kwargs)
+
+        def send(headers: Dict[str, str]) -> ManagerResponse:
+            if headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **headers}
+            return self._request(method, url, *args, idempotent=idempotent, **kwargs)
+
+        response = cache.fetch(
+            method, self.get_full_url(url), kwargs.get("params"), cache_ttl, send, self.cache_namespace
+        )
+        # cached response is shared, each caller receives own copy with separately decoded JSON
+        # (responses restored from persistent cache are plain requests.Response objects)
+        return response.copy() if isinstance(response, ManagerResponse) else ManagerResponse(response)
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identifies user and tenant view, responses cached by sessions with other namespace are not shared"""
+        if self.subdomain:
+            return f"{self}/{self.subdomain}"
+        return str(self)
+
+    def _request(self, method, url, *args, idempotent: Optional[bool] = None, **kwargs) -> ManagerResponse:
         full_url = self.get_full_url(url)
+        login_generation = self._login_generation
         try:
-            response = super(ManagerSession, self).request(method, full_url, *args, **kwargs)
-            self.logger.debug(self.response_trace(response, None))
+            response = self._retried_request(method, full_url, idempotent, *args, **kwargs)
+            self._trace(response, None)
             if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
-                self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
+                self._enter_state_if(
+                    login_generation,
+                    ManagerSessionState.RESTART_IMMINENT,
+                    ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART,
+                )
         except RequestException as exception:
-            self.logger.debug(self.response_trace(exception.response, exception.request))
+            self._trace(exception.response, exception.request)
             if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(exception, ConnectionError):
-                self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
-                return self.request(method, url, *args, **kwargs)
+                self._enter_state_if(
+                    login_generation,
+                    ManagerSessionState.RESTART_IMMINENT,
+                    ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART,
+                )
+                return self._request(method, url, *args, idempotent=idempotent, **kwargs)
             self.logger.debug(exception)
             raise ManagerRequestException(request=exception.request, response=exception.response)
 
-        if self.enable_relogin and response.jsessionid_expired and self.state == ManagerSessionState.OPERATIVE:
-            self.logger.warning("Logging to session. Reason: expired JSESSIONID detected in response headers")
-            self.state = ManagerSessionState.LOGIN
-            return self.request(method, url, *args, **kwargs)
+        if self.enable_relogin and response.jsessionid_expired:
+            if self._enter_state_if(
+                login_generation,
+                ManagerSessionState.OPERATIVE,
+                ManagerSessionState.LOGIN,
+                reason="Logging to session. Reason: expired JSESSIONID detected in response headers",
+            ):
+                self._increment_metric("relogins", endpoint=endpoint_label(method, full_url))
+                return self._request(method, url, *args, idempotent=idempotent, **kwargs)
 
         if response.request.url and "passwordReset.html" in response.request.url:
             raise DefaultPasswordError("Password must be changed to use this session.")
@@ -346,6 +568,90 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
             raise ManagerHTTPError(error_info=error_info, request=error.request, response=error.response)
         return response
 
+    def _retried_request(self, method, full_url: str, idempotent: Optional[bool], *args, **kwargs) -> ManagerResponse:
+        """Sends request and repeats it according to retry policy (if configured) when transient error occurs"""
+        if (policy := self.retry_policy) is None:
+            return self._throttled_request(method, full_url, *args, **kwargs)
+        policy.budget.deposit()
+        retry = policy.allows(method, idempotent)
+        attempt = 0
+        while True:
+            try:
+                response = self._throttled_request(method, full_url, *args, **kwargs)
+            except RequestException as exception:
+                if not retry or self.state != ManagerSessionState.OPERATIVE:
+                    raise
+                if (delay := policy.delay(attempt, exception=exception)) is None:
+                    raise
+                self._trace(exception.response, exception.request)
+                reason = exception.__class__.__name__
+            else:
+                if not retry or self.state != ManagerSessionState.OPERATIVE:
+                    return response
+                if (delay := policy.delay(attempt, response=response)) is None:
+                    return response
+                self._trace(response, None)
+                response.close()
+                reason = f"status code {response.status_code}"
+            attempt += 1
+            self._increment_metric("retries", endpoint=endpoint_label(method, full_url))
+            self.logger.warning(f"Retrying {method} {full_url} in {delay:.2f} seconds (retry {attempt}): {reason}")
+            policy.sleep(delay)
+
+    def _throttled_request(self, method, full_url: str, *args, **kwargs) -> ManagerResponse:
+        """Sends request when allowed by rate limiter and concurrency limiter (if configured)"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(urlparse(full_url).path)
+        if (limiter := self.concurrency_limiter) is None:
+            return self._measured_request(method, full_url, *args, **kwargs)
+        started = limiter.acquire()
+        overloaded = False
+        try:
+            response = self._measured_request(method, full_url, *args, **kwargs)
+            overloaded = limiter.is_overload(response.status_code)
+            return response
+        except (ConnectionError, Timeout):
+            overloaded = True
+            raise
+        finally:
+            limiter.release(started, overloaded)
+
+    def _measured_request(self, method, full_url: str, *args, **kwargs) -> ManagerResponse:
+        """Sends single request and reports its latency and size to metrics sinks (if configured)"""
+        if not self.metrics_sinks:
+            return super(ManagerSession, self).request(method, full_url, *args, **kwargs)
+        endpoint = endpoint_label(method, full_url)
+        started = perf_counter()
+        try:
+            response = super(ManagerSession, self).request(method, full_url, *args, **kwargs)
+        except RequestException as exception:
+            self._observe_metric("request_seconds", perf_counter() - started, endpoint=endpoint)
+            self._increment_metric("requests", endpoint=endpoint, method=method, status=exception.__class__.__name__)
+            raise
+        self._observe_metric("request_seconds", perf_counter() - started, endpoint=endpoint)
+        self._increment_metric("requests", endpoint=endpoint, method=method, status=str(response.status_code))
+        if body := response.request.body:
+            self._increment_metric("request_bytes", len(body), endpoint=endpoint)
+        if kwargs.get("stream"):
+            received = int(response.headers.get("Content-Length") or 0)
+        else:
+            received = len(response.content)
+        self._increment_metric("response_bytes", received, endpoint=endpoint)
+        response.parse_observer = partial(self._observe_metric, "parse_seconds", endpoint=endpoint)
+        return response
+
+    def _increment_metric(self, name: str, value: float = 1, **labels: str) -> None:
+        for sink in self.metrics_sinks:
+            sink.increment(name, value, **labels)
+
+    def _observe_metric(self, name: str, value: float, **labels: str) -> None:
+        for sink in self.metrics_sinks:
+            sink.observe(name, value, **labels)
+
+    def _trace(self, response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> None:
+        """Emits deferred request trace, formatting is skipped when DEBUG logging is disabled"""
+        emit_trace(self.logger, self.trace_sinks, response, request, self.response_trace)
+
     def get_full_url(self, url_path: str) -> str:
         """Returns base API url plus given url path."""
         return urljoin(self.base_url, url_path)
@@ -356,13 +662,7 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         Returns:
             str: Base url shared for every request.
         """
-        url = urlparse(self.url)
-        netloc: str = url.netloc or url.path
-        scheme: str = url.scheme or "https"
-        base_url = urlunparse((scheme, netloc, "", None, None, None))
-        if self.port:
-            return f"{base_url}:{self.port}"
-        return base_url
+        return create_base_url(self.url, self.port)
 
     def about(self) -> AboutInfo:
         return self.endpoints.client.about()
@@ -379,12 +679,29 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         response = self.get(url)
         return response.json()
 
-    def get_file(self, url: str, filename: Path) -> Response:
-        """Get a file using session get.
+    def get_file(
+        self,
+        url: str,
+        filename: Union[str, Path],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+        checksum: Optional[str] = None,
+        checksum_algorithm: str = "sha256",
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Response:
+        """Get a file using session get. File contents are streamed to disk in chunks.
 
         Args:
             url: dataservice api.
             filename: Filename to write download file to.
+            chunk_size: maximum number of bytes kept in memory at once.
+            resume: continue download of partially downloaded file using Range header (when file already exists).
+            checksum: expected hex digest of complete file, verified after download.
+            checksum_algorithm: hashlib algorithm name used to calculate checksum.
+            progress_callback: called after each written chunk with downloaded and total bytes (when known).
+
+        Raises:
+            DownloadChecksumError: when checksum of downloaded file does not match expected value
 
         Returns:
             http response.
@@ -393,11 +710,44 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
             response = self.session.get_file(url, filename)
 
         """
-        with self.get(url) as response:
-            with open(filename, "wb") as file:
-                file.write(response.content)
+        path = Path(filename)
+        offset = path.stat().st_size if resume and path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            response = self.get(url, stream=True, headers=headers)
+        except ManagerHTTPError as error:
+            if offset and error.response is not None and error.response.status_code == 416:
+                # requested range starts at the end of file, there is nothing more to download
+                self.__verify_checksum(path, checksum, checksum_algorithm)
+                return error.response
+            raise
+        with response:
+            if response.status_code != 206:
+                offset = 0
+            total = int(length) + offset if (length := response.headers.get("Content-Length")) else None
+            downloaded = offset
+            with open(path, "ab" if offset else "wb") as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+                    downloaded += len(chunk)
+                    if progress_callback is not None:
+                        progress_callback(downloaded, total)
+        self.__verify_checksum(path, checksum, checksum_algorithm)
         return response
 
+    def __verify_checksum(self, path: Path, checksum: Optional[str], checksum_algorithm: str) -> None:
+        if checksum is None:
+            return
+        file_hash = hashlib.new(checksum_algorithm)
+        with open(path, "rb") as file:
+            while chunk := file.read(DOWNLOAD_CHUNK_SIZE):
+                file_hash.update(chunk)
+        if file_hash.hexdigest() != checksum.lower():
+            raise DownloadChecksumError(
+                f"Checksum ({checksum_algorithm}) of downloaded file {path} is {file_hash.hexdigest()}, "
+                f"expected: {checksum}"
+            )
+
     def get_tenant_id(self) -> str:
         """Gets tenant UUID for its subdomain.
 
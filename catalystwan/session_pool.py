@@ -0,0 +1,293 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Pool of provider-as-tenant sessions sharing single provider login.
+
+Creating provider-as-tenant session with `create_manager_session(..., subdomain=...)` performs full login,
+fetches tenant list and requests virtual session for each tenant separately. Pool logs in once as provider,
+fetches tenant list once and keeps one virtual session (VSessionId) per tenant, reusing provider credentials
+and connection pool. Calls can be executed across tenants concurrently:
+>>> with create_manager_session_pool(url, username, password, max_workers=16) as pool:
+>>>     results = pool.map(lambda session: len(DevicesAPI(session).get()))
+>>> for result in results:
+>>>     print(result.subdomain, result.value if result.ok else result.error)
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar, cast
+
+from requests import PreparedRequest
+from requests.auth import AuthBase
+
+from catalystwan.exceptions import SessionNotCreatedError, TenantSubdomainNotFound
+from catalystwan.models.tenant import Tenant
+from catalystwan.session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    ManagerSession,
+    ManagerSessionState,
+    create_manager_session,
+)
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.session_type import SessionType
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class TenantResult(Generic[T]):
+    """Outcome of call executed for single tenant
+
+    Attributes:
+        subdomain: tenant subdomain
+        value: value returned by call (None when call failed)
+        error: exception raised by call (None when call succeeded)
+        seconds: duration of call
+    """
+
+    subdomain: str
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ProviderAuth(AuthBase):
+    """Authenticates requests of tenant session with current credentials of provider session.
+
+    VSessionId is bound to provider login, so tenant session logs in again (requests new VSessionId)
+    when provider session logged in since last login of tenant session.
+    """
+
+    def __init__(self, tenant: TenantSession):
+        self.tenant = tenant
+
+    def __call__(self, prepared_request: PreparedRequest) -> PreparedRequest:
+        tenant = self.tenant
+        login_generation = tenant._login_generation
+        if tenant.provider.auth is not tenant._provider_auth:
+            tenant._enter_state_if(
+                login_generation,
+                ManagerSessionState.OPERATIVE,
+                ManagerSessionState.LOGIN,
+                reason=f"Logging to tenant session {tenant.subdomain}. Reason: provider session logged in again",
+            )
+            # request was prepared with VSessionId and cookies of previous login
+            prepared_request.headers["VSessionId"] = cast(str, tenant.headers["VSessionId"])
+            prepared_request.headers.pop("Cookie", None)
+            prepared_request.prepare_cookies(tenant.cookies)
+        if callable(auth := tenant.provider.auth):
+            return auth(prepared_request)
+        return prepared_request
+
+
+class TenantSession(ManagerSession):
+    """Provider as tenant session which reuses login and connection pool of provider session.
+
+    Login of tenant session only requests new VSessionId from provider session. When provider login expires,
+    provider session performs login again while requesting VSessionId (single login for all tenant sessions).
+
+    Attributes:
+        provider: logged-in provider session
+        tenant_id: UUID of tenant
+    """
+
+    def __init__(self, provider: ManagerSession, subdomain: str, tenant_id: str):
+        super().__init__(
+            url=provider.url,
+            username=provider.username,
+            password=provider.password,
+            port=provider.port,
+            subdomain=subdomain,
+            auth=ProviderAuth(self),
+            adapter=provider.adapter,
+        )
+        self.provider = provider
+        self.tenant_id = tenant_id
+        self._provider_auth: object = None  # provider auth used to obtain current VSessionId
+        self.logger = provider.logger
+        self.enable_relogin = provider.enable_relogin
+        self.response_trace = provider.response_trace
+        self.trace_sinks = provider.trace_sinks
+        self.rate_limiter = provider.rate_limiter
+        self.concurrency_limiter = provider.concurrency_limiter
+        self.retry_policy = provider.retry_policy
+        self.response_cache = provider.response_cache
+        self.metrics_sinks = provider.metrics_sinks
+        self.tracer = provider.tracer
+        self.restart_timeout = provider.restart_timeout
+        self.polling_requests_timeout = provider.polling_requests_timeout
+
+    def login(self) -> ManagerSession:
+        """Switches to tenant view with new VSessionId requested by provider session
+
+        Returns:
+            ManagerSession: (self)
+        """
+        # provider logs in again by itself when its credentials (shared with this session) expired
+        vsession_id = self.provider.get_virtual_session_id(self.tenant_id)
+        self.cookies.clear_session_cookies()
+        self._provider_auth = self.provider.auth
+        self._login_generation += 1
+        self.headers.update({"VSessionId": vsession_id})
+        self.server_name = self.provider.server_name
+        self.platform_version = self.provider.platform_version
+        self._session_type = SessionType.PROVIDER_AS_TENANT
+        if jsessionid := self.provider.cookies.get("JSESSIONID"):
+            self.cookies.set("JSESSIONID", jsessionid)
+        self.logger.debug(f"Switched {self.provider} to tenant view: {self.subdomain}")
+        return self
+
+    def close(self) -> None:
+        """Does nothing, provider login and connections shared by tenant sessions are released by pool"""
+
+
+class ManagerSessionPool:
+    """Keeps tenant sessions of single provider session and runs calls across tenants concurrently
+
+    Args:
+        provider: logged-in provider session
+        max_workers: default number of tenants processed concurrently by map (connection pool of provider
+            session should keep at least that many connections)
+
+    Raises:
+        SessionNotCreatedError: when given session is not provider session
+    """
+
+    def __init__(self, provider: ManagerSession, max_workers: int = DEFAULT_MAX_WORKERS):
+        if provider.session_type is not SessionType.PROVIDER:
+            raise SessionNotCreatedError(
+                f"Session pool requires provider session, got {provider.session_type} session of {provider}"
+            )
+        self.provider = provider
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self._tenants: Optional[DataSequence[Tenant]] = None
+        self._sessions: Dict[str, TenantSession] = {}
+        self._session_locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def tenants(self, refresh: bool = False) -> DataSequence[Tenant]:
+        """Returns tenants of provider, list is fetched once unless refresh is requested"""
+        with self._lock:
+            if self._tenants is None or refresh:
+                self._tenants = self.provider.get("/dataservice/tenant").dataseq(Tenant)
+            return self._tenants
+
+    def session(self, subdomain: str) -> TenantSession:
+        """Returns session switched to view of tenant with given subdomain, session is created on first use
+
+        Raises:
+            TenantSubdomainNotFound: when provider has no tenant with given subdomain
+        """
+        if (session := self._sessions.get(subdomain)) is not None:
+            return session
+        with self._lock:
+            session_lock = self._session_locks.setdefault(subdomain, Lock())
+        # tenants are switched concurrently, but each only once
+        with session_lock:
+            if (session := self._sessions.get(subdomain)) is not None:
+                return session
+            tenant = self.tenants().filter(subdomain=subdomain).single_or_default()
+            if not tenant or not tenant.tenant_id:
+                raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {subdomain} not found")
+            session = TenantSession(self.provider, subdomain, tenant.tenant_id)
+            session.state = ManagerSessionState.LOGIN
+            session.on_session_create_hook()
+            self._sessions[subdomain] = session
+            return session
+
+    def map(
+        self,
+        func: Callable[[ManagerSession], T],
+        subdomains: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[TenantResult[T]]:
+        """Calls function with session of each tenant concurrently. Failure of call for one tenant
+        does not stop others, exception is returned in its result instead.
+
+        Args:
+            func: function called with tenant session
+            subdomains: subdomains of tenants (all tenants of provider by default)
+            max_workers: number of tenants processed concurrently (pool default when not given)
+
+        Returns:
+            List[TenantResult]: results in order of subdomains
+        """
+        if subdomains is None:
+            subdomains = [tenant.subdomain for tenant in self.tenants()]
+
+        def call(subdomain: str) -> TenantResult[T]:
+            begin = perf_counter()
+            try:
+                value = func(self.session(subdomain))
+            except Exception as error:
+                self.logger.warning(f"Call for tenant {subdomain} failed: {error!r}")
+                return TenantResult(subdomain, error=error, seconds=perf_counter() - begin)
+            return TenantResult(subdomain, value=value, seconds=perf_counter() - begin)
+
+        subdomains = list(subdomains)
+        workers = min(max_workers or self.max_workers, len(subdomains))
+        if workers <= 1:
+            return [call(subdomain) for subdomain in subdomains]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(call, subdomains))
+
+    def close(self) -> None:
+        """Closes provider session (tenant sessions share its login and connections)"""
+        with self._lock:
+            self._sessions.clear()
+        self.provider.close()
+
+    def __enter__(self) -> ManagerSessionPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def create_manager_session_pool(
+    url: str,
+    username: str,
+    password: str,
+    port: Optional[int] = None,
+    logger: Optional[logging.Logger] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> ManagerSessionPool:
+    """Factory method that logs in as provider and creates pool of tenant sessions
+
+    Args:
+        url (str): IP address or domain name
+        username (str): provider username
+        password (str): provider password
+        port (int): port
+        logger: override default module logger
+        max_workers: default number of tenants processed concurrently
+        pool_connections: number of per-host connection pools to cache
+        pool_maxsize: maximum number of connections kept open to single host (raised to max_workers when lower)
+
+    Returns:
+        ManagerSessionPool: pool with logged-in provider session
+    """
+    provider = create_manager_session(
+        url=url,
+        username=username,
+        password=password,
+        port=port,
+        logger=logger,
+        pool_connections=pool_connections,
+        pool_maxsize=max(pool_maxsize, max_workers),
+    )
+    return ManagerSessionPool(provider, max_workers=max_workers)
@@ -0,0 +1,19 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from pydantic import ConfigDict
+
+from catalystwan.api.templates.feature_template import FeatureTemplate
+
+
+class MockedFeatureTemplate(FeatureTemplate):
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+
+    template_name: str = "test"
+    template_description: str = "test"
+    payload_path: ClassVar[Path] = Path(__file__).parents[1] / "DEPRECATED"
+    type: ClassVar[str] = "test_type"
+
+    num: Optional[str]
@@ -6,7 +6,7 @@ import unittest
 from pathlib import Path
 from typing import Any, Dict, List
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from parameterized import parameterized
@@ -14,6 +14,8 @@ from parameterized import parameterized
 import catalystwan.tests.templates.models as models
 from catalystwan.api.templates.feature_template import FeatureTemplate
 from catalystwan.dataclasses import FeatureTemplateInfo
+from catalystwan.exceptions import TemplateNotFoundError
+from catalystwan.tests.templates.models.mocked_feature_template import MockedFeatureTemplate
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 
@@ -22,6 +24,7 @@ class TestFeatureTemplate(TestCase):
     def setUp(self):
         template: FeatureTemplate
         feature_template_response: List[Dict[str, Any]] = []
+        self.definitions: Dict[str, Dict[str, Any]] = {}
 
         for template in map(models.__dict__.get, models.__all__):
             definition: Dict[str, Any]
@@ -42,9 +45,9 @@ class TestFeatureTemplate(TestCase):
                     "template_type": template.type,
                     "device_type": ["vedge-C8000V"],
                     "version": "15.0.0",
-                    "template_definiton": f"{json.dumps(definition)}",
                 }
             )
+            self.definitions[template.template_name] = definition
 
         self.get_feature_templates_response = DataSequence(
             FeatureTemplateInfo,
@@ -57,6 +60,9 @@ class TestFeatureTemplate(TestCase):
     def test_get(self, template: FeatureTemplate, mock_session):
         # Arrange
         mock_session.api.templates._get_feature_templates.return_value = self.get_feature_templates_response
+        mock_session.api.templates._get_feature_template_definition.return_value = self.definitions[
+            template.template_name
+        ]
 
         # Act
         feature_template_from_get = FeatureTemplate.get(session=mock_session, name=template.template_name)
@@ -65,5 +71,61 @@ class TestFeatureTemplate(TestCase):
         self.assertEqual(feature_template_from_get, template)
 
 
+class TestFeatureTemplateGet(TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.api.templates._get_feature_templates.return_value = DataSequence(
+            FeatureTemplateInfo,
+            [
+                create_dataclass(
+                    FeatureTemplateInfo,
+                    {
+                        "last_updated_by": "admin",
+                        "id": f"id-{index}",
+                        "factory_default": False,
+                        "name": f"template-{index}",
+                        "devices_attached": 0,
+                        "description": f"template {index}",
+                        "last_updated_on": 1111111111111,
+                        "template_type": "test_type",
+                        "device_type": ["vedge-C8000V"],
+                        "version": "15.0.0",
+                    },
+                )
+                for index in range(10)
+            ],
+        )
+        self.session.api.templates._get_feature_template_definition.side_effect = lambda id: {
+            "num": {"vipObjectType": "object", "vipType": "constant", "vipValue": id}
+        }
+        patcher = patch(
+            "catalystwan.utils.feature_template.choose_model.choose_model", return_value=MockedFeatureTemplate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_fetches_single_definition(self):
+        # Act
+        template = FeatureTemplate.get(self.session, "template-3")
+
+        # Assert
+        self.assertEqual((template.template_name, template.num), ("template-3", "id-3"))
+        self.session.api.templates._get_feature_templates.assert_called_once_with(summary=True)
+        self.session.api.templates._get_feature_template_definition.assert_called_once_with("id-3")
+
+    def test_get_many(self):
+        # Act
+        templates = FeatureTemplate.get_many(self.session, ["template-7", "template-2", "template-5"])
+
+        # Assert
+        self.assertEqual([template.num for template in templates], ["id-7", "id-2", "id-5"])
+        self.session.api.templates._get_feature_templates.assert_called_once_with(summary=True)
+        self.assertEqual(self.session.api.templates._get_feature_template_definition.call_count, 3)
+
+    def test_missing_template(self):
+        with self.assertRaises(TemplateNotFoundError):
+            FeatureTemplate.get_many(self.session, ["template-1", "missing"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,27 +4,19 @@
 import json
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import ClassVar, List, Optional
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from parameterized import parameterized
 from pydantic import BaseModel, ConfigDict, Field
 
 from catalystwan.api.template_api import TemplatesAPI
-from catalystwan.api.templates.feature_template import FeatureTemplate
+from catalystwan.api.templates.feature_template import FeatureTemplate, _get_payload_template
+from catalystwan.exceptions import TemplateUndeclaredVariablesError
 from catalystwan.session import ManagerSession
-
-
-class MockedFeatureTemplate(FeatureTemplate):
-    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
-
-    template_name: str = "test"
-    template_description: str = "test"
-    payload_path: ClassVar[Path] = Path(__file__).parent / "DEPRECATED"
-    type: ClassVar[str] = "test_type"
-
-    num: Optional[str]
+from catalystwan.tests.templates.models.mocked_feature_template import MockedFeatureTemplate
 
 
 class MockedFeatureTemplateAlias(FeatureTemplate):
@@ -133,5 +125,42 @@ class TestFeatureTemplate(TestCase):
         self.assertDictEqual(a, definition)
 
 
+class TestGeneratePayloadJinja(TestCase):
+    def setUp(self):
+        _get_payload_template.cache_clear()
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.directory = Path(tmpdir.name)
+        self.addCleanup(_get_payload_template.cache_clear)
+
+    def write_template(self, name: str, source: str) -> Path:
+        path = self.directory / name
+        path.write_text(source)
+        return path
+
+    def test_template_is_compiled_once(self):
+        # Arrange
+        path = self.write_template("num.json.j2", '{"num": "{{ num }}"}')
+        templates = [MockedFeatureTemplate(num=str(index)) for index in range(3)]
+
+        # Act
+        with patch.object(MockedFeatureTemplate, "payload_path", path):
+            payloads = [json.loads(template.generate_payload(MagicMock())) for template in templates]
+
+        # Assert
+        self.assertEqual([payload["num"] for payload in payloads], ["0", "1", "2"])
+        self.assertEqual(_get_payload_template.cache_info().misses, 1)
+
+    def test_undeclared_variable(self):
+        # Arrange
+        path = self.write_template("missing.json.j2", '{"num": "{{ num }}", "other": "{{ missing }}"}')
+
+        # Act & Assert
+        with patch.object(MockedFeatureTemplate, "payload_path", path):
+            with self.assertRaises(TemplateUndeclaredVariablesError) as context:
+                MockedFeatureTemplate(num="1").generate_payload(MagicMock())
+        self.assertIn("missing", context.exception.message)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from catalystwan.api.template_api import TemplatesAPI
+from catalystwan.api.templates.schema_cache import FeatureTemplateSchemaCache, SchemaKey
+from catalystwan.tests.templates.models.mocked_feature_template import MockedFeatureTemplate
+
+SCHEMA_PATH = Path(__file__).parent / "schemas" / "basic" / "basic.json"
+
+
+class TestFeatureTemplateSchemaCache(TestCase):
+    def setUp(self):
+        self.schema = json.loads(SCHEMA_PATH.read_text())
+        self.fetch = MagicMock(return_value=self.schema)
+        self.key = SchemaKey("test_type", "15.0.0", "20.12.1")
+
+    def test_schema_is_fetched_once_per_key(self):
+        # Arrange
+        cache = FeatureTemplateSchemaCache()
+
+        # Act
+        first = cache.get(self.key, self.fetch)
+        second = cache.get(self.key, self.fetch)
+        cache.get(self.key._replace(platform_version="20.9.1"), self.fetch)
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertEqual(self.fetch.call_count, 2)
+        self.assertIs(cache.fields(self.key, first), cache.fields(self.key, second))
+        self.assertIsNot(cache.fields(self.key, json.loads(SCHEMA_PATH.read_text())), cache.fields(self.key, first))
+
+    def test_schema_is_persisted(self):
+        # Arrange
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        FeatureTemplateSchemaCache(tmpdir.name).get(self.key, self.fetch)
+
+        # Act
+        schema = FeatureTemplateSchemaCache(tmpdir.name).get(self.key, self.fetch)
+
+        # Assert
+        self.assertEqual(schema, self.schema)
+        self.fetch.assert_called_once()
+        self.assertEqual([path.name for path in Path(tmpdir.name).iterdir()], [self.key.filename])
+
+    def test_fields_of_unknown_schema_are_parsed(self):
+        cache = FeatureTemplateSchemaCache()
+        self.assertEqual([field.key for field in cache.fields(self.key, self.schema)], ["num"])
+        self.assertEqual(len(cache), 0)
+
+
+class TestTemplatesAPISchemaCache(TestCase):
+    def test_schema_is_downloaded_once(self):
+        # Arrange
+        session = MagicMock()
+        session.platform_version = "20.12.1"
+        session.get.return_value.json.return_value = json.loads(SCHEMA_PATH.read_text())
+        templates_api = TemplatesAPI(session, schema_cache=FeatureTemplateSchemaCache())
+
+        # Act
+        payloads = [
+            templates_api.generate_feature_template_payload(
+                template, templates_api.get_feature_template_schema(template)
+            ).model_dump(by_alias=True, exclude_none=True, mode="json")
+            for template in [MockedFeatureTemplate(num="1"), MockedFeatureTemplate(num="2")]
+        ]
+
+        # Assert
+        session.get.assert_called_once_with(url="/dataservice/template/feature/types/definition/test_type/15.0.0")
+        self.assertEqual([payload["templateDefinition"]["num"]["vipValue"] for payload in payloads], ["1", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 import io
 import tempfile
 import unittest
+from json import JSONDecodeError
 from pathlib import Path
 from unittest.mock import ANY, patch
 
@@ -141,6 +142,18 @@ class TestAdminTechAPI(unittest.TestCase):
             )
         mock_session.post.assert_called_once()
 
+    @patch("catalystwan.session.ManagerSession")
+    @patch("requests.Response")
+    def test_generate_error_not_json(self, mock_session, mock_response):
+        # Arrange
+        mock_session.post.return_value = mock_response
+        mock_response.status_code = 500
+        mock_response.json.side_effect = JSONDecodeError("Expecting value", "<html>Server Error</html>", 0)
+        # Act/Assert
+        with self.assertRaises(GenerateAdminTechLogError):
+            AdminTechAPI(mock_session).generate(device_id=self.device_ip, polling_timeout=0.01, polling_interval=0.01)
+        mock_session.post.assert_called_once()
+
     @patch("catalystwan.session.ManagerSession")
     @patch("requests.Response")
     def test_delete(self, mock_session, mock_response):
@@ -0,0 +1,128 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import asyncio
+import unittest
+from typing import List
+
+import httpx
+
+from catalystwan.async_session import AsyncManagerSession
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+from catalystwan.session import ManagerSessionState
+from catalystwan.utils.session_type import SessionType
+
+EXPIRED_HEADERS = {
+    "set-cookie": "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/",
+    "date": "Fri, 01 Mar 2024 12:00:00 GMT",
+}
+SERVER_INFO = {
+    "data": {
+        "platformVersion": "20.12.1",
+        "tenancyMode": "SingleTenant",
+        "userMode": "tenant",
+        "viewMode": "tenant",
+    }
+}
+
+
+class FakeManager:
+    def __init__(self):
+        self.logins = 0
+        self.requests: List[httpx.Request] = []
+        self.expired = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/j_security_check":
+            self.logins += 1
+            self.expired = False
+            return httpx.Response(200, text="", headers={"set-cookie": f"JSESSIONID=valid{self.logins}; Path=/"})
+        if path == "/dataservice/client/token":
+            return httpx.Response(200, text=f"token{self.logins}")
+        if path == "/dataservice/client/server":
+            return httpx.Response(200, json=SERVER_INFO)
+        if path == "/dataservice/device":
+            if self.expired:
+                return httpx.Response(200, text="<html/>", headers=EXPIRED_HEADERS)
+            return httpx.Response(200, json={"data": [{"deviceId": "1.1.1.1"}]})
+        if path == "/dataservice/error":
+            return httpx.Response(400, json={"error": {"message": "Bad request", "details": "details", "code": "X"}})
+        return httpx.Response(404)
+
+
+class TestAsyncManagerSession(unittest.TestCase):
+    def setUp(self):
+        self.manager = FakeManager()
+        self.session = AsyncManagerSession(
+            "example.com", "admin", "admin", port=8443, transport=httpx.MockTransport(self.manager)
+        )
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_login(self):
+        async def scenario():
+            await self.session.enter_state(ManagerSessionState.LOGIN)
+            return await self.session.get_json("/dataservice/device")
+
+        # Act
+        data = self.run_async(scenario())
+
+        # Assert
+        self.assertEqual(data, {"data": [{"deviceId": "1.1.1.1"}]})
+        self.assertEqual(self.session.session_type, SessionType.SINGLE_TENANT)
+        self.assertEqual(self.session.platform_version, "20.12.1")
+        self.assertEqual(self.manager.requests[-1].url, "https://example.com:8443/dataservice/device")
+        self.assertEqual(self.manager.requests[-1].headers["x-xsrf-token"], "token1")
+        self.assertEqual(self.manager.requests[-1].headers["cookie"], "JSESSIONID=valid1")
+
+    def test_concurrent_requests_relogin_once(self):
+        async def scenario():
+            await self.session.enter_state(ManagerSessionState.LOGIN)
+            self.manager.expired = True
+            return await asyncio.gather(*[self.session.get_data("/dataservice/device") for _ in range(10)])
+
+        # Act
+        results = self.run_async(scenario())
+
+        # Assert
+        self.assertEqual(results, [[{"deviceId": "1.1.1.1"}]] * 10)
+        self.assertEqual(self.manager.logins, 2)
+
+    def test_endpoints_return_awaitables(self):
+        async def scenario():
+            await self.session.enter_state(ManagerSessionState.LOGIN)
+            return await self.session.endpoints.client.server()
+
+        # Act
+        server_info = self.run_async(scenario())
+
+        # Assert
+        self.assertEqual(server_info.platform_version, "20.12.1")
+
+    def test_http_error(self):
+        async def scenario():
+            await self.session.enter_state(ManagerSessionState.LOGIN)
+            await self.session.get("/dataservice/error")
+
+        # Act, Assert
+        with self.assertRaises(ManagerHTTPError) as context:
+            self.run_async(scenario())
+        self.assertEqual(context.exception.info.message, "Bad request")
+
+    def test_transport_error(self):
+        def raise_connect_error(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        session = AsyncManagerSession(
+            "example.com", "admin", "admin", transport=httpx.MockTransport(raise_connect_error)
+        )
+
+        # Act, Assert
+        with self.assertRaises(ManagerRequestException):
+            self.run_async(session.get("/dataservice/device"))
+
+
+if __name__ == "__main__":
+    unittest.main()
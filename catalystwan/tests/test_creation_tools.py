@@ -10,7 +10,13 @@ from attrs import define, field
 from parameterized import parameterized
 
 from catalystwan.dataclasses import TLOC, DataclassBase, Device, PacketSetup, TacacsServer, TenantTacacsServer
-from catalystwan.utils.creation_tools import FIELD_NAME, asdict, convert_attributes, create_dataclass
+from catalystwan.utils.creation_tools import (
+    FIELD_NAME,
+    asdict,
+    convert_attributes,
+    create_dataclass,
+    create_dataclasses,
+)
 from catalystwan.utils.personality import Personality
 from catalystwan.utils.reachability import Reachability
 
@@ -150,6 +156,16 @@ class TestCreationTools(unittest.TestCase):
         assert isinstance(conv_data.date_time_1, datetime.datetime)
         assert isinstance(conv_data.date_time_2, datetime.datetime)
 
+    def test_create_dataclasses(self):
+        # Arrange
+        data = [{"RANDOM": 1, "unknown": "x"}, {"rnd": 2}, {"RANDOM": 3, "rnd": 4}]
+        # Act
+        objects = create_dataclasses(_TestObjectB, data)
+        # Assert
+        self.assertEqual(objects, [create_dataclass(_TestObjectB, item) for item in data])
+        self.assertEqual(objects, [_TestObjectB(1), _TestObjectB(2), _TestObjectB(3)])
+        self.assertEqual(data[0], {"RANDOM": 1, "unknown": "x"})
+
 
 if __name__ == "__main__":
     unittest.main()
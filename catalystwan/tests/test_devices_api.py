@@ -1,7 +1,7 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from parameterized import parameterized  # type: ignore
 from pytest import mark  # type: ignore
@@ -212,6 +212,36 @@ class TestDevicesAPI(TestCase):
         # Assert
         self.assertEqual(answer, self.devices_dataseq)
 
+    @parameterized.expand([[1, 1], [1, 4], [2, 4], [3, 2]])
+    @patch("catalystwan.session.ManagerSession")
+    def test_get_chunks(self, chunk_size, max_workers, mock_session):
+        # Arrange
+        mock_session.endpoints.monitoring_device_details.list_all_devices.return_value = self.list_all_devices_resp
+        devices_by_id = {device.id: device for device in self.devices_dataseq}
+
+        def get_system_info(url, params):
+            response = MagicMock()
+            response.dataseq.return_value = DataSequence(Device, [devices_by_id[id] for id in params["deviceId"]])
+            return response
+
+        mock_session.get.side_effect = get_system_info
+
+        # Act
+        answer = DevicesAPI(mock_session).get(chunk_size=chunk_size, max_workers=max_workers)
+
+        # Assert
+        self.assertEqual(answer, self.devices_dataseq)
+        self.assertEqual(mock_session.get.call_count, -(-len(self.devices) // chunk_size))
+
+    @parameterized.expand([[0, None], [-1, None], [None, 0], [None, -2]])
+    @patch("catalystwan.session.ManagerSession")
+    def test_get_invalid_chunks(self, chunk_size, max_workers, mock_session):
+        # Act, Assert
+        with self.assertRaises(ValueError):
+            DevicesAPI(mock_session).get(chunk_size=chunk_size, max_workers=max_workers)
+        mock_session.endpoints.monitoring_device_details.list_all_devices.assert_not_called()
+        mock_session.get.assert_not_called()
+
     @parameterized.expand(
         [
             ["aaaaaaaa-6169-445c-8e49-c0bdaaaaaaa", 0],
@@ -0,0 +1,87 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from benchmarks.suite import BENCHMARKS, run_suite
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.api.task_status_api import Task
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.session import create_manager_session
+from catalystwan.vmanage_auth import UnauthorizedAccessError
+
+
+class TestFakeManager(unittest.TestCase):
+    def start(self, **config) -> FakeManagerServer:
+        server = FakeManagerServer(FakeManagerConfig(**config)).start()
+        self.addCleanup(server.stop)
+        return server
+
+    def login(self, server: FakeManagerServer, password: str = "admin"):
+        return create_manager_session(server.url, "admin", password, port=server.port)
+
+    def test_devices_get(self):
+        # Arrange
+        server = self.start(devices=250)
+        session = self.login(server)
+
+        # Act
+        devices = DevicesAPI(session).get(chunk_size=100)
+
+        # Assert
+        self.assertEqual(len(devices), 250)
+        self.assertEqual(devices[249].hostname, "edge-249")
+        self.assertEqual(server.manager.request_counts["/dataservice/device/system/info"], 3)
+
+    def test_invalid_credentials(self):
+        server = self.start()
+        with self.assertRaises(UnauthorizedAccessError):
+            self.login(server, password="invalid")
+
+    def test_relogin_after_session_expired(self):
+        # Arrange
+        server = self.start(session_lifetime_requests=3)
+        session = self.login(server)
+
+        # Act
+        for _ in range(3):
+            session.get_data("/dataservice/device")
+
+        # Assert
+        self.assertEqual(server.manager.logins, 2)
+
+    def test_error_injection(self):
+        # Arrange
+        server = self.start(error_status_code=503)
+        session = self.login(server)
+        server.manager.config.error_rate = 1
+
+        # Act, Assert
+        with self.assertRaises(ManagerHTTPError) as context:
+            session.get("/dataservice/device")
+        self.assertEqual(context.exception.response.status_code, 503)
+
+    def test_task_status(self):
+        # Arrange
+        server = self.start()
+        session = self.login(server)
+        task_id = server.manager.create_task(pending_polls=1)
+
+        # Act
+        result = Task(session, task_id).wait_for_completed(timeout_seconds=5, interval_seconds=1)
+
+        # Assert
+        self.assertTrue(result.result)
+        self.assertEqual(server.manager.request_counts[f"/dataservice/device/action/status/{task_id}"], 2)
+
+    def test_run_suite(self):
+        # Act
+        results = run_suite(fleet_sizes=[10], iterations=1)
+
+        # Assert
+        self.assertEqual([result.name for result in results], list(BENCHMARKS))
+        self.assertTrue(all(result.fleet_size == 10 and result.min > 0 for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,17 @@ import unittest
 from unittest import TestCase
 
 from parameterized import parameterized
+from pydantic import BaseModel, Field
 
 from catalystwan.api.templates.feature_template_field import get_path_dict
+from catalystwan.utils.pydantic_field import get_field_index
+
+
+class IndexedModel(BaseModel):
+    name: str
+    as_num: str = Field(alias="as-num")
+    vpn_id: int = Field(json_schema_extra={"vmanage_key": "vpn-id", "data_path": ["vpn"]})
+    shadowed: str = Field(alias="name")
 
 
 class TestGetPathDict(TestCase):
@@ -29,5 +38,27 @@ class TestGetPathDict(TestCase):
         self.assertEqual(output, answer)
 
 
+class TestGetFieldIndex(TestCase):
+    @parameterized.expand(
+        [
+            ((), "name", "name"),
+            ((), "as-num", "as_num"),
+            ((), "as_num", "as_num"),
+            (("vpn",), "vpn-id", "vpn_id"),
+            (("vpn",), "vpn_id", "vpn_id"),
+        ]
+    )
+    def test_matches_first_declared_field(self, data_path, key, field_name):
+        # Arrange, Act
+        index = get_field_index(IndexedModel)
+
+        # Assert
+        self.assertEqual(index[(data_path, key)][0], field_name)
+
+    def test_key_outside_data_path_is_not_matched(self):
+        self.assertNotIn(((), "vpn-id"), get_field_index(IndexedModel))
+        self.assertIs(get_field_index(IndexedModel), get_field_index(IndexedModel))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from catalystwan.api.api_container import APIContainer
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+from catalystwan.utils.lazy import LazySessionAttribute
+
+
+class TestLazySessionAttribute(unittest.TestCase):
+    def test_member_created_once_on_first_access(self):
+        # Arrange
+        class Member:
+            instances = 0
+
+            def __init__(self, session):
+                Member.instances += 1
+                self.session = session
+
+        class Container:
+            member: LazySessionAttribute[Member] = LazySessionAttribute(__name__, "Member")
+
+            def __init__(self, session):
+                self._session = session
+
+        globals()["Member"] = Member
+        self.addCleanup(globals().pop, "Member")
+        session = MagicMock()
+        container = Container(session)
+
+        # Act
+        first = container.member
+        second = container.member
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertIs(first.session, session)
+        self.assertEqual(Member.instances, 1)
+        self.assertIsInstance(Container.member, LazySessionAttribute)
+
+    def test_containers_resolve_members(self):
+        # Arrange
+        session = MagicMock()
+
+        # Act
+        api = APIContainer(session)
+        endpoints = APIEndpointContainter(session)
+
+        # Assert
+        self.assertIs(api.devices.session, session)
+        self.assertIs(api.templates.session, session)
+        self.assertIs(endpoints.configuration.policy.list.app._client, session)
+        self.assertIs(endpoints.tenant_management._client, session)
+
+    def test_session_import_does_not_import_container_members(self):
+        # Arrange
+        script = (
+            "import sys, catalystwan.session;"
+            "print('catalystwan.api.template_api' in sys.modules, "
+            "'catalystwan.endpoints.configuration.policy.list.app' in sys.modules)"
+        )
+
+        # Act
+        output = subprocess.check_output([sys.executable, "-c", script], text=True)
+
+        # Assert
+        self.assertEqual(output.split(), ["False", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import socket
+import unittest
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.endpoints.client import Client
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.metrics import Histogram, MetricsRegistry, StatsDSink
+from catalystwan.retry_policy import RetryPolicy
+from catalystwan.session import create_manager_session
+
+
+class TestHistogram(unittest.TestCase):
+    def test_cumulative_buckets(self):
+        # Arrange
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        # Assert
+        self.assertEqual(histogram.cumulative_counts(), [2, 3, 4])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.mean, 1.4125)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_prometheus_text(self):
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.5,))
+        registry.increment("requests", endpoint='Client."about"', status="200")
+        registry.observe("request_seconds", 0.25, endpoint="Client.about")
+
+        # Act
+        text = registry.to_prometheus()
+
+        # Assert
+        self.assertEqual(
+            text.splitlines(),
+            [
+                "# TYPE catalystwan_requests_total counter",
+                'catalystwan_requests_total{endpoint="Client.\\"about\\"",status="200"} 1',
+                "# TYPE catalystwan_request_seconds histogram",
+                'catalystwan_request_seconds_bucket{endpoint="Client.about",le="0.5"} 1',
+                'catalystwan_request_seconds_bucket{endpoint="Client.about",le="+Inf"} 1',
+                'catalystwan_request_seconds_sum{endpoint="Client.about"} 0.25',
+                'catalystwan_request_seconds_count{endpoint="Client.about"} 1',
+            ],
+        )
+
+    def test_counter_sums_matching_series(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.increment("requests", endpoint="a", status="200")
+        registry.increment("requests", 2, endpoint="a", status="503")
+        registry.increment("requests", endpoint="b", status="200")
+
+        # Act, Assert
+        self.assertEqual(registry.counter("requests", endpoint="a"), 3)
+        self.assertEqual(registry.counter("requests", status="200"), 2)
+
+
+class TestStatsDSink(unittest.TestCase):
+    def setUp(self):
+        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.receiver.bind(("127.0.0.1", 0))
+        self.receiver.settimeout(5)
+        self.addCleanup(self.receiver.close)
+
+    def test_dogstatsd_tags(self):
+        # Arrange
+        sink = StatsDSink(port=self.receiver.getsockname()[1])
+        self.addCleanup(sink.close)
+
+        # Act
+        sink.increment("requests", endpoint="Client.about", status="200")
+        sink.observe("request_seconds", 0.25, endpoint="Client.about")
+
+        # Assert
+        self.assertEqual(self.receiver.recv(1024), b"catalystwan.requests:1|c|#endpoint:Client.about,status:200")
+        self.assertEqual(self.receiver.recv(1024), b"catalystwan.request_seconds:250|ms|#endpoint:Client.about")
+
+    def test_plain_names(self):
+        sink = StatsDSink(tags=False)
+        self.addCleanup(sink.close)
+        self.assertEqual(
+            sink.format("response_bytes", "10|h", {"endpoint": "GET /dataservice/device"}),
+            "catalystwan.response_bytes.GET__dataservice_device:10|h",
+        )
+
+
+class TestSessionMetrics(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(devices=10, error_status_code=503)).start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+        self.registry = MetricsRegistry()
+        self.session.metrics_sinks.append(self.registry)
+
+    def test_endpoint_labels(self):
+        # Act
+        Client(self.session).about()
+        self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.registry.counter("requests", endpoint="Client.about", status="200"), 1)
+        self.assertEqual(self.registry.counter("requests", endpoint="GET /dataservice/device"), 1)
+        self.assertGreater(self.registry.counter("response_bytes", endpoint="GET /dataservice/device"), 0)
+
+    def test_parse_time(self):
+        # Act
+        DevicesAPI(self.session).get()
+
+        # Assert
+        summaries = {summary.endpoint: summary for summary in self.registry.endpoint_summary()}
+        self.assertEqual(
+            set(summaries), {"MonitoringDeviceDetails.list_all_devices", "GET /dataservice/device/system/info"}
+        )
+        self.assertTrue(all(summary.requests == 1 and summary.parse_seconds > 0 for summary in summaries.values()))
+
+    def test_retries_and_relogins(self):
+        # Arrange
+        self.session.retry_policy = RetryPolicy(max_retries=2, sleep=lambda _: None)
+        self.server.manager.config.error_rate = 1
+
+        # Act
+        with self.assertRaises(ManagerHTTPError):
+            self.session.get("/dataservice/device")
+        self.server.manager.config.error_rate = 0
+        self.server.manager.expire_sessions()
+        self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.registry.counter("retries"), 2)
+        self.assertEqual(self.registry.counter("relogins", endpoint="GET /dataservice/device"), 1)
+        self.assertEqual(self.registry.counter("requests", endpoint="GET /dataservice/device", status="503"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import subprocess
+import sys
+import unittest
+from traceback import extract_stack
+
+import catalystwan
+from catalystwan import get_first_external_stack_frame, is_file_in_package
+
+
+class TestPackageSources(unittest.TestCase):
+    def test_is_file_in_package(self):
+        self.assertTrue(is_file_in_package(catalystwan.__file__))
+        self.assertTrue(is_file_in_package(__file__))
+        self.assertFalse(is_file_in_package(json.__file__))
+        self.assertFalse(is_file_in_package(catalystwan.package_directory() + "logging.conf"))
+        self.assertFalse(is_file_in_package(catalystwan.package_directory().rstrip("/\\") + "_extra/module.py"))
+
+    def test_get_first_external_stack_frame(self):
+        # Arrange
+        stack = extract_stack()
+        stack.append(extract_stack(limit=1)[0])
+        stack[-1].filename = catalystwan.__file__
+
+        # Act
+        frame = get_first_external_stack_frame(stack)
+
+        # Assert
+        self.assertIsNotNone(frame)
+        self.assertFalse(is_file_in_package(frame.filename))
+
+    def test_pkg_src_list_created_on_access(self):
+        self.assertIn(catalystwan.__file__, [str(p) for p in catalystwan.pkg_src_list])
+
+    def test_import_does_not_walk_package_sources(self):
+        # Arrange
+        script = (
+            "import pathlib\n"
+            "def glob(*args, **kwargs):\n"
+            "    raise AssertionError('glob called on import')\n"
+            "pathlib.Path.glob = pathlib.Path.rglob = glob\n"
+            "import catalystwan.session\n"
+        )
+
+        # Act, Assert
+        subprocess.check_call([sys.executable, "-c", script])
+
+
+if __name__ == "__main__":
+    unittest.main()
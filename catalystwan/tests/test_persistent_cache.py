@@ -0,0 +1,138 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import stat
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from requests import Response
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.persistent_cache import PersistentResponseCache
+from catalystwan.response_cache import CacheEntry, cache_key
+from catalystwan.session import create_manager_session
+
+
+def make_response(content: bytes, etag: str = "") -> Response:
+    response = Response()
+    response.status_code = 200
+    response.url = "https://vmanage/dataservice/device"
+    response.headers["Content-Type"] = "application/json"
+    response.headers["Set-Cookie"] = "JSESSIONID=secret"
+    if etag:
+        response.headers["ETag"] = etag
+    response._content = content
+    return response
+
+
+class TestPersistentResponseCache(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "cache" / "responses.db"
+
+    def open_cache(self, **kwargs) -> PersistentResponseCache:
+        cache = PersistentResponseCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_entries_survive_reopening(self):
+        # Arrange
+        key = cache_key("https://vmanage/dataservice/device", {"x": 1}, "admin@vmanage")
+        self.open_cache().store(key, CacheEntry.from_response(make_response(b'{"data": []}', '"v1"'), 100.0))
+
+        # Act
+        entry = self.open_cache().load(key)
+
+        # Assert
+        assert entry is not None
+        self.assertEqual(entry.response.json(), {"data": []})
+        self.assertEqual(entry.response.headers["content-type"], "application/json")
+        self.assertNotIn("Set-Cookie", entry.response.headers)
+        self.assertEqual((entry.expires, entry.etag), (100.0, '"v1"'))
+
+    def test_namespaces_are_separated(self):
+        # Arrange
+        cache = self.open_cache()
+        cache.store(cache_key("https://vmanage/dataservice/device", namespace="a"), CacheEntry(make_response(b""), 1))
+
+        # Act, Assert
+        self.assertIsNone(cache.load(cache_key("https://vmanage/dataservice/device", namespace="b")))
+
+    def test_related_paths_are_removed(self):
+        # Arrange
+        cache = self.open_cache()
+        for url in ["https://vmanage/dataservice/template/device", "https://vmanage/dataservice/device"]:
+            cache.store(cache_key(url), CacheEntry(make_response(b""), 1))
+
+        # Act
+        removed = cache.invalidate("https://vmanage/dataservice/template/device/config/attachfeature")
+
+        # Assert
+        self.assertEqual(removed, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_oldest_entries_are_evicted(self):
+        # Arrange
+        cache = self.open_cache(max_entries=2)
+
+        # Act
+        for index in range(3):
+            cache.store(cache_key(f"https://vmanage/dataservice/{index}"), CacheEntry(make_response(b""), 1))
+
+        # Assert
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertIsNone(cache.load(cache_key("https://vmanage/dataservice/0")))
+
+    def test_database_is_readable_by_owner_only(self):
+        # Act
+        cache = self.open_cache()
+        cache.store(cache_key("https://vmanage/dataservice/device"), CacheEntry(make_response(b"[]"), 0.0))
+
+        # Assert
+        self.assertEqual(stat.S_IMODE(self.path.parent.stat().st_mode), 0o700)
+        self.assertEqual(stat.S_IMODE(self.path.stat().st_mode), 0o600)
+
+
+class TestSessionPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(etags=True)).start()
+        self.addCleanup(self.server.stop)
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "responses.db"
+
+    def run_job(self) -> PersistentResponseCache:
+        """Simulates fresh process: new session and cache opened on the same database"""
+        session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+        cache = PersistentResponseCache(self.path, default_ttl=0)
+        self.addCleanup(cache.close)
+        session.response_cache = cache
+        self.assertEqual(len(DevicesAPI(session).get()), 100)
+        return cache
+
+    def test_unchanged_data_is_revalidated(self):
+        # Act
+        first = self.run_job()
+        second = self.run_job()
+
+        # Assert
+        self.assertEqual(first.stats.revalidations, 0)
+        self.assertEqual(second.stats.revalidations, 2)  # device list and system info
+        self.assertEqual(second.stats.misses, 0)
+
+    def test_changed_data_is_downloaded(self):
+        # Act
+        self.run_job()
+        self.server.manager.devices[0]["host-name"] = "changed"
+        second = self.run_job()
+
+        # Assert
+        self.assertEqual(second.stats.revalidations, 0)
+        self.assertEqual(second.stats.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+from typing import List
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter, TokenBucket
+from catalystwan.session import create_manager_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_constant_rate(self):
+        # Arrange
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=5, clock=clock, sleep=clock.sleep)
+
+        # Act
+        delays = [bucket.acquire() for _ in range(8)]
+
+        # Assert
+        self.assertEqual(delays[:5], [0.0] * 5)
+        self.assertEqual([round(delay, 6) for delay in delays[5:]], [0.1] * 3)
+        self.assertAlmostEqual(clock.now, 0.3)
+
+    def test_refill_is_capped(self):
+        # Arrange
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+        clock.now = 100
+
+        # Act
+        delays = [bucket.acquire() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(delays, [0.0, 0.0, 1.0])
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_longest_prefix_bucket(self):
+        # Arrange
+        limiter = RateLimiter(rate=100).limit("/dataservice/device", 10).limit("/dataservice/device/action", 1)
+
+        # Act, Assert
+        self.assertEqual(limiter.bucket("/dataservice/device/action/status/1").rate, 1)  # type: ignore
+        self.assertEqual(limiter.bucket("/dataservice/device/system/info").rate, 10)  # type: ignore
+        self.assertIs(limiter.bucket("/dataservice/template/feature"), limiter.default)
+
+    def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+        self.assertIsNone(limiter.bucket("/dataservice/device"))
+        self.assertEqual(limiter.acquire("/dataservice/device"), 0.0)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def test_additive_increase(self):
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        # Act
+        for _ in range(20):
+            limiter.release(limiter.acquire())
+
+        # Assert
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        started = [limiter.acquire() for _ in range(8)]
+
+        # Act
+        for start in started:
+            limiter.release(start, overloaded=True)
+        limiter.release(limiter.acquire(), overloaded=True)
+
+        # Assert
+        self.assertEqual(limiter.limit, 4)
+
+    def test_latency_threshold(self):
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_threshold_seconds=0.01)
+
+        # Act
+        started = limiter.acquire()
+        sleep(0.02)
+        limiter.release(started)
+
+        # Assert
+        self.assertEqual(limiter.limit, 4)
+
+    def test_limits_requests_in_flight(self):
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        lock = Lock()
+        in_flight: List[int] = []
+
+        def work(_):
+            started = limiter.acquire()
+            with lock:
+                in_flight.append(limiter.in_flight)
+            sleep(0.01)
+            limiter.release(started)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(24)))
+
+        # Assert
+        self.assertEqual(max(in_flight), 3)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+
+
+class TestSessionThrottling(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(error_status_code=503)).start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+
+    def test_overload_shrinks_concurrency(self):
+        # Arrange
+        self.session.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        self.server.manager.config.error_rate = 1
+
+        # Act
+        with self.assertRaises(ManagerHTTPError):
+            self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.session.concurrency_limiter.limit, 4)
+        self.assertEqual(self.session.concurrency_limiter.in_flight, 0)
+
+    def test_rate_limited_endpoint_class(self):
+        # Arrange
+        self.session.rate_limiter = RateLimiter().limit("/dataservice/device", rate=20, burst=1)
+
+        # Act
+        delays = []
+        for _ in range(3):
+            self.session.get("/dataservice/device")
+            delays.append(self.session.rate_limiter.acquire("/dataservice/client/server"))
+
+        # Assert
+        self.assertEqual(delays, [0.0] * 3)
+        self.assertGreater(self.session.rate_limiter.acquire("/dataservice/device"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import logging
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from catalystwan.request_trace import JSONLinesTraceSink, RequestTrace, RingBufferTraceSink, emit_trace
+
+
+class TestRequestTrace(unittest.TestCase):
+    def setUp(self):
+        self.response = MagicMock()
+        self.response.status_code = 200
+        self.response.elapsed = timedelta(milliseconds=1500)
+        self.response.request.method = "GET"
+        self.response.request.url = "https://example.com/dataservice/device"
+        self.formatter = MagicMock(return_value="formatted")
+        self.logger = logging.getLogger("test_request_trace")
+
+    def test_summary_does_not_format(self):
+        # Arrange
+        trace = RequestTrace(self.response, None, self.formatter)
+        # Act
+        summary = trace.summary()
+        # Assert
+        self.formatter.assert_not_called()
+        self.assertEqual(summary["method"], "GET")
+        self.assertEqual(summary["url"], "https://example.com/dataservice/device")
+        self.assertEqual(summary["status_code"], 200)
+        self.assertEqual(summary["elapsed-seconds"], 1.5)
+
+    def test_str_formats(self):
+        # Arrange
+        trace = RequestTrace(self.response, None, self.formatter)
+        # Act, Assert
+        self.assertEqual(str(trace), "formatted")
+        self.formatter.assert_called_once_with(self.response, None)
+
+    def test_emit_trace_skipped_when_debug_disabled(self):
+        # Arrange
+        self.logger.setLevel(logging.INFO)
+        # Act
+        emit_trace(self.logger, [], self.response, None, self.formatter)
+        # Assert
+        self.formatter.assert_not_called()
+
+    def test_emit_trace_formats_when_debug_enabled(self):
+        # Arrange
+        self.logger.setLevel(logging.DEBUG)
+        # Act
+        with self.assertLogs(self.logger, level="DEBUG") as log:
+            emit_trace(self.logger, [], self.response, None, self.formatter)
+        # Assert
+        self.assertEqual(log.records[0].getMessage(), "formatted")
+
+    def test_ring_buffer_sink(self):
+        # Arrange
+        self.logger.setLevel(logging.INFO)
+        sink = RingBufferTraceSink(maxlen=2)
+        # Act
+        for _ in range(3):
+            emit_trace(self.logger, [sink], self.response, None, self.formatter)
+        # Assert
+        self.assertEqual(len(sink.records), 2)
+        self.formatter.assert_not_called()
+
+    def test_json_lines_sink(self):
+        # Arrange
+        self.logger.setLevel(logging.INFO)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "trace.jsonl"
+            sink = JSONLinesTraceSink(path)
+            # Act
+            emit_trace(self.logger, [sink], self.response, None, self.formatter)
+            emit_trace(self.logger, [sink], None, self.response.request, self.formatter)
+            sink.close()
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+        # Assert
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["status_code"], 200)
+        self.assertIsNone(lines[1]["status_code"])
+        self.assertEqual(lines[1]["url"], "https://example.com/dataservice/device")
+
+
+if __name__ == "__main__":
+    unittest.main()
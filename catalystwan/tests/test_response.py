@@ -10,6 +10,7 @@ from pydantic import BaseModel as BaseModelV2
 from pydantic import Field as FieldV2
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import Field as FieldV1
+from requests.exceptions import JSONDecodeError
 
 from catalystwan.dataclasses import DataclassBase
 from catalystwan.response import ManagerErrorInfo, ManagerResponse
@@ -168,3 +169,34 @@ class TestResponse(unittest.TestCase):
             assert error_info.message is None
             assert error_info.details is None
             assert error_info.code is None
+
+    def test_json_not_decoded_until_accessed(self):
+        # Arrange, Act
+        ManagerResponse(self.response_mock)
+        # Assert
+        self.response_mock.json.assert_not_called()
+
+    def test_json_decoded_once(self):
+        # Arrange
+        self.response_mock.json.return_value = {"data": {"key1": "string", "key2": 66}}
+        vmng_response = ManagerResponse(self.response_mock)
+        # Act
+        vmng_response.dataseq(ParsedDataTypePydanticV2)
+        vmng_response.dataobj(ParsedDataTypePydanticV2)
+        vmng_response.get_error_info()
+        json = vmng_response.json()
+        # Assert
+        self.response_mock.json.assert_called_once_with()
+        assert json == {"data": {"key1": "string", "key2": 66}}
+
+    def test_json_decode_error_cached(self):
+        # Arrange
+        self.response_mock.json.side_effect = JSONDecodeError("Expecting value", "<html/>", 0)
+        vmng_response = ManagerResponse(self.response_mock)
+        # Act
+        error_info = vmng_response.get_error_info()
+        # Assert
+        assert error_info.message is None
+        with self.assertRaises(JSONDecodeError):
+            vmng_response.json()
+        self.response_mock.json.assert_called_once_with()
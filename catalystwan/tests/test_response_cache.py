@@ -0,0 +1,167 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+
+from requests import Response
+
+from benchmarks.fake_manager import FakeManagerServer
+from catalystwan.endpoints.client import Client
+from catalystwan.response_cache import ResponseCache, cache_key
+from catalystwan.session import create_manager_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_response(status_code: int = 200) -> Response:
+    response = Response()
+    response.status_code = status_code
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(max_entries=2, clock=self.clock)
+        self.sent = 0
+
+    def send(self, status_code: int = 200) -> Response:
+        self.sent += 1
+        return make_response(status_code)
+
+    def fetch(self, method: str, url: str, ttl=10, params=None, status_code: int = 200) -> Response:
+        return self.cache.fetch(method, url, params, ttl, lambda headers: self.send(status_code))
+
+    def test_expires_after_ttl(self):
+        # Act
+        first = self.fetch("GET", "https://vmanage/dataservice/template/device")
+        second = self.fetch("GET", "https://vmanage/dataservice/template/device")
+        self.clock.now = 10
+        third = self.fetch("GET", "https://vmanage/dataservice/template/device")
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(self.sent, 2)
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses), (1, 2))
+
+    def test_not_cached_without_ttl(self):
+        # Act
+        self.fetch("GET", "https://vmanage/dataservice/device", ttl=None)
+        self.fetch("GET", "https://vmanage/dataservice/device", ttl=None)
+
+        # Assert
+        self.assertEqual(self.sent, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_errors_are_not_cached(self):
+        # Act
+        self.fetch("GET", "https://vmanage/dataservice/device", status_code=503)
+
+        # Assert
+        self.assertEqual(len(self.cache), 0)
+
+    def test_mutation_invalidates_related_paths(self):
+        # Arrange
+        self.fetch("GET", "https://vmanage/dataservice/template/policy/list/app")
+        self.fetch("GET", "https://vmanage/dataservice/client/about")
+
+        # Act
+        self.fetch("PUT", "https://vmanage/dataservice/template/policy/list/app/1234")
+        self.fetch("GET", "https://vmanage/dataservice/client/about")
+
+        # Assert
+        self.assertEqual(self.cache.stats.invalidations, 1)
+        self.assertEqual(self.cache.stats.hits, 1)
+
+    def test_lru_eviction(self):
+        # Act
+        self.fetch("GET", "https://vmanage/dataservice/a")
+        self.fetch("GET", "https://vmanage/dataservice/b")
+        self.fetch("GET", "https://vmanage/dataservice/a")
+        self.fetch("GET", "https://vmanage/dataservice/c")
+        self.fetch("GET", "https://vmanage/dataservice/a")
+
+        # Assert
+        self.assertEqual(self.cache.stats.evictions, 1)
+        self.assertEqual(self.cache.stats.hits, 2)
+
+    def test_revalidation(self):
+        # Arrange
+        cached = make_response()
+        cached.headers["ETag"] = '"v1"'
+        sent_headers = []
+
+        def send(headers):
+            sent_headers.append(headers)
+            return cached if not headers else make_response(304)
+
+        # Act
+        responses = [self.cache.fetch("GET", "https://vmanage/dataservice/device", None, 0, send) for _ in range(2)]
+
+        # Assert
+        self.assertEqual(responses, [cached, cached])
+        self.assertEqual(sent_headers, [{}, {"If-None-Match": '"v1"'}])
+        self.assertEqual((self.cache.stats.misses, self.cache.stats.revalidations), (1, 1))
+
+    def test_key_ignores_params_order(self):
+        self.assertEqual(cache_key("/a", {"x": 1, "y": 2}), cache_key("/a", {"y": 2, "x": 1}))
+        self.assertNotEqual(cache_key("/a", {"x": 1}), cache_key("/a", {"x": 2}))
+
+
+class TestSessionResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer().start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+        self.session.response_cache = ResponseCache()
+        self.server.manager.request_counts.clear()
+
+    def test_endpoint_declared_ttl(self):
+        # Act
+        about = [Client(self.session).about() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/client/about"], 1)
+        self.assertEqual(about[0], about[2])
+        self.assertEqual(self.session.response_cache.stats.hits, 2)  # type: ignore
+
+    def test_session_request_ttl(self):
+        # Act
+        self.session.get("/dataservice/device", cache_ttl=60)
+        self.session.get("/dataservice/device", cache_ttl=60)
+        self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/device"], 2)
+
+    def test_cached_response_is_not_shared(self):
+        # Arrange
+        for _ in range(2):
+            self.session.request("GET", "/dataservice/device", cache_ttl=60).json()["data"].clear()
+
+        # Act
+        response = self.session.request("GET", "/dataservice/device", cache_ttl=60)
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/device"], 1)
+        self.assertTrue(response.json()["data"])
+
+    def test_login_fetches_server_info(self):
+        # Arrange
+        self.session.server()
+
+        # Act
+        self.session.login()
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/client/server"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+
+from requests import Response
+from requests.exceptions import ConnectionError, ReadTimeout, SSLError
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.retry_policy import RetryBudget, RetryPolicy, parse_retry_after
+from catalystwan.session import create_manager_session
+
+
+def make_response(status_code: int, retry_after: str = "") -> Response:
+    response = Response()
+    response.status_code = status_code
+    if retry_after:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_exponential_backoff(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff_seconds=3, jitter=False)
+
+        # Act
+        delays = [policy.backoff(attempt) for attempt in range(5)]
+
+        # Assert
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 3.0, 3.0])
+
+    def test_full_jitter(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=1.0, rng=lambda: 0.25)
+
+        # Act, Assert
+        self.assertEqual(policy.backoff(2), 1.0)
+
+    def test_allows(self):
+        # Arrange
+        policy = RetryPolicy()
+
+        # Act, Assert
+        self.assertTrue(policy.allows("get"))
+        self.assertTrue(policy.allows("PUT"))
+        self.assertFalse(policy.allows("POST"))
+        self.assertTrue(policy.allows("POST", idempotent=True))
+        self.assertFalse(policy.allows("GET", idempotent=False))
+
+    def test_retryable_errors(self):
+        # Arrange
+        policy = RetryPolicy(jitter=False)
+
+        # Act, Assert
+        self.assertEqual(policy.delay(0, response=make_response(503)), 0.5)
+        self.assertEqual(policy.delay(0, exception=ConnectionError()), 0.5)
+        self.assertEqual(policy.delay(0, exception=ReadTimeout()), 0.5)
+        self.assertIsNone(policy.delay(0, exception=SSLError()))
+        self.assertIsNone(policy.delay(0, response=make_response(500)))
+        self.assertIsNone(policy.delay(3, response=make_response(503)))
+
+    def test_retry_after_is_honored(self):
+        # Arrange
+        policy = RetryPolicy(jitter=False, max_backoff_seconds=10)
+
+        # Act, Assert
+        self.assertEqual(policy.delay(0, response=make_response(429, retry_after="4")), 4.0)
+        self.assertIsNone(policy.delay(0, response=make_response(429, retry_after="60")))
+
+    def test_budget_limits_retries(self):
+        # Arrange
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, reserve=2))
+
+        # Act
+        allowed = [policy.delay(0, response=make_response(503)) is not None for _ in range(3)]
+        policy.budget.deposit()
+        policy.budget.deposit()
+
+        # Assert
+        self.assertEqual(allowed, [True, True, False])
+        self.assertEqual(policy.budget.balance, 1)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120.0)
+
+    def test_http_date(self):
+        # Arrange
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+        # Act
+        delay = parse_retry_after(date)
+
+        # Assert
+        self.assertIsNotNone(delay)
+        self.assertTrue(25 <= delay <= 30)  # type: ignore
+
+    def test_invalid(self):
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class TestSessionRetries(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(error_status_code=503)).start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+        self.sleeps: List[float] = []
+        self.session.retry_policy = RetryPolicy(max_retries=2, sleep=self.sleeps.append)
+        self.server.manager.request_counts.clear()
+
+    def test_idempotent_request_is_retried(self):
+        # Arrange
+        self.server.manager.config.error_rate = 1
+
+        # Act
+        with self.assertRaises(ManagerHTTPError):
+            self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/device"], 3)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_post_is_not_retried_without_hint(self):
+        # Arrange
+        self.server.manager.config.error_rate = 1
+
+        # Act
+        with self.assertRaises(ManagerHTTPError):
+            self.session.post("/dataservice/template/device/config/exportcsv", json={})
+        with self.assertRaises(ManagerHTTPError):
+            self.session.post("/dataservice/template/device/config/exportcsv", json={}, idempotent=True)
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/template/device/config/exportcsv"], 4)
+
+    def test_no_retry_after_success(self):
+        # Act
+        self.session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(self.server.manager.request_counts["/dataservice/device"], 1)
+        self.assertEqual(self.sleeps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
+import hashlib
+import io
+import socket
+import tempfile
 import unittest
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event, Thread
+from typing import List, Optional
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -9,8 +16,14 @@ import pytest  # type: ignore
 from parameterized import parameterized  # type: ignore
 from requests import HTTPError, Request, RequestException, Response
 
-from catalystwan.exceptions import CatalystwanException, ManagerHTTPError, ManagerRequestException
-from catalystwan.session import ManagerSession
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.exceptions import (
+    CatalystwanException,
+    DownloadChecksumError,
+    ManagerHTTPError,
+    ManagerRequestException,
+)
+from catalystwan.session import ManagerSession, ManagerSessionState, create_manager_session
 
 
 @pytest.mark.skip(reason="Session is not mocked property (#149)")
@@ -159,5 +172,158 @@ class TestSessionExceptions(unittest.TestCase):
                 self.session.request(self.response.request.method, self.response.request.url)
 
 
+class TestSessionGetFile(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="domain.com", username="user", password="<>")
+        self.content = b"0123456789" * 100
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "file.tar.gz"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def create_response(self, status_code: int, content: bytes) -> Response:
+        response = Response()
+        response.status_code = status_code
+        response.raw = io.BytesIO(content)
+        response.headers["Content-Length"] = str(len(content))
+        response.request = Request(method="GET", url="https://domain.com/dataservice/file").prepare()
+        return response
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_streams_chunks(self, mock_request_base):
+        # Arrange
+        mock_request_base.return_value = self.create_response(200, self.content)
+        progress = []
+        # Act
+        self.session.get_file(
+            "/dataservice/file", self.path, chunk_size=300, progress_callback=lambda *args: progress.append(args)
+        )
+        # Assert
+        self.assertEqual(self.path.read_bytes(), self.content)
+        self.assertEqual(progress, [(300, 1000), (600, 1000), (900, 1000), (1000, 1000)])
+        self.assertTrue(mock_request_base.call_args.kwargs["stream"])
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_resume(self, mock_request_base):
+        # Arrange
+        self.path.write_bytes(self.content[:400])
+        mock_request_base.return_value = self.create_response(206, self.content[400:])
+        # Act
+        self.session.get_file(
+            "/dataservice/file", self.path, resume=True, checksum=hashlib.sha256(self.content).hexdigest()
+        )
+        # Assert
+        self.assertEqual(self.path.read_bytes(), self.content)
+        self.assertEqual(mock_request_base.call_args.kwargs["headers"], {"Range": "bytes=400-"})
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_resume_not_supported(self, mock_request_base):
+        # Arrange
+        self.path.write_bytes(b"corrupted")
+        mock_request_base.return_value = self.create_response(200, self.content)
+        # Act
+        self.session.get_file("/dataservice/file", self.path, resume=True)
+        # Assert
+        self.assertEqual(self.path.read_bytes(), self.content)
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_checksum_error(self, mock_request_base):
+        # Arrange
+        mock_request_base.return_value = self.create_response(200, self.content)
+        # Act / Assert
+        with self.assertRaises(DownloadChecksumError):
+            self.session.get_file("/dataservice/file", self.path, checksum=hashlib.sha256(b"other").hexdigest())
+
+
+class TestSessionConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer().start()
+        self.addCleanup(self.server.stop)
+        # CA bundle from environment overrides verify=False of session (but not explicit verify of login requests)
+        environ = patch.dict("os.environ", {"REQUESTS_CA_BUNDLE": "", "CURL_CA_BUNDLE": ""})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def test_pool_configuration(self):
+        # Act
+        session = ManagerSession("example.com", "admin", "admin", pool_maxsize=64, pool_block=True)
+
+        # Assert
+        adapter = session.get_adapter("https://example.com/dataservice/device")
+        self.assertIs(adapter, session.adapter)
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), adapter.socket_options)
+
+    def test_login_and_requests_share_connection(self):
+        # Arrange
+        session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+
+        # Act
+        session.get_data("/dataservice/device")
+        session.state = ManagerSessionState.LOGIN
+
+        # Assert
+        poolmanager = session.adapter.poolmanager
+        pools = [poolmanager.pools[key] for key in poolmanager.pools.keys()]
+        self.assertEqual(self.server.manager.logins, 2)
+        self.assertEqual(len(pools), 1)
+        self.assertEqual(pools[0].num_requests, 7)
+        self.assertEqual(pools[0].num_connections, 1)
+
+
+class TestSessionConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(latency_seconds=0.02)).start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+
+    def test_concurrent_requests_relogin_once(self):
+        # Arrange
+        self.server.manager.expire_sessions()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda _: self.session.get_data("/dataservice/device"), range(32)))
+
+        # Assert
+        self.assertEqual(self.server.manager.logins, 2)
+        self.assertEqual(len(results), 32)
+        self.assertEqual(self.session.state, ManagerSessionState.OPERATIVE)
+
+    def test_request_sent_before_login_does_not_trigger_another_login(self):
+        # Arrange
+        self.server.manager.expire_sessions()
+        received, logged_in = Event(), Event()
+        send = self.session.send
+        responses: List[Response] = []
+
+        def send_and_wait_for_login(*args, **kwargs):
+            response = send(*args, **kwargs)
+            if not responses:  # first response (with expired session) is processed after other thread logged in
+                responses.append(response)
+                received.set()
+                logged_in.wait(timeout=5)
+            return response
+
+        def login():
+            received.wait(timeout=5)
+            self.session.state = ManagerSessionState.LOGIN
+            logged_in.set()
+
+        # Act
+        with patch.object(self.session, "send", side_effect=send_and_wait_for_login):
+            thread = Thread(target=login)
+            thread.start()
+            data = self.session.get_data("/dataservice/device")
+            thread.join()
+
+        # Assert
+        self.assertIn("JSESSIONID=expired", responses[0].headers["set-cookie"])
+        self.assertEqual(len(data), 100)
+        self.assertEqual(self.server.manager.logins, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.exceptions import SessionNotCreatedError, TenantSubdomainNotFound
+from catalystwan.session import create_manager_session
+from catalystwan.session_pool import ManagerSessionPool, create_manager_session_pool
+from catalystwan.utils.session_type import SessionType
+
+
+def count_devices(session) -> int:
+    return len(session.get_data("/dataservice/device"))
+
+
+class TestManagerSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(devices=20, tenants=5)).start()
+        self.addCleanup(self.server.stop)
+        self.pool = create_manager_session_pool(self.server.url, "admin", "admin", port=self.server.port)
+        self.addCleanup(self.pool.close)
+        self.subdomains = [tenant["subDomain"] for tenant in self.server.manager.tenants]
+
+    def vsession_requests(self) -> int:
+        return sum(count for path, count in self.server.manager.request_counts.items() if path.endswith("vsessionid"))
+
+    def test_map_reuses_provider_login(self):
+        # Act
+        first = self.pool.map(count_devices)
+        second = self.pool.map(count_devices)
+
+        # Assert
+        self.assertEqual([result.subdomain for result in first], self.subdomains)
+        self.assertEqual([result.value for result in first + second], [4] * 10)
+        self.assertEqual(self.server.manager.logins, 1)
+        self.assertEqual(self.server.manager.request_counts["/dataservice/tenant"], 1)
+        self.assertEqual(self.vsession_requests(), 5)
+        self.assertEqual(self.pool.session(self.subdomains[0]).session_type, SessionType.PROVIDER_AS_TENANT)
+        self.assertEqual(count_devices(self.pool.provider), 20)
+
+    def test_failures_are_returned_in_results(self):
+        # Arrange
+        def func(session):
+            if session.subdomain == self.subdomains[1]:
+                raise ValueError("broken")
+            return count_devices(session)
+
+        # Act
+        results = self.pool.map(func, subdomains=self.subdomains[:3])
+
+        # Assert
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[2].value, 4)
+
+    def test_single_provider_login_after_expiration(self):
+        # Arrange
+        self.pool.map(count_devices)
+        self.server.manager.expire_sessions()
+
+        # Act
+        results = self.pool.map(count_devices)
+
+        # Assert
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(self.server.manager.logins, 2)
+
+    def test_tenant_follows_provider_login(self):
+        # Arrange
+        session = self.pool.session(self.subdomains[0])
+        count_devices(session)
+        self.pool.provider.login()
+
+        # Act
+        devices = count_devices(session)
+
+        # Assert
+        self.assertEqual(devices, 4)
+        self.assertEqual(self.vsession_requests(), 2)
+        self.assertEqual(session.cookies.get("JSESSIONID"), self.pool.provider.cookies.get("JSESSIONID"))
+
+    def test_shares_provider_adapter(self):
+        session = self.pool.session(self.subdomains[0])
+        self.assertIs(session.adapter, self.pool.provider.adapter)
+        self.assertIs(session.get_adapter(self.server.url), self.pool.provider.adapter)
+
+    def test_unknown_subdomain(self):
+        with self.assertRaises(TenantSubdomainNotFound):
+            self.pool.session("unknown.fake-manager.local")
+
+
+class TestManagerSessionPoolValidation(unittest.TestCase):
+    def test_requires_provider_session(self):
+        # Arrange
+        with FakeManagerServer() as server:
+            session = create_manager_session(server.url, "admin", "admin", port=server.port)
+
+            # Act, Assert
+            with self.assertRaises(SessionNotCreatedError):
+                ManagerSessionPool(session)
+
+
+if __name__ == "__main__":
+    unittest.main()
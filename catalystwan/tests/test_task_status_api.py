@@ -3,7 +3,7 @@
 import unittest
 from unittest.mock import patch
 
-from catalystwan.api.task_status_api import Task
+from catalystwan.api.task_status_api import Task, TaskMonitor
 from catalystwan.endpoints.configuration_dashboard_status import ConfigurationDashboardStatus, TaskData
 from catalystwan.exceptions import TaskValidationError
 
@@ -376,3 +376,59 @@ class TestTaskStatusApi(unittest.TestCase):
 
         # Act&Assert
         self.assertRaises(TaskValidationError, self.task.wait_for_completed)
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_task_monitor(self, mock_task_response):
+        # Arrange
+        responses = {
+            "task_1": [TaskData.parse_obj(self.success_response)],
+            "task_2": [TaskData.parse_obj(self.empty_data), TaskData.parse_obj(self.no_validation)],
+        }
+        mock_task_response.side_effect = lambda task_id: responses[task_id].pop(0)
+        monitor = TaskMonitor(self.task.session, initial_interval_seconds=0.01)
+        finished = []
+        future_1 = monitor.add("task_1", callback=lambda task_id, result: finished.append(task_id))
+        future_2 = monitor.add(Task(self.task.session, "task_2"))
+
+        # Act
+        results = monitor.wait()
+
+        # Assert
+        self.assertEqual([result.result for result in results], [True, True])
+        self.assertEqual(future_1.result(), results[0])
+        self.assertEqual(future_2.result(), results[1])
+        self.assertEqual(finished, ["task_1"])
+        self.assertEqual(mock_task_response.call_count, 3)
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_task_monitor_timeout(self, mock_task_response):
+        # Arrange
+        mock_task_response.return_value = TaskData.parse_obj(self.empty_data)
+        monitor = TaskMonitor(
+            self.task.session, timeout_seconds=0.2, initial_interval_seconds=0.01, max_interval_seconds=0.05
+        )
+        future = monitor.add("task_id")
+
+        # Act
+        monitor.wait()
+
+        # Assert
+        self.assertFalse(future.result().result)
+        self.assertLess(mock_task_response.call_count, 20)
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_task_monitor_validation_error(self, mock_task_response):
+        # Arrange
+        responses = {
+            "failed": TaskData.parse_obj(self.validation_failure),
+            "success": TaskData.parse_obj(self.success_response),
+        }
+        mock_task_response.side_effect = lambda task_id: responses[task_id]
+        monitor = TaskMonitor(self.task.session, initial_interval_seconds=0.01)
+        failed = monitor.add("failed")
+        success = monitor.add("success")
+
+        # Act & Assert
+        self.assertRaises(TaskValidationError, monitor.wait)
+        self.assertIsInstance(failed.exception(), TaskValidationError)
+        self.assertTrue(success.result().result)
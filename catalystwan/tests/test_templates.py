@@ -1,7 +1,7 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from parameterized import parameterized  # type: ignore
 
@@ -12,7 +12,8 @@ from catalystwan.api.templates.device_template.device_template import DeviceTemp
 from catalystwan.api.templates.feature_template import FeatureTemplate
 from catalystwan.api.templates.models.cisco_aaa_model import CiscoAAAModel
 from catalystwan.api.templates.payloads.aaa.aaa_model import AAAModel, AuthenticationOrder
-from catalystwan.dataclasses import Device, FeatureTemplateInfo, TemplateInfo
+from catalystwan.dataclasses import Device, DeviceTemplateInfo, FeatureTemplateInfo, TemplateInfo
+from catalystwan.exceptions import ManagerHTTPError
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 from catalystwan.utils.device_model import DeviceModel
@@ -110,7 +111,22 @@ class TestTemplatesAPI(unittest.TestCase):
         TemplatesAPI(mock_session).get(FeatureTemplate)
 
         # Assert
-        mock_session.get.assert_called_once_with(url="/dataservice/template/feature", params={"summary": True})
+        mock_session.get.assert_called_once_with(
+            url="/dataservice/template/feature", params={"summary": True}, cache_ttl=60
+        )
+
+    @parameterized.expand([({"num": {"vipValue": "1"}},), ('{"num": {"vipValue": "1"}}',)])
+    @patch("catalystwan.session.ManagerSession")
+    def test_get_feature_template_definition(self, definition, mock_session):
+        # Arrange
+        mock_session.get.return_value.json.return_value = {"templateId": "id", "templateDefinition": definition}
+
+        # Act
+        answer = TemplatesAPI(mock_session)._get_feature_template_definition("id")
+
+        # Assert
+        mock_session.get.assert_called_once_with(url="/dataservice/template/feature/object/id")
+        self.assertEqual(answer, {"num": {"vipValue": "1"}})
 
     @parameterized.expand(
         [
@@ -406,3 +422,150 @@ class TestTemplatesAPI(unittest.TestCase):
 
     #     # Assert
     #     self.assertRaises(AlreadyExistsError, answer)
+
+
+class TestTemplatesAPIAttach(unittest.TestCase):
+    def setUp(self):
+        self.devices = [
+            Device(
+                personality=Personality.EDGE,
+                uuid=f"uuid-{index}",
+                id=f"10.0.0.{index}",
+                hostname=f"edge-{index}",
+                reachability=Reachability.REACHABLE,
+                local_system_ip=f"10.0.0.{index}",
+                memUsage=1.0,
+                connected_vManages=["192.168.0.1"],
+                model="vedge-C8000V",
+                status="normal",
+            )
+            for index in range(5)
+        ]
+        self.columns = [{"property": "csv-deviceId"}, {"property": "//system/site-id"}]
+        self.attach_payloads: list = []
+        self.validation_payloads: list = []
+        self.session = MagicMock()
+        self.session.post.side_effect = self.post
+        self.task = TaskResult(result=True, sub_tasks_data=[])
+        get_patcher = patch.object(TemplatesAPI, "get", return_value=self.device_templates("template"))
+        self.get = get_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        monitor_patcher = patch("catalystwan.api.template_api.TaskMonitor")
+        self.monitor = monitor_patcher.start().return_value
+        self.addCleanup(monitor_patcher.stop)
+        self.monitor.wait.side_effect = lambda: [self.task for _ in self.attach_payloads]
+
+    def device_templates(self, config_type):
+        return DataSequence(
+            DeviceTemplateInfo,
+            [
+                create_dataclass(
+                    DeviceTemplateInfo,
+                    {
+                        "deviceType": "vedge-C8000V",
+                        "lastUpdatedBy": "admin",
+                        "templateClass": "cedge",
+                        "configType": config_type,
+                        "templateId": "template_id",
+                        "factoryDefault": False,
+                        "templateName": "template",
+                        "devicesAttached": 0,
+                        "templateDescription": "feature device template",
+                        "lastUpdatedOn": 0,
+                        "templateAttached": 0,
+                    },
+                )
+            ],
+        )
+
+    def post(self, url, json):
+        response = MagicMock()
+        if url.endswith("/exportcsv"):
+            response.json.return_value = {"header": {"columns": self.columns}}
+        elif url.endswith("/config/config/"):
+            self.validation_payloads.append(json)
+            response.text = "config"
+        else:
+            self.attach_payloads.append(json)
+            response.json.return_value = {"id": f"task-{len(self.attach_payloads)}"}
+        return response
+
+    def test_attach_fetches_template_once(self):
+        # Arrange
+        device = self.devices[0]
+
+        # Act
+        with patch("catalystwan.api.template_api.Task") as task:
+            task.return_value.wait_for_completed.return_value = self.task
+            result = TemplatesAPI(self.session).attach(
+                "template", device, device_specific_vars={"//system/site-id": "1"}
+            )
+
+        # Assert
+        self.assertTrue(result)
+        self.get.assert_called_once()
+        [payload] = self.attach_payloads
+        self.assertEqual(payload["deviceTemplateList"][0]["device"][0]["//system/site-id"], "1")
+
+    def test_attach_many(self):
+        # Arrange
+        devices_with_vars = [(device, {"//system/site-id": str(index)}) for index, device in enumerate(self.devices)]
+
+        # Act
+        results = TemplatesAPI(self.session).attach_many("template", devices_with_vars, chunk_size=2)
+
+        # Assert
+        self.assertEqual(results, [self.task] * 3)
+        devices = [payload["deviceTemplateList"][0]["device"] for payload in self.attach_payloads]
+        self.assertEqual([len(chunk) for chunk in devices], [2, 2, 1])
+        self.assertEqual(
+            [(device["csv-deviceId"], device["//system/site-id"]) for chunk in devices for device in chunk],
+            [(device.uuid, str(index)) for index, device in enumerate(self.devices)],
+        )
+        self.assertEqual(
+            [call.args for call in self.monitor.add.call_args_list], [("task-1",), ("task-2",), ("task-3",)]
+        )
+        self.get.assert_called_once()
+        self.assertEqual(self.session.post.call_count, 4)
+
+    def test_attach_many_missing_device_specific_variable(self):
+        # Arrange
+        devices_with_vars = [(device, {"//system/site-id": "1"}) for device in self.devices]
+        devices_with_vars[3] = (self.devices[3], {})
+
+        # Act, Assert
+        with self.assertRaises(TypeError):
+            TemplatesAPI(self.session).attach_many("template", devices_with_vars)
+        self.assertEqual(self.attach_payloads, [])
+        self.monitor.wait.assert_not_called()
+
+    def test_attach_many_cli_validates_each_device(self):
+        # Arrange
+        self.get.return_value = self.device_templates("file")
+        devices_with_vars = [(device, {}) for device in self.devices]
+
+        # Act
+        results = TemplatesAPI(self.session).attach_many("template", devices_with_vars, chunk_size=2)
+
+        # Assert
+        self.assertEqual(results, [self.task] * 3)
+        self.assertEqual(
+            [payload["device"]["csv-deviceId"] for payload in self.validation_payloads],
+            [device.uuid for device in self.devices],
+        )
+        self.assertEqual(
+            [call.kwargs["url"] for call in self.session.post.call_args_list[len(self.devices) :]],
+            ["/dataservice/template/device/config/attachcli"] * 3,
+        )
+
+    def test_attach_many_cli_validation_failure(self):
+        # Arrange
+        self.get.return_value = self.device_templates("file")
+        devices_with_vars = [(device, {}) for device in self.devices]
+        self.session.post.side_effect = ManagerHTTPError(error_info=None, request=MagicMock(), response=MagicMock())
+
+        # Act, Assert
+        with self.assertRaises(ManagerHTTPError):
+            TemplatesAPI(self.session).attach_many("template", devices_with_vars)
+        self.assertEqual(self.attach_payloads, [])
+        self.monitor.wait.assert_not_called()
@@ -2,6 +2,7 @@
 
 import tempfile
 import unittest
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +12,7 @@ from catalystwan.api.task_status_api import Task
 from catalystwan.api.tenant_migration_api import ImportTask, TenantMigrationAPI
 from catalystwan.endpoints.tenant_migration import ImportInfo, MigrationInfo
 from catalystwan.models.tenant import Tenant, TenantExport
+from catalystwan.session import ManagerSession
 
 
 class TestTenantMigrationAPI(unittest.TestCase):
@@ -38,11 +40,17 @@ class TestTenantMigrationAPI(unittest.TestCase):
 
     def test_download(self):
         content = b"\xFFtest_data"
+        self.session.get_file = partial(ManagerSession.get_file, self.session)
+        self.session.get.return_value.status_code = 200
+        self.session.get.return_value.headers = {}
+        self.session.get.return_value.iter_content.return_value = [content[:3], content[3:]]
         with tempfile.TemporaryDirectory() as tmpdir:
             download_path = Path(tmpdir) / "test.tar.gz"
-            self.session.endpoints.tenant_migration.download_tenant_data = MagicMock(return_value=content)
-            self.api.download(download_path)
+            self.api.download(download_path, "export.tar.gz")
             assert open(download_path, "rb").read() == content
+        self.session.get.assert_called_once_with(
+            "/dataservice/tenantmigration/download/export.tar.gz", stream=True, headers={}
+        )
 
     def test_import_tenant(self):
         self.session.api_version = Version("20.12")
@@ -0,0 +1,149 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from benchmarks.fake_manager import FakeManagerConfig, FakeManagerServer
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.api.template_api import TemplatesAPI
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.session import create_manager_session
+from catalystwan.tracing import NOOP_SPAN, NOOP_TRACER, STATUS_ERROR, InMemoryTracer, OpenTelemetryTracer, traced
+
+
+class TestNoOpTracer(unittest.TestCase):
+    def test_returns_shared_span(self):
+        with NOOP_TRACER.start_span("operation", {"device.id": "1"}) as span:
+            span.set_attribute("task.id", "2")
+        self.assertIs(span, NOOP_SPAN)
+
+
+class TestInMemoryTracer(unittest.TestCase):
+    def test_parent_child_relationship(self):
+        # Arrange
+        tracer = InMemoryTracer()
+
+        # Act
+        with tracer.start_span("workflow") as workflow:
+            with tracer.start_span("step", {"device.id": "1"}):
+                pass
+            with tracer.start_span("step", {"device.id": "2"}):
+                pass
+
+        # Assert
+        [root] = tracer.find("workflow")
+        self.assertIs(root, workflow)
+        self.assertIsNone(root.parent_id)
+        self.assertEqual([child.attributes["device.id"] for child in tracer.children(root)], ["1", "2"])
+        self.assertTrue(all(span.duration is not None for span in tracer.spans))
+
+    def test_exception_is_recorded(self):
+        # Arrange
+        tracer = InMemoryTracer()
+
+        # Act
+        with self.assertRaises(ValueError):
+            with tracer.start_span("step"):
+                raise ValueError("broken")
+
+        # Assert
+        [span] = tracer.spans
+        self.assertEqual(span.status, STATUS_ERROR)
+        self.assertEqual(span.status_description, "broken")
+
+    def test_maxlen(self):
+        tracer = InMemoryTracer(maxlen=2)
+        for index in range(3):
+            with tracer.start_span(f"step-{index}"):
+                pass
+        self.assertEqual([span.name for span in tracer.spans], ["step-1", "step-2"])
+
+    def test_opentelemetry_requires_optional_dependency(self):
+        with patch.dict("sys.modules", {"opentelemetry": None}):
+            with self.assertRaises(ImportError):
+                OpenTelemetryTracer()
+
+
+class TracedAPI:
+    def __init__(self, session, attributes):
+        self.session = session
+        self.attributes = attributes
+
+    @traced("TracedAPI.run", lambda self, value: self.attributes(value), lambda result: {"result": result})
+    def run(self, value: int) -> int:
+        return value * 2
+
+
+class TestTraced(unittest.TestCase):
+    def test_span_with_attributes(self):
+        # Arrange
+        tracer = InMemoryTracer()
+
+        # Act
+        result = TracedAPI(Mock(tracer=tracer), lambda value: {"value": value}).run(2)
+
+        # Assert
+        [span] = tracer.spans
+        self.assertEqual(result, 4)
+        self.assertEqual((span.name, span.attributes), ("TracedAPI.run", {"value": 2, "result": 4}))
+
+    def test_attributes_not_built_without_tracer(self):
+        # Arrange
+        attributes = MagicMock()
+
+        # Act
+        results = [TracedAPI(session, attributes).run(1) for session in (object(), Mock(), Mock(tracer=NOOP_TRACER))]
+
+        # Assert
+        self.assertEqual(results, [2, 2, 2])
+        attributes.assert_not_called()
+
+
+class TestSessionTracing(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeManagerServer(FakeManagerConfig(devices=2)).start()
+        self.addCleanup(self.server.stop)
+        self.session = create_manager_session(self.server.url, "admin", "admin", port=self.server.port)
+        self.tracer = InMemoryTracer()
+
+    def test_http_spans(self):
+        # Arrange
+        self.session.tracer = self.tracer
+        self.server.manager.config.error_rate = 1
+
+        # Act
+        with self.assertRaises(ManagerHTTPError):
+            self.session.get("/dataservice/device")
+
+        # Assert
+        [span] = self.tracer.spans
+        self.assertEqual(span.name, "HTTP GET")
+        self.assertEqual(span.attributes["http.status_code"], 500)
+        self.assertEqual(span.attributes["endpoint"], "GET /dataservice/device")
+        self.assertEqual(span.status, STATUS_ERROR)
+
+    def test_template_attach_workflow(self):
+        # Arrange
+        device = DevicesAPI(self.session).get()[0]
+        template = self.server.manager.device_templates[0]["templateName"]
+        self.session.tracer = self.tracer
+
+        # Act
+        TemplatesAPI(self.session).attach(template, device)
+
+        # Assert
+        [attach] = self.tracer.find("TemplatesAPI.attach")
+        self.assertEqual(attach.attributes["device.id"], device.uuid)
+        self.assertTrue(attach.attributes["result"])
+        children = [span.name for span in self.tracer.children(attach)]
+        self.assertIn("TemplatesAPI.get_device_specific_variables", children)
+        self.assertEqual(children[-1], "Task.wait_for_completed")
+        [wait] = self.tracer.find("Task.wait_for_completed")
+        polls = self.tracer.children(wait)
+        self.assertEqual([span.name for span in polls], ["Task.poll"])
+        self.assertEqual(polls[-1].attributes["task.id"], wait.attributes["task.id"])
+        self.assertEqual([span.name for span in self.tracer.children(polls[-1])], ["HTTP GET"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ from parameterized import parameterized
 from catalystwan.dataclasses import DataclassBase, Device, User
 from catalystwan.exceptions import InvalidOperationError
 from catalystwan.typed_list import DataSequence, TypedList
+from catalystwan.utils.personality import Personality
 
 
 @define
@@ -19,6 +20,11 @@ class FakeUser(DataclassBase):
     weight: float
 
 
+@define
+class PersonalityItem(DataclassBase):
+    personality: Personality
+
+
 class TestTypedList(TestCase):
     def setUp(self):
         self.u = User(username="User1")
@@ -220,6 +226,26 @@ class TestTypedList(TestCase):
             term1 += term2
             assert term1 == expected_result
 
+    def test_iadd_in_place(self):
+        # Arrange
+        typed_list = TypedList(int, [1, 2])
+        data = typed_list.data
+        # Act
+        typed_list += [3]
+        typed_list += typed_list
+        # Assert
+        assert typed_list.data is data
+        assert typed_list == TypedList(int, [1, 2, 3, 1, 2, 3])
+
+    def test_iadd_type_error_leaves_list_unchanged(self):
+        # Arrange
+        typed_list = TypedList(int, [1, 2])
+        # Act
+        with self.assertRaises(TypeError):
+            typed_list += [3, "4"]  # type: ignore
+        # Assert
+        assert typed_list == TypedList(int, [1, 2])
+
 
 class TestDataSequence(TestCase):
     def setUp(self):
@@ -365,6 +391,66 @@ class TestDataSequence(TestCase):
         with self.assertRaises(AttributeError):
             self.data_sequence.filter(does_not="exists")
 
+    def test_filter_indexed(self):
+        # Arrange
+        additional_user = User(username="User1", description="ThisOne")
+        self.data_sequence.append(additional_user)
+        self.data_sequence.index_by("username", "group")
+
+        # Act, Assert
+        self.assertEqual(
+            self.data_sequence.filter(username="User1"), DataSequence(User, [self.users[0], additional_user])
+        )
+        self.assertEqual(
+            self.data_sequence.filter(username="User1", description="ThisOne"), DataSequence(User, [additional_user])
+        )
+        self.assertEqual(self.data_sequence.filter(username="Unknown"), DataSequence(User, []))
+        self.assertEqual(len(self.data_sequence.filter(group=[])), 4)
+
+    def test_index_rebuilt_after_modification(self):
+        # Arrange
+        self.data_sequence.index_by("username")
+        new_user = User(username="User4")
+
+        # Act
+        self.data_sequence.append(new_user)
+        self.data_sequence.remove(self.users[0])
+
+        # Assert
+        self.assertEqual(self.data_sequence.get_by(username="User4"), new_user)
+        self.assertIsNone(self.data_sequence.get_by(username="User1"))
+
+    def test_get_by_multiple_elements(self):
+        # Arrange
+        self.data_sequence.append(User(username="User1"))
+
+        # Act, Assert
+        with self.assertRaises(InvalidOperationError):
+            self.data_sequence.get_by(username="User1")
+
+    def test_enum_index(self):
+        # Arrange
+        edge = PersonalityItem(personality=Personality.EDGE)
+        vsmart = PersonalityItem(personality=Personality.VSMART)
+        items = DataSequence(PersonalityItem, [edge, vsmart]).index_by("personality")
+
+        # Act, Assert
+        self.assertEqual(items.get_by(personality="vedge"), edge)
+        self.assertEqual(items.get_by(personality=Personality.VSMART), vsmart)
+        self.assertEqual(items.filter(personality="vedge"), DataSequence(PersonalityItem, [edge]))
+
+    def test_group_by(self):
+        # Arrange
+        self.data_sequence.append(User(username="User1", description="ThisOne"))
+
+        # Act
+        groups = self.data_sequence.group_by("username")
+
+        # Assert
+        self.assertEqual(list(groups.keys()), ["User1", "User2", "User3"])
+        self.assertEqual(len(groups["User1"]), 2)
+        self.assertIsInstance(groups["User2"], DataSequence)
+
 
 if __name__ == "__main__":
     unittest.main()
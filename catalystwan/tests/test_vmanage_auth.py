@@ -1,10 +1,14 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 from unittest import TestCase, mock
 from uuid import uuid4
 
 from requests import Request
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 
 from catalystwan import USER_AGENT
 from catalystwan.vmanage_auth import UnauthorizedAccessError, vManageAuth
@@ -49,7 +53,7 @@ class TestvManageAuth(TestCase):
         self.base_url = "https://1.1.1.1:1111"
         self.password = str(uuid4())
 
-    @mock.patch("requests.post", side_effect=mocked_requests_method)
+    @mock.patch("requests.Session.post", side_effect=mocked_requests_method)
     def test_get_cookie(self, mock_post):
         # Arrange
         username = "admin"
@@ -69,7 +73,7 @@ class TestvManageAuth(TestCase):
             headers={"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT},
         )
 
-    @mock.patch("requests.post", side_effect=mocked_requests_method)
+    @mock.patch("requests.Session.post", side_effect=mocked_requests_method)
     def test_get_cookie_invalid_username(self, mock_post):
         # Arrange
         username = "invalid_username"
@@ -91,7 +95,7 @@ class TestvManageAuth(TestCase):
         )
 
     @mock.patch("requests.cookies.RequestsCookieJar")
-    @mock.patch("requests.get", side_effect=mocked_requests_method)
+    @mock.patch("requests.Session.get", side_effect=mocked_requests_method)
     def test_fetch_token(self, mock_get, cookies):
         # Arrange
         valid_url = "https://1.1.1.1:1111/dataservice/client/token"
@@ -108,6 +112,37 @@ class TestvManageAuth(TestCase):
             cookies=cookies,
         )
 
+    def test_login_requests_use_given_adapter(self):
+        # Arrange
+        adapter = HTTPAdapter()
+
+        # Act
+        auth = vManageAuth(self.base_url, "admin", self.password, adapter=adapter)
+
+        # Assert
+        self.assertIs(auth.session.get_adapter("https://1.1.1.1:1111/j_security_check"), adapter)
+        self.assertIs(auth.session.get_adapter("http://1.1.1.1:1111/j_security_check"), adapter)
+
+    def test_concurrent_calls_login_once(self):
+        # Arrange
+        auth = vManageAuth(self.base_url, "admin", self.password)
+
+        def get_cookie():
+            sleep(0.05)
+            return RequestsCookieJar()
+
+        # Act
+        with mock.patch.object(auth, "get_cookie", side_effect=get_cookie) as get_cookie_mock, mock.patch.object(
+            auth, "fetch_token", return_value="token"
+        ) as fetch_token_mock:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                requests = list(executor.map(lambda _: auth(Request("GET", self.base_url).prepare()), range(8)))
+
+        # Assert
+        get_cookie_mock.assert_called_once()
+        fetch_token_mock.assert_called_once()
+        self.assertTrue(all(request.headers["x-xsrf-token"] == "token" for request in requests))
+
 
 if __name__ == "__main__":
     unittest.main()
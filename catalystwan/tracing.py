@@ -0,0 +1,281 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Optional tracing spans for high-level workflows, HTTP calls and task polls.
+
+Session uses no-op tracer by default (tracing costs a single attribute check per request).
+Spans started while other span is active become its children:
+>>> tracer = InMemoryTracer()
+>>> session.tracer = tracer
+>>> TemplatesAPI(session).attach("template", device)
+>>> print(tracer.format_tree())
+TemplatesAPI.attach 1.520s {'template.name': 'template', 'device.id': '...'}
+  HTTP GET 0.012s {'http.url': 'https://10.0.0.1/dataservice/template/device', 'http.status_code': 200, ...}
+  ...
+  Task.wait_for_completed 1.380s {'task.id': '...', 'task.result': True}
+    Task.poll 0.011s {'task.id': '...', 'task.status': 'In progress'}
+
+Spans can be exported to OpenTelemetry (optional dependency: pip install opentelemetry-api):
+>>> session.tracer = OpenTelemetryTracer()
+
+Methods of API objects holding session are instrumented with decorator:
+>>> @traced("TemplatesAPI.attach", lambda self, name, device, *args, **kwargs: {"template.name": name})
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from itertools import count
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Protocol, TypeVar, cast
+
+STATUS_UNSET = "unset"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+
+class Span(Protocol):
+    """Interface to span of traced operation"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        ...
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        ...
+
+    def record_exception(self, exception: BaseException) -> None:
+        ...
+
+
+class Tracer(Protocol):
+    """Interface to tracer creating spans, operations are instrumented only when tracer is enabled"""
+
+    enabled: bool
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        ...
+
+
+class NoOpSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> NoOpSpan:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+NOOP_SPAN = NoOpSpan()
+
+
+class NoOpTracer:
+    """Default tracer, all spans are the same object doing nothing"""
+
+    enabled = False
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Span]:
+        return NOOP_SPAN
+
+
+NOOP_TRACER = NoOpTracer()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def get_tracer(session: Any) -> Tracer:
+    """Returns tracer of session, objects used in place of session (eg. mocks) without enabled tracer are not traced"""
+    tracer = getattr(session, "tracer", NOOP_TRACER)
+    return tracer if getattr(tracer, "enabled", False) is True else NOOP_TRACER
+
+
+def _instance_session(self: Any, *args, **kwargs) -> Any:
+    return self.session
+
+
+def traced(
+    name: str,
+    attributes: Optional[Callable[..., Dict[str, Any]]] = None,
+    result_attributes: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    session: Callable[..., Any] = _instance_session,
+) -> Callable[[F], F]:
+    """Opens span around each call of decorated function.
+    Attributes are built only when tracer is enabled.
+
+    Args:
+        name: span name
+        attributes: returns span attributes, called with arguments of decorated function
+        result_attributes: returns span attributes, called with value returned by decorated function
+        session: returns session with tracer, called with arguments of decorated function (default: self.session)
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer(session(*args, **kwargs))
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.start_span(name, attributes(*args, **kwargs) if attributes is not None else None) as span:
+                result = func(*args, **kwargs)
+                if result_attributes is not None:
+                    for key, value in result_attributes(result).items():
+                        span.set_attribute(key, value)
+                return result
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+@dataclass
+class RecordedSpan:
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time)
+    duration: Optional[float] = None
+    status: str = STATUS_UNSET
+    status_description: Optional[str] = None
+    exceptions: List[BaseException] = field(default_factory=list)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        self.status = status
+        self.status_description = description
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+
+class InMemoryTracer:
+    """Keeps finished spans in memory (eg. for tests or ad-hoc profiling of workflows)
+
+    Args:
+        maxlen: maximum number of stored spans, oldest are discarded first
+    """
+
+    enabled = True
+
+    def __init__(self, maxlen: int = 10_000):
+        self.maxlen = maxlen
+        self._spans: List[RecordedSpan] = []
+        self._ids = count(1)
+        self._current: ContextVar[Optional[RecordedSpan]] = ContextVar(f"catalystwan_span_{id(self)}", default=None)
+        self._lock = Lock()
+
+    @property
+    def spans(self) -> List[RecordedSpan]:
+        """Finished spans in order of completion"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def find(self, name: str) -> List[RecordedSpan]:
+        return [span for span in self.spans if span.name == name]
+
+    def children(self, span: RecordedSpan) -> List[RecordedSpan]:
+        return sorted(
+            (child for child in self.spans if child.parent_id == span.span_id), key=lambda child: child.start_time
+        )
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        parent = self._current.get()
+        span = RecordedSpan(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            attributes=dict(attributes or {}),
+        )
+        token = self._current.set(span)
+        started = perf_counter()
+        try:
+            yield span
+        except BaseException as exception:
+            span.record_exception(exception)
+            span.set_status(STATUS_ERROR, str(exception))
+            raise
+        finally:
+            span.duration = perf_counter() - started
+            self._current.reset(token)
+            with self._lock:
+                self._spans.append(span)
+                del self._spans[: -self.maxlen]
+
+    def format_tree(self) -> str:
+        """Returns finished spans as indented tree with durations and attributes"""
+        spans = self.spans
+        finished = {span.span_id for span in spans}
+        lines: List[str] = []
+
+        def add(span: RecordedSpan, depth: int) -> None:
+            lines.append(f"{'  ' * depth}{span.name} {span.duration or 0:.3f}s {span.attributes}")
+            for child in self.children(span):
+                add(child, depth + 1)
+
+        for root in sorted(spans, key=lambda span: span.start_time):
+            if root.parent_id is None or root.parent_id not in finished:
+                add(root, 0)
+        return "\n".join(lines)
+
+
+class _OpenTelemetrySpan:
+    """Adapts OpenTelemetry span to Span interface"""
+
+    def __init__(self, span: Any, status_type: Any, status_code_type: Any):
+        self._span = span
+        self._status_type = status_type
+        self._status_code_type = status_code_type
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self._span.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        code = {STATUS_OK: "OK", STATUS_ERROR: "ERROR"}.get(status, "UNSET")
+        self._span.set_status(self._status_type(getattr(self._status_code_type, code), description))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self._span.record_exception(exception)
+
+
+class OpenTelemetryTracer:
+    """Creates spans with OpenTelemetry API (exported by SDK configured in application)
+
+    Args:
+        tracer: OpenTelemetry tracer (by default obtained from global tracer provider)
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace  # type: ignore
+        except ImportError as error:
+            raise ImportError("OpenTelemetryTracer requires opentelemetry-api package") from error
+        self._tracer = tracer if tracer is not None else trace.get_tracer("catalystwan")
+        self._status_type = trace.Status
+        self._status_code_type = trace.StatusCode
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        with self._tracer.start_as_current_span(name) as otel_span:
+            span = _OpenTelemetrySpan(otel_span, self._status_type, self._status_code_type)
+            for key, value in (attributes or {}).items():
+                span.set_attribute(key, value)
+            yield span
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Generic, Iterable, MutableSequence, Type, TypeVar, overload
+from enum import Enum
+from typing import Any, Dict, Generic, Iterable, List, MutableSequence, Optional, Type, TypeVar, overload
 
 from pydantic import BaseModel as BaseModelV2
 from pydantic.v1 import BaseModel as BaseModelV1
@@ -14,6 +15,13 @@ T = TypeVar("T")
 D = TypeVar("D")
 
 
+def _index_key(value: Any) -> Any:
+    """Normalizes attribute value to index key, str/int Enum members compare equal to their values"""
+    if isinstance(value, Enum) and isinstance(value, (str, int)):
+        return value.value
+    return value
+
+
 class TypedList(MutableSequence[T], Generic[T]):
     """A list where all elements are of the same data type.
 
@@ -49,6 +57,10 @@ class TypedList(MutableSequence[T], Generic[T]):
     def __repr__(self) -> str:
         return f"TypedList({self._type.__name__}, {repr(self.data)})"
 
+    def _modified(self) -> None:
+        """Called after contents of the list were modified"""
+        pass
+
     def __contains__(self, item: Any) -> bool:
         return item in self.data
 
@@ -81,6 +93,7 @@ class TypedList(MutableSequence[T], Generic[T]):
         if not isinstance(item, self._type):
             raise TypeError(f"Expected {self._type.__name__} item type, " f"got {type(item).__name__}.")
         self.data[i] = item
+        self._modified()
 
     @overload
     def __delitem__(self, i: int, /) -> None:
@@ -92,12 +105,13 @@ class TypedList(MutableSequence[T], Generic[T]):
 
     def __delitem__(self, i):
         del self.data[i]
+        self._modified()
 
     def __add__(self, __value: Iterable[T]) -> TypedList[T]:
         return TypedList(self._type, self.data + [*__value.__iter__()])
 
     def __iadd__(self, __value: Iterable[T]) -> TypedList[T]:
-        self.data = TypedList(self._type, self.data + [*__value.__iter__()]).data
+        self.extend(__value)
         return self
 
     def __eq__(self, __o: object) -> bool:
@@ -111,26 +125,41 @@ class TypedList(MutableSequence[T], Generic[T]):
         if not isinstance(item, self._type):
             raise TypeError(f"Expected {self._type.__name__} item type, " f"got {type(item).__name__}.")
         self.data.append(item)
+        self._modified()
+
+    def extend(self, values: Iterable[T]) -> None:
+        items = [*values]
+        for item in items:
+            if not isinstance(item, self._type):
+                raise TypeError(f"Expected {self._type.__name__} item type, " f"got {type(item).__name__}.")
+        self.data.extend(items)
+        self._modified()
 
     def insert(self, i: int, item: T) -> None:
         if not isinstance(item, self._type):
             raise TypeError(f"Expected {self._type.__name__} item type, " f"got {type(item).__name__}.")
         self.data.insert(i, item)
+        self._modified()
 
     def pop(self, i: int = -1) -> T:
-        return self.data.pop(i)
+        item = self.data.pop(i)
+        self._modified()
+        return item
 
     def remove(self, item: T) -> None:
         self.data.remove(item)
+        self._modified()
 
     def clear(self) -> None:
         self.data.clear()
+        self._modified()
 
     def count(self, item: T) -> int:
         return self.data.count(item)
 
     def reverse(self) -> None:
         self.data.reverse()
+        self._modified()
 
 
 class DataSequence(TypedList[T], Generic[T]):
@@ -162,6 +191,11 @@ class DataSequence(TypedList[T], Generic[T]):
             )
 
         super().__init__(_type, _iterable)
+        self._indexes: Dict[str, Optional[Dict[Any, List[T]]]] = {}
+
+    def _modified(self) -> None:
+        # mark indexes as stale, they are rebuilt on next lookup
+        self._indexes = dict.fromkeys(self._indexes)
 
     def __eq__(self, __o: object) -> bool:
         if isinstance(__o, DataSequence):
@@ -188,7 +222,7 @@ class DataSequence(TypedList[T], Generic[T]):
         return DataSequence(self._type, self.data + [*__value.__iter__()])
 
     def __iadd__(self, __value: Iterable[T]) -> DataSequence[T]:
-        self.data = DataSequence(self._type, self.data + [*__value.__iter__()]).data
+        self.extend(__value)
         return self
 
     @overload
@@ -240,10 +274,94 @@ class DataSequence(TypedList[T], Generic[T]):
             DataSequence: Filtered DataSequence.
         """
         annotations = set(kwargs.keys())
+        items: Iterable[T] = self.data
+        for attribute in annotations:
+            if (candidates := self._lookup(attribute, kwargs[attribute])) is not None:
+                items = candidates
+                annotations.remove(attribute)
+                break
+
+        return DataSequence(self._type, filter(lambda x: all(getattr(x, a) == kwargs[a] for a in annotations), items))
+
+    def index_by(self, *attributes: str) -> DataSequence[T]:
+        """Builds hash indexes for given attributes, so filter(), get_by() and group_by() using
+        these attributes find matching elements in constant time instead of scanning whole sequence.
+
+        Indexes are rebuilt lazily after sequence is modified. Modification of attributes of elements
+        already present in the sequence is not detected, call index_by() again in such case.
+
+        ## Example:
+        >>> devices = DevicesAPI(session).get().index_by("uuid", "hostname")
+        >>> for uuid in uuids:
+        >>>     device = devices.filter(uuid=uuid).single_or_default()
+
+        Returns:
+            DataSequence: self (to allow chaining)
+        """
+        for attribute in attributes:
+            self._indexes[attribute] = None
+            self._get_index(attribute)
+        return self
+
+    def get_by(self, **kwargs) -> Optional[T]:
+        """Returns the only element matching given attributes or None, builds indexes for given attributes.
 
-        return DataSequence(
-            self._type, filter(lambda x: all(getattr(x, a) == kwargs[a] for a in annotations), self.data)
-        )
+        ## Example:
+        >>> devices.get_by(uuid="c8e1a7f1-5d0b-4d6f-a1a2-8e8b2a4c0b1d")
+        Device(uuid="c8e1a7f1-5d0b-4d6f-a1a2-8e8b2a4c0b1d", ...)
+
+        Raises:
+            InvalidOperationError: Raises when there is more than one matching element.
+
+        Returns:
+            Optional[T]: The single matching element or None.
+        """
+        self.index_by(*[attribute for attribute in kwargs if attribute not in self._indexes])
+        return self.filter(**kwargs).single_or_default()
+
+    def group_by(self, attribute: str) -> Dict[Any, DataSequence[T]]:
+        """Groups elements by value of given attribute, builds index for given attribute.
+
+        ## Example:
+        >>> devices.group_by("personality")[Personality.EDGE]
+        DataSequence(Device, [...])
+
+        Raises:
+            TypeError: Raises when attribute value is not hashable.
+
+        Returns:
+            Dict[Any, DataSequence[T]]: elements grouped by attribute value
+        """
+        index = self._get_index(attribute)
+        if index is None:
+            index = self._indexes[attribute] = self._build_index(attribute)
+        return {getattr(items[0], attribute): DataSequence(self._type, items) for items in index.values()}
+
+    def _build_index(self, attribute: str) -> Dict[Any, List[T]]:
+        index: Dict[Any, List[T]] = {}
+        for item in self.data:
+            index.setdefault(_index_key(getattr(item, attribute)), []).append(item)
+        return index
+
+    def _get_index(self, attribute: str) -> Optional[Dict[Any, List[T]]]:
+        """Returns index for attribute (rebuilt when stale) or None when attribute is not indexed"""
+        if attribute not in self._indexes:
+            return None
+        if (index := self._indexes[attribute]) is None:
+            try:
+                index = self._indexes[attribute] = self._build_index(attribute)
+            except TypeError:  # unhashable attribute value, elements will be scanned
+                del self._indexes[attribute]
+        return index
+
+    def _lookup(self, attribute: str, value: Any) -> Optional[List[T]]:
+        """Returns elements with given attribute value using index (None when attribute is not indexed)"""
+        if (index := self._get_index(attribute)) is None:
+            return None
+        try:
+            return index.get(_index_key(value), [])
+        except TypeError:  # unhashable value
+            return None
 
     def first(self) -> T:
         """Returns the first element of a sequence.
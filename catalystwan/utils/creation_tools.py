@@ -1,7 +1,8 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import datetime as dt
-from typing import Any, ClassVar, Dict, Iterable, List, Protocol, Type, TypeVar, runtime_checkable
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Protocol, Tuple, Type, TypeVar, runtime_checkable
 
 import attrs  # type: ignore
 from attr import Attribute, fields, fields_dict
@@ -16,6 +17,17 @@ class AttrsInstance(Protocol):
     __attrs_attrs__: ClassVar[Any]
 
 
+@lru_cache(maxsize=None)
+def _creation_plan(cls: type) -> Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+    """Precomputes (json field name, field name) mapping and available field names of dataclass"""
+    renames = tuple(
+        (json_field_name, field.name)
+        for field in fields(cls)  # type: ignore[misc]
+        if (json_field_name := field.metadata.get(FIELD_NAME, None))
+    )
+    return renames, frozenset(fields_dict(cls).keys())
+
+
 def create_dataclass(cls: Type[T], data: Dict[str, Any]) -> T:
     """Deserializes data to convert it into an object.
 
@@ -32,17 +44,31 @@ def create_dataclass(cls: Type[T], data: Dict[str, Any]) -> T:
     Returns:
         A dataclass with implemented fields
     """
+    return _create_dataclass(cls, *_creation_plan(cls), data)  # type: ignore[arg-type]
 
-    def filter_fields(available_fields: Iterable[str], data: Dict[str, Any]) -> Dict[str, Any]:
-        return dict(filter(lambda key_value: key_value[0] in available_fields, data.items()))
 
+def _create_dataclass(
+    cls: Type[T], renames: Tuple[Tuple[str, str], ...], available_fields: FrozenSet[str], data: Dict[str, Any]
+) -> T:
     data_copy = data.copy()
-    for field in fields(cls):  # type: ignore[misc]
-        json_field_name = field.metadata.get(FIELD_NAME, None)
-        if json_field_name and json_field_name in data_copy:
-            data_copy[field.name] = data_copy.pop(json_field_name)
-    filtered_data = filter_fields(fields_dict(cls).keys(), data_copy)
-    return cls(**filtered_data)
+    for json_field_name, field_name in renames:
+        if json_field_name in data_copy:
+            data_copy[field_name] = data_copy.pop(json_field_name)
+    return cls(**{key: value for key, value in data_copy.items() if key in available_fields})
+
+
+def create_dataclasses(cls: Type[T], data: Iterable[Dict[str, Any]]) -> List[T]:
+    """Deserializes sequence of dicts into list of objects, see create_dataclass
+
+    Args:
+        cls (type): Dataclass which should be created
+        data (Iterable[dict]): dicts to deserialize from
+
+    Returns:
+        A list of dataclasses with implemented fields
+    """
+    renames, available_fields = _creation_plan(cls)  # type: ignore[arg-type]
+    return [_create_dataclass(cls, renames, available_fields, item) for item in data]
 
 
 def convert_attributes(cls: type, fields: List[Attribute]) -> List[Attribute]:
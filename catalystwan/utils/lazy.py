@@ -0,0 +1,52 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Generic, Optional, Type, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazySessionAttribute(Generic[T]):
+    """Descriptor creating container member on first access.
+
+    Module containing member class is imported when attribute is accessed for the first time,
+    then class is instantiated with session of the container (owner is expected to have "_session" attribute).
+    Created object is stored in the instance dictionary, so next access is as fast as for regular attribute.
+
+    ## Example:
+    >>> class APIContainer:
+    >>>     devices: LazySessionAttribute[DevicesAPI] = LazySessionAttribute("catalystwan.api.basic_api", "DevicesAPI")
+    >>>
+    >>>     def __init__(self, session: ManagerSession):
+    >>>         self._session = session
+
+    Args:
+        module: name of the module containing member class
+        classname: name of the member class
+    """
+
+    def __init__(self, module: str, classname: str):
+        self.module = module
+        self.classname = classname
+        self.name = classname
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[Type[Any]] = None) -> LazySessionAttribute[T]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[Type[Any]] = None) -> T:
+        ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cls = getattr(import_module(self.module), self.classname)
+        value = cls(instance._session)
+        instance.__dict__[self.name] = value
+        return value
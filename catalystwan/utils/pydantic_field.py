@@ -1,12 +1,30 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
 
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
+FieldIndex = Dict[Tuple[Tuple[str, ...], str], Tuple[str, FieldInfo]]
+
 
 def get_extra_field(field_info: FieldInfo, key: str, default: Optional[Any] = None) -> Any:
     try:
         return field_info.json_schema_extra.get(key, default)  # type: ignore
     except AttributeError:
         return default
+
+
+@lru_cache(maxsize=None)
+def get_field_index(model: Type[BaseModel]) -> FieldIndex:
+    """Maps (data_path, key) to name and info of model field matching it by field name, alias or vmanage_key.
+    When many fields match the same key, first declared field is used. Index is built once per model class.
+    """
+    index: FieldIndex = {}
+    for field_name, field_info in model.model_fields.items():
+        data_path = tuple(get_extra_field(field_info, "data_path", default=[]))
+        for key in (field_info.alias, field_name, get_extra_field(field_info, "vmanage_key")):
+            if key is not None:
+                index.setdefault((data_path, key), (field_name, field_info))
+    return index
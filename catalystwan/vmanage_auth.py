@@ -1,11 +1,13 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import logging
+from threading import Lock
 from typing import Optional
 from urllib.parse import urljoin
 
 import requests
 from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.cookies import RequestsCookieJar
 
@@ -54,10 +56,19 @@ class vManageAuth(AuthBase):
         expiration_time (int): Expiration token time in seconds.
                 Defaults to None (unlimited).
         token (str): Access token
+        session (requests.Session): session used to perform login requests,
+                when adapter is given login requests share its connection pool (eg. with main API session)
 
     """
 
-    def __init__(self, base_url: str, username: str, password: str, verify: bool = False):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify: bool = False,
+        adapter: Optional[HTTPAdapter] = None,
+    ):
         self.base_url = base_url
         self.username = username
         self.password = password
@@ -66,6 +77,11 @@ class vManageAuth(AuthBase):
         self.set_cookie = RequestsCookieJar()
         self.token: str = ""
         self.logger = logging.getLogger(__name__)
+        self.session = requests.Session()
+        self._lock = Lock()
+        if adapter is not None:
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
 
     def get_cookie(self) -> RequestsCookieJar:
         """Check whether a user is successfully authenticated.
@@ -86,13 +102,15 @@ class vManageAuth(AuthBase):
         }
         full_url = urljoin(self.base_url, "/j_security_check")
         headers = {"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT}
-        response = requests.post(
+        self.session.cookies.clear()
+        response = self.session.post(
             url=full_url,
             data=security_payload,
             verify=self.verify,
             headers=headers,
         )
-        self.logger.debug(self._auth_request_debug(response, include_reponse_text=True))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response, include_reponse_text=True))
         if response.text != "":
             raise UnauthorizedAccessError(self.username, self.password)
         return response.cookies
@@ -111,20 +129,23 @@ class vManageAuth(AuthBase):
         """
         full_url = urljoin(self.base_url, "/dataservice/client/token")
         headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT}
-        response = requests.get(
+        response = self.session.get(
             url=full_url,
             cookies=cookies,
             verify=self.verify,
             headers=headers,
         )
-        self.logger.debug(self._auth_request_debug(response))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response))
         return response.text
 
     def __call__(self, prepared_request: PreparedRequest) -> PreparedRequest:
-        if self.expiration_time is None:
-            if self.token == "":
-                self.set_cookie = self.get_cookie()
-                self.token = self.fetch_token(self.set_cookie)
+        if self.expiration_time is None and self.token == "":
+            # requests sent concurrently from multiple threads wait for single login
+            with self._lock:
+                if self.token == "":
+                    self.set_cookie = self.get_cookie()
+                    self.token = self.fetch_token(self.set_cookie)
 
         prepared_request.prepare_cookies(self.set_cookie)
         prepared_request.headers.update({"x-xsrf-token": self.token})
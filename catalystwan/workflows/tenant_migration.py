@@ -14,6 +14,7 @@ from catalystwan.endpoints.troubleshooting_tools.device_connectivity import NPin
 from catalystwan.exceptions import TenantMigrationPreconditionsError
 from catalystwan.models.tenant import TenantExport
 from catalystwan.session import ManagerSession, create_manager_session
+from catalystwan.tracing import traced
 from catalystwan.utils.personality import Personality
 from catalystwan.utils.session_type import SessionType
 
@@ -151,6 +152,11 @@ def migration_preconditions_check(
     return True
 
 
+@traced(
+    "migration_workflow",
+    lambda origin_session, target_session, workdir, tenant, *args, **kwargs: {"tenant.name": tenant.name},
+    session=lambda origin_session, *args, **kwargs: origin_session,
+)
 def migration_workflow(
     origin_session: ManagerSession,
     target_session: ManagerSession,